@@ -0,0 +1,140 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+OPEN = float("inf")
+
+
+class AdmissionIndex:
+    """
+    Static interval index over hospital stays.
+
+    Stays are half-open intervals [admitted_at, discharged_at); a stay still
+    in progress ends at infinity. Counting queries use the sorted start and
+    end times alone and take O(log n). Listing who was admitted at a time
+    walks an implicit balanced tree over the stays sorted by start, where
+    every node keeps the latest end time below it, so subtrees without an
+    active stay are skipped (O(log n + k) for k results in practice).
+    Times are kept as floats in arrays, so millions of stays stay compact.
+
+    Build a new index after admissions or discharges; it does not follow
+    later changes.
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, stays):
+        """
+        Build the index.
+
+        Args:
+            stays (iterable): (patient, admitted_at, discharged_at) tuples;
+                discharged_at is None for a stay in progress
+
+        Raises:
+            ValueError: If a stay ends before it starts
+
+        Outsource:
+        - docstrings
+        """
+        records = []
+        for patient, start, end in stays:
+            end = OPEN if end is None else end
+            if end < start:
+                raise ValueError("Stay ends before it starts.")
+            records.append((start, end, patient))
+        records.sort(key=lambda record: record[0])
+        self._starts = array("d", [record[0] for record in records])
+        self._ends = array("d", [record[1] for record in records])
+        self._patients = [record[2] for record in records]
+        self._sorted_ends = array("d", sorted(self._ends))
+        self._max_end = array("d", self._ends)
+        self._build(0, len(records))
+
+    def _build(self, low: int, high: int):
+        """
+        Store in _max_end[mid] the latest end of the stays low..high-1 and return it.
+
+        The recursion depth is log2 of the number of stays.
+
+        Outsource:
+        - docstrings
+        """
+        if low >= high:
+            return -OPEN
+        mid = (low + high) // 2
+        latest = max(self._ends[mid], self._build(low, mid), self._build(mid + 1, high))
+        self._max_end[mid] = latest
+        return latest
+
+    def __len__(self):
+        """Return the number of stays."""
+        return len(self._starts)
+
+    def census(self, at: float):
+        """
+        Count the stays in progress at a given time.
+
+        Args:
+            at (float): Time to check
+
+        Returns:
+            int: Number of stays with admitted_at <= at < discharged_at
+
+        Outsource:
+        - docstrings
+        """
+        return bisect_right(self._starts, at) - bisect_right(self._sorted_ends, at)
+
+    def occupancy(self, start: float, end: float):
+        """
+        Count the stays overlapping a time range.
+
+        Args:
+            start (float): Start of the range (inclusive)
+            end (float): End of the range (exclusive)
+
+        Returns:
+            int: Number of stays overlapping [start, end); a patient admitted twice
+                in the range counts twice
+
+        Raises:
+            ValueError: If end is not after start
+
+        Outsource:
+        - docstrings
+        """
+        if end <= start:
+            raise ValueError("Range end must be after its start.")
+        return bisect_left(self._starts, end) - bisect_right(self._sorted_ends, start)
+
+    def admitted_at(self, at: float):
+        """
+        List the patients admitted at a given time.
+
+        Args:
+            at (float): Time to check
+
+        Returns:
+            list: Patient objects with a stay covering `at`, in order of admission
+
+        Outsource:
+        - docstrings
+        """
+        starts, ends, max_end = self._starts, self._ends, self._max_end
+        found = []
+        stack = [(0, len(starts))]
+        while stack:
+            low, high = stack.pop()
+            if low >= high or starts[low] > at:
+                continue
+            mid = (low + high) // 2
+            if max_end[mid] <= at:
+                continue
+            stack.append((low, mid))
+            if starts[mid] <= at:
+                if ends[mid] > at:
+                    found.append(mid)
+                stack.append((mid + 1, high))
+        found.sort()
+        return [self._patients[index] for index in found]
@@ -0,0 +1,572 @@
+_BLOSUM62_ROWS = """
+   A  R  N  D  C  Q  E  G  H  I  L  K  M  F  P  S  T  W  Y  V  *
+A  4 -1 -2 -2  0 -1 -1  0 -2 -1 -1 -1 -1 -2 -1  1  0 -3 -2  0 -4
+R -1  5  0 -2 -3  1  0 -2  0 -3 -2  2 -1 -3 -2 -1 -1 -3 -2 -3 -4
+N -2  0  6  1 -3  0  0  0  1 -3 -3  0 -2 -3 -2  1  0 -4 -2 -3 -4
+D -2 -2  1  6 -3  0  2 -1 -1 -3 -4 -1 -3 -3 -1  0 -1 -4 -3 -3 -4
+C  0 -3 -3 -3  9 -3 -4 -3 -3 -1 -1 -3 -1 -2 -3 -1 -1 -2 -2 -1 -4
+Q -1  1  0  0 -3  5  2 -2  0 -3 -2  1  0 -3 -1  0 -1 -2 -1 -2 -4
+E -1  0  0  2 -4  2  5 -2  0 -3 -3  1 -2 -3 -1  0 -1 -3 -2 -2 -4
+G  0 -2  0 -1 -3 -2 -2  6 -2 -4 -4 -2 -3 -3 -2  0 -2 -2 -3 -3 -4
+H -2  0  1 -1 -3  0  0 -2  8 -3 -3 -1 -2 -1 -2 -1 -2 -2  2 -3 -4
+I -1 -3 -3 -3 -1 -3 -3 -4 -3  4  2 -3  1  0 -3 -2 -1 -3 -1  3 -4
+L -1 -2 -3 -4 -1 -2 -3 -4 -3  2  4 -2  2  0 -3 -2 -1 -2 -1  1 -4
+K -1  2  0 -1 -3  1  1 -2 -1 -3 -2  5 -1 -3 -1  0 -1 -3 -2 -2 -4
+M -1 -1 -2 -3 -1  0 -2 -3 -2  1  2 -1  5  0 -2 -1 -1 -1 -1  1 -4
+F -2 -3 -3 -3 -2 -3 -3 -3 -1  0  0 -3  0  6 -4 -2 -2  1  3 -1 -4
+P -1 -2 -2 -1 -3 -1 -1 -2 -2 -3 -3 -1 -2 -4  7 -1 -1 -4 -3 -2 -4
+S  1 -1  1  0 -1  0  0  0 -1 -2 -2  0 -1 -2 -1  4  1 -3 -2 -2 -4
+T  0 -1  0 -1 -1 -1 -1 -2 -2 -1 -1 -1 -1 -2 -1  1  5 -2 -2  0 -4
+W -3 -3 -4 -4 -2 -2 -3 -2 -2 -3 -2 -3 -1  1 -4 -3 -2 11  2 -3 -4
+Y -2 -2 -2 -3 -2 -1 -2 -3  2 -1 -1 -2 -1  3 -3 -2 -2  2  7 -1 -4
+V  0 -3 -3 -3 -1 -2 -2 -3 -3  3  1 -2  1 -1 -2 -2  0 -3 -1  4 -4
+* -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4  1
+"""
+
+_PAM250_ROWS = """
+   A  R  N  D  C  Q  E  G  H  I  L  K  M  F  P  S  T  W  Y  V  *
+A  2 -2  0  0 -2  0  0  1 -1 -1 -2 -1 -1 -3  1  1  1 -6 -3  0 -8
+R -2  6  0 -1 -4  1 -1 -3  2 -2 -3  3  0 -4  0  0 -1  2 -4 -2 -8
+N  0  0  2  2 -4  1  1  0  2 -2 -3  1 -2 -3  0  1  0 -4 -2 -2 -8
+D  0 -1  2  4 -5  2  3  1  1 -2 -4  0 -3 -6 -1  0  0 -7 -4 -2 -8
+C -2 -4 -4 -5 12 -5 -5 -3 -3 -2 -6 -5 -5 -4 -3  0 -2 -8  0 -2 -8
+Q  0  1  1  2 -5  4  2 -1  3 -2 -2  1 -1 -5  0 -1 -1 -5 -4 -2 -8
+E  0 -1  1  3 -5  2  4  0  1 -2 -3  0 -2 -5 -1  0  0 -7 -4 -2 -8
+G  1 -3  0  1 -3 -1  0  5 -2 -3 -4 -2 -3 -5  0  1  0 -7 -5 -1 -8
+H -1  2  2  1 -3  3  1 -2  6 -2 -2  0 -2 -2  0 -1 -1 -3  0 -2 -8
+I -1 -2 -2 -2 -2 -2 -2 -3 -2  5  2 -2  2  1 -2 -1  0 -5 -1  4 -8
+L -2 -3 -3 -4 -6 -2 -3 -4 -2  2  6 -3  4  2 -3 -3 -2 -2 -1  2 -8
+K -1  3  1  0 -5  1  0 -2  0 -2 -3  5  0 -5 -1  0  0 -3 -4 -2 -8
+M -1  0 -2 -3 -5 -1 -2 -3 -2  2  4  0  6  0 -2 -2 -1 -4 -2  2 -8
+F -3 -4 -3 -6 -4 -5 -5 -5 -2  1  2 -5  0  9 -5 -3 -3  0  7 -1 -8
+P  1  0  0 -1 -3  0 -1  0  0 -2 -3 -1 -2 -5  6  1  0 -6 -5 -1 -8
+S  1  0  1  0  0 -1  0  1 -1 -1 -3  0 -2 -3  1  2  1 -2 -3 -1 -8
+T  1 -1  0  0 -2 -1  0  0 -1  0 -2  0 -1 -3  0  1  3 -5 -3  0 -8
+W -6  2 -4 -7 -8 -5 -7 -7 -3 -5 -2 -3 -4  0 -6 -2 -5 17  0 -6 -8
+Y -3 -4 -2 -4  0 -4 -4 -5  0 -1 -1 -4 -2  7 -5 -3 -3  0 10 -2 -8
+V  0 -2 -2 -2 -2 -2 -2 -1 -2  4  2 -2  2 -1 -1 -1  0 -6 -2  4 -8
+* -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8  1
+"""
+
+# Traceback codes, packed into one byte per matrix cell:
+# bits 0-1: where the best score H came from, bit 2: E extends a gap, bit 3: F extends a gap.
+_FROM_DIAGONAL, _FROM_E, _FROM_F, _FROM_START = 0, 1, 2, 3
+_E_EXTENDS, _F_EXTENDS = 4, 8
+_NEGATIVE_INFINITY = float("-inf")
+# Integer stand-in for -inf in the NumPy rows; far below any reachable score.
+_NUMPY_FLOOR = -(1 << 40)
+# Rows narrower than this are scored in pure Python, where NumPy's per-call overhead would dominate.
+_NUMPY_MIN_COLUMNS = 64
+# Sub-problems up to this many cells are traced back from a full one-byte-per-cell matrix.
+_TRACEBACK_CELLS = 1 << 16
+
+
+def _parse_matrix(text: str):
+    """
+    Parse a whitespace-separated substitution matrix into nested dicts.
+
+    Outsource:
+    - docstrings
+    """
+    lines = text.strip().splitlines()
+    columns = lines[0].split()
+    matrix = {}
+    for line in lines[1:]:
+        row, *scores = line.split()
+        matrix[row] = {column: int(score) for column, score in zip(columns, scores)}
+    return matrix
+
+
+BLOSUM62 = _parse_matrix(_BLOSUM62_ROWS)
+PAM250 = _parse_matrix(_PAM250_ROWS)
+PROTEIN_MATRICES = {"BLOSUM62": BLOSUM62, "PAM250": PAM250}
+
+
+def nucleotide_matrix(alphabet: str = "ACGT", match: int = 5, mismatch: int = -4):
+    """
+    Build a simple match/mismatch substitution matrix.
+
+    Args:
+        alphabet (str): Symbols of the matrix (default: DNA)
+        match (int): Score of identical symbols
+        mismatch (int): Score of different symbols
+
+    Returns:
+        dict: Nested dict matrix usable by align()
+
+    Outsource:
+    - docstrings
+    """
+    return {a: {b: match if a == b else mismatch for b in alphabet} for a in alphabet}
+
+
+DNA_MATRIX = nucleotide_matrix("ACGT")
+RNA_MATRIX = nucleotide_matrix("ACGU")
+
+
+class Alignment:
+    """
+    Result of a pairwise alignment.
+
+    Attributes:
+        score (int): Alignment score
+        aligned_a (str): First sequence with '-' for gaps
+        aligned_b (str): Second sequence with '-' for gaps
+        start_a (int): 0-based start of the aligned region in the first sequence
+        end_a (int): 0-based end (exclusive) of the aligned region in the first sequence
+        start_b (int): 0-based start of the aligned region in the second sequence
+        end_b (int): 0-based end (exclusive) of the aligned region in the second sequence
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, score, aligned_a, aligned_b, start_a, end_a, start_b, end_b):
+        """Initialize an Alignment with its score, gapped strings and coordinates."""
+        self.score = score
+        self.aligned_a = aligned_a
+        self.aligned_b = aligned_b
+        self.start_a = start_a
+        self.end_a = end_a
+        self.start_b = start_b
+        self.end_b = end_b
+
+    def identity(self):
+        """
+        Return the fraction of alignment columns with identical symbols.
+
+        Returns:
+            float: Identity between 0 and 1 (0.0 for an empty alignment)
+
+        Outsource:
+        - docstrings
+        """
+        if not self.aligned_a:
+            return 0.0
+        same = sum(1 for x, y in zip(self.aligned_a, self.aligned_b) if x == y and x != "-")
+        return same / len(self.aligned_a)
+
+    def __str__(self):
+        """Return the two aligned rows with a match line between them."""
+        middle = "".join("|" if x == y and x != "-" else " " for x, y in zip(self.aligned_a, self.aligned_b))
+        return f"{self.aligned_a}\n{middle}\n{self.aligned_b}\nScore: {self.score}"
+
+
+def _profile(a: str, b: str, matrix):
+    """
+    Precompute, for each distinct symbol of `a`, its scores against every symbol of `b`.
+
+    This query profile turns the inner DP loop's nested dict lookups into a
+    single list index.
+
+    Raises:
+        ValueError: If a symbol is missing from the substitution matrix
+
+    Outsource:
+    - docstrings
+    """
+    profile = {}
+    for symbol in set(a):
+        row = matrix.get(symbol)
+        try:
+            profile[symbol] = [row[other] for other in b]
+        except (KeyError, TypeError):
+            raise ValueError(f"Symbol missing from substitution matrix: {symbol}") from None
+    return profile
+
+
+def _check_mode(mode: str):
+    """Raise ValueError unless mode is "global" or "local"."""
+    if mode not in ("global", "local"):
+        raise ValueError('Alignment mode must be "global" or "local".')
+
+
+def _check_gaps(gap_open: int, gap_extend: int):
+    """
+    Raise ValueError unless 0 <= gap_extend <= gap_open.
+
+    With gap_extend > gap_open, two adjacent one-position gaps would score
+    better than one gap of length two, so the recurrence's score would not
+    match the score of the alignment it returns.
+    """
+    if not 0 <= gap_extend <= gap_open:
+        raise ValueError("Gap penalties must satisfy 0 <= gap_extend <= gap_open.")
+
+
+def _numpy():
+    """Return the numpy module, or None when NumPy is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _python_rows(a: str, profile, cols: int, gap_open: int, gap_extend: int, local: bool, start_open: int):
+    """
+    Yield the (H, F) score rows of a Gotoh DP, one per prefix of `a`, in pure Python.
+
+    H[j] is the best score of a[:i] against b[:j] and F[j] the best one ending
+    with a gap in b. A gap in b at the start of `a` costs start_open for its
+    first position. The same two lists are updated in place and yielded again
+    for every row.
+
+    Outsource:
+    - docstrings
+    """
+    if local:
+        h_row = [0] * (cols + 1)
+    else:
+        h_row = [0] + [-(gap_open + (j - 1) * gap_extend) for j in range(1, cols + 1)]
+    f_row = [_NEGATIVE_INFINITY] * (cols + 1)
+    yield h_row, f_row
+    for i, symbol in enumerate(a, 1):
+        scores = profile[symbol]
+        diagonal = h_row[0]
+        if local:
+            h = 0
+        else:
+            h = f_row[0] = -(start_open + (i - 1) * gap_extend)
+        h_row[0] = h
+        e = _NEGATIVE_INFINITY
+        for j in range(1, cols + 1):
+            e -= gap_extend
+            if h - gap_open > e:
+                e = h - gap_open
+            above = h_row[j]
+            f = f_row[j] - gap_extend
+            if above - gap_open > f:
+                f = above - gap_open
+            f_row[j] = f
+            h = diagonal + scores[j - 1]
+            if e > h:
+                h = e
+            if f > h:
+                h = f
+            if local and h < 0:
+                h = 0
+            diagonal = above
+            h_row[j] = h
+        yield h_row, f_row
+
+
+def _numpy_rows(numpy, a: str, profile, cols: int, gap_open: int, gap_extend: int, local: bool, start_open: int):
+    """
+    Yield the same rows as _python_rows, each computed with whole-row NumPy operations.
+
+    The diagonal and vertical moves are elementwise. The horizontal gap score
+    E[j] = max over k < j of T[k] - gap_open - (j - 1 - k) * gap_extend, where T
+    is the row without horizontal moves, is a running maximum of T[k] + k * gap_extend.
+    This needs gap_extend <= gap_open, so that extending a gap never loses to
+    closing and reopening it. A fresh pair of arrays is yielded for every row.
+
+    Outsource:
+    - docstrings
+    """
+    scores = {symbol: numpy.array(row, dtype=numpy.int64) for symbol, row in profile.items()}
+    ramp = numpy.arange(cols + 1, dtype=numpy.int64) * gap_extend
+    gap_ramp = ramp[:-1] + gap_open
+    if local:
+        h_row = numpy.zeros(cols + 1, dtype=numpy.int64)
+    else:
+        h_row = -(ramp + (gap_open - gap_extend))
+        h_row[0] = 0
+    f_row = numpy.full(cols + 1, _NUMPY_FLOOR, dtype=numpy.int64)
+    yield h_row, f_row
+    for i, symbol in enumerate(a, 1):
+        f_row = numpy.maximum(f_row - gap_extend, h_row - gap_open)
+        row = numpy.empty_like(h_row)
+        numpy.add(h_row[:-1], scores[symbol], out=row[1:])
+        numpy.maximum(row[1:], f_row[1:], out=row[1:])
+        if local:
+            row[0] = 0
+            f_row[0] = _NUMPY_FLOOR
+            numpy.maximum(row, 0, out=row)
+        else:
+            row[0] = f_row[0] = -(start_open + (i - 1) * gap_extend)
+        running = numpy.maximum.accumulate(row + ramp)
+        numpy.maximum(row[1:], running[:-1] - gap_ramp, out=row[1:])
+        h_row = row
+        yield h_row, f_row
+
+
+def _rows(numpy, a: str, profile, cols: int, gap_open: int, gap_extend: int, local: bool = False, start_open=None):
+    """
+    Yield the (H, F) score rows of `a` against a sequence of length cols.
+
+    Uses the NumPy rows when numpy is given and rows are wide enough to
+    benefit, the pure-Python rows otherwise. profile maps every symbol of
+    `a` to its list of scores against the other sequence.
+
+    Outsource:
+    - docstrings
+    """
+    if start_open is None:
+        start_open = gap_open
+    if numpy is not None and cols >= _NUMPY_MIN_COLUMNS:
+        return _numpy_rows(numpy, a, profile, cols, gap_open, gap_extend, local, start_open)
+    return _python_rows(a, profile, cols, gap_open, gap_extend, local, start_open)
+
+
+def _row_max(row):
+    """Return (value, index) of the first maximum of a score row."""
+    if isinstance(row, list):
+        value = max(row)
+        return value, row.index(value)
+    index = int(row.argmax())
+    return int(row[index]), index
+
+
+def _row_find(row, value):
+    """Return the index of the first cell of a score row equal to value, or -1."""
+    if isinstance(row, list):
+        return row.index(value) if value in row else -1
+    hits = (row == value).nonzero()[0]
+    return int(hits[0]) if len(hits) else -1
+
+
+def align_score(a: str, b: str, matrix, mode: str = "global", gap_open: int = 10, gap_extend: int = 1):
+    """
+    Compute only the optimal alignment score, in linear memory.
+
+    Only two rows of each DP matrix are kept, so memory is O(len(b)).
+    Rows are vectorized with NumPy when it is installed.
+    Useful for ranking many pairs before aligning the best ones.
+
+    Args:
+        a (str): First sequence
+        b (str): Second sequence
+        matrix (dict): Nested dict substitution matrix
+        mode (str): "global" (Needleman-Wunsch) or "local" (Smith-Waterman)
+        gap_open (int): Penalty of the first position of a gap
+        gap_extend (int): Penalty of every further position of a gap
+
+    Returns:
+        int: Optimal alignment score
+
+    Raises:
+        ValueError: If mode is unknown, a symbol is missing from the matrix
+            or the gap penalties do not satisfy 0 <= gap_extend <= gap_open
+
+    Outsource:
+    - docstrings
+    """
+    _check_mode(mode)
+    _check_gaps(gap_open, gap_extend)
+    profile = _profile(a, b, matrix)
+    rows = _rows(_numpy(), a, profile, len(b), gap_open, gap_extend, mode == "local")
+    if mode == "local":
+        return max(_row_max(h_row)[0] for h_row, _ in rows)
+    for h_row, _ in rows:
+        pass
+    return int(h_row[len(b)])
+
+
+def _traceback(a: str, b: str, profile, gap_open: int, gap_extend: int, start_open: int, end_open: int):
+    """
+    Globally align a and b from a full traceback matrix of one byte per cell.
+
+    A gap in b at the start (end) of the alignment costs start_open (end_open)
+    for its first position instead of gap_open.
+
+    Returns:
+        tuple: (score, aligned a, aligned b)
+
+    Outsource:
+    - docstrings
+    """
+    rows, cols = len(a), len(b)
+    width = cols + 1
+    trace = bytearray((rows + 1) * width)
+    h_row = [0] + [-(gap_open + (j - 1) * gap_extend) for j in range(1, width)]
+    trace[0] = _FROM_START
+    for j in range(1, width):
+        trace[j] = _FROM_E | (_E_EXTENDS if j > 1 else 0)
+    f_row = [_NEGATIVE_INFINITY] * width
+
+    for i, symbol in enumerate(a, 1):
+        scores = profile[symbol]
+        base = i * width
+        diagonal = h_row[0]
+        h = -(start_open + (i - 1) * gap_extend)
+        trace[base] = _FROM_F | (_F_EXTENDS if i > 1 else 0)
+        h_row[0] = h
+        e = _NEGATIVE_INFINITY
+        for j in range(1, width):
+            code = 0
+            e_open = h - gap_open
+            e = e - gap_extend
+            if e > e_open:
+                code |= _E_EXTENDS
+            else:
+                e = e_open
+            f_open = h_row[j] - gap_open
+            f = f_row[j] - gap_extend
+            if f > f_open:
+                code |= _F_EXTENDS
+            else:
+                f = f_open
+            f_row[j] = f
+            h = diagonal + scores[j - 1]
+            if e > h:
+                h = e
+                code |= _FROM_E
+            if f > h:
+                h = f
+                code = (code & ~3) | _FROM_F
+            diagonal = h_row[j]
+            h_row[j] = h
+            trace[base + j] = code
+
+    score, state = h_row[cols], _FROM_DIAGONAL
+    if rows and cols and f_row[cols] + gap_open - end_open > score:
+        score, state = f_row[cols] + gap_open - end_open, _FROM_F
+    i, j = rows, cols
+    row_a, row_b = [], []
+    while i > 0 or j > 0:
+        code = trace[i * width + j]
+        if state == _FROM_DIAGONAL:
+            source = code & 3
+            if source != _FROM_DIAGONAL:
+                state = source
+                continue
+            i -= 1
+            j -= 1
+            row_a.append(a[i])
+            row_b.append(b[j])
+        elif state == _FROM_E:
+            j -= 1
+            row_a.append("-")
+            row_b.append(b[j])
+            if not code & _E_EXTENDS:
+                state = _FROM_DIAGONAL
+        else:
+            i -= 1
+            row_a.append(a[i])
+            row_b.append("-")
+            if not code & _F_EXTENDS:
+                state = _FROM_DIAGONAL
+    return score, "".join(reversed(row_a)), "".join(reversed(row_b))
+
+
+def _last_row(numpy, a: str, profile, cols: int, gap_open: int, gap_extend: int, start_open: int):
+    """Return the last global (H, F) rows of `a` against cols columns, as lists."""
+    for h_row, f_row in _rows(numpy, a, profile, cols, gap_open, gap_extend, False, start_open):
+        pass
+    if isinstance(h_row, list):
+        return h_row, f_row
+    return h_row.tolist(), f_row.tolist()
+
+
+def _hirschberg(numpy, a: str, b: str, profile, gap_open: int, gap_extend: int, start_open: int, end_open: int,
+                pieces_a, pieces_b):
+    """
+    Globally align a and b in linear memory (Myers-Miller divide and conquer).
+
+    Scores the top half of `a` forward and the bottom half backward, splits
+    b where the two halves meet best - either between two columns or inside
+    a gap in b crossing the middle row - and recurses on both sides. Small
+    sub-problems are traced back from a full matrix. The aligned pieces are
+    appended to pieces_a and pieces_b in order.
+
+    Returns:
+        int: Score of the alignment of a and b
+
+    Outsource:
+    - docstrings
+    """
+    rows, cols = len(a), len(b)
+    if rows <= 1 or cols == 0 or rows * cols <= _TRACEBACK_CELLS:
+        score, aligned_a, aligned_b = _traceback(a, b, profile, gap_open, gap_extend, start_open, end_open)
+        pieces_a.append(aligned_a)
+        pieces_b.append(aligned_b)
+        return score
+    middle = rows // 2
+    top, bottom = a[:middle], a[middle:][::-1]
+    h_top, f_top = _last_row(numpy, top, profile, cols, gap_open, gap_extend, start_open)
+    backward = {symbol: scores[::-1] for symbol, scores in profile.items()}
+    h_bottom, f_bottom = _last_row(numpy, bottom, backward, cols, gap_open, gap_extend, end_open)
+
+    # A gap crossing the middle row is scored by both halves; count its opening once.
+    merge = gap_open - gap_extend
+    best, split, crossing = _NEGATIVE_INFINITY, 0, False
+    for j in range(cols + 1):
+        through = h_top[j] + h_bottom[cols - j]
+        if through > best:
+            best, split, crossing = through, j, False
+        gap = f_top[j] + f_bottom[cols - j] + merge
+        if gap > best:
+            best, split, crossing = gap, j, True
+
+    left = {symbol: scores[:split] for symbol, scores in profile.items()}
+    right = {symbol: scores[split:] for symbol, scores in profile.items()}
+    if crossing:
+        _hirschberg(numpy, a[:middle - 1], b[:split], left, gap_open, gap_extend, start_open, gap_extend,
+                    pieces_a, pieces_b)
+        pieces_a.append(a[middle - 1:middle + 1])
+        pieces_b.append("--")
+        _hirschberg(numpy, a[middle + 1:], b[split:], right, gap_open, gap_extend, gap_extend, end_open,
+                    pieces_a, pieces_b)
+    else:
+        _hirschberg(numpy, a[:middle], b[:split], left, gap_open, gap_extend, start_open, gap_open,
+                    pieces_a, pieces_b)
+        _hirschberg(numpy, a[middle:], b[split:], right, gap_open, gap_extend, gap_open, end_open,
+                    pieces_a, pieces_b)
+    return best
+
+
+def align(a: str, b: str, matrix, mode: str = "global", gap_open: int = 10, gap_extend: int = 1):
+    """
+    Align two sequences with affine gap penalties (Gotoh).
+
+    Global mode is Needleman-Wunsch, local mode is Smith-Waterman. A gap of
+    length L costs gap_open + (L - 1) * gap_extend. The traceback uses
+    Hirschberg's divide and conquer, so memory is linear in the sequence
+    lengths; local mode first locates the best region with two score-only
+    passes. Rows are vectorized with NumPy when it is installed.
+
+    Args:
+        a (str): First sequence
+        b (str): Second sequence
+        matrix (dict): Nested dict substitution matrix (e.g. BLOSUM62 or PAM250)
+        mode (str): "global" or "local"
+        gap_open (int): Penalty of the first position of a gap
+        gap_extend (int): Penalty of every further position of a gap
+
+    Returns:
+        Alignment: Optimal alignment with score and coordinates
+
+    Raises:
+        ValueError: If mode is unknown, a symbol is missing from the matrix
+            or the gap penalties do not satisfy 0 <= gap_extend <= gap_open
+
+    Outsource:
+    - docstrings
+    """
+    _check_mode(mode)
+    _check_gaps(gap_open, gap_extend)
+    profile = _profile(a, b, matrix)
+    numpy = _numpy()
+    start_a, end_a, start_b, end_b = 0, len(a), 0, len(b)
+    if mode == "local":
+        best = 0
+        rows = _rows(numpy, a, profile, len(b), gap_open, gap_extend, local=True)
+        for i, (h_row, _) in enumerate(rows):
+            value, j = _row_max(h_row)
+            if value > best:
+                best, end_a, end_b = value, i, j
+        if best == 0:
+            return Alignment(0, "", "", 0, 0, 0, 0)
+        # The best region ends at (end_a, end_b); score prefixes backward from there to find where it starts.
+        prefix = a[:end_a][::-1]
+        backward = {symbol: profile[symbol][:end_b][::-1] for symbol in set(prefix)}
+        for i, (h_row, _) in enumerate(_rows(numpy, prefix, backward, end_b, gap_open, gap_extend)):
+            j = _row_find(h_row, best)
+            if j >= 0:
+                start_a, start_b = end_a - i, end_b - j
+                break
+        a, b = a[start_a:end_a], b[start_b:end_b]
+        profile = {symbol: profile[symbol][start_b:end_b] for symbol in set(a)}
+    pieces_a, pieces_b = [], []
+    score = _hirschberg(numpy, a, b, profile, gap_open, gap_extend, gap_open, gap_open, pieces_a, pieces_b)
+    return Alignment(score, "".join(pieces_a), "".join(pieces_b), start_a, end_a, start_b, end_b)
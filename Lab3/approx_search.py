@@ -0,0 +1,148 @@
+IUPAC_DNA = {
+    "A": "A", "C": "C", "G": "G", "T": "T",
+    "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC",
+    "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG", "N": "ACGT",
+}
+IUPAC_RNA = {code: bases.replace("T", "U") for code, bases in IUPAC_DNA.items() if code != "T"}
+IUPAC_RNA["U"] = "U"
+PROTEIN_WILDCARDS = {"X": "ACDEFGHIKLMNPQRSTVWY"}
+
+
+def pattern_masks(pattern: str, degenerate=None):
+    """
+    Build the per-symbol match bitmasks of a pattern.
+
+    Bit i of the mask of symbol c is set when pattern position i accepts c.
+    Degenerate pattern symbols (e.g. IUPAC codes) set their bit in the mask
+    of every symbol they stand for.
+
+    Args:
+        pattern (str): Uppercase pattern
+        degenerate (dict): Optional mapping of pattern symbol to the symbols it matches
+
+    Returns:
+        dict: Mapping of text symbol to bitmask
+
+    Outsource:
+    - docstrings
+    """
+    degenerate = degenerate or {}
+    masks = {}
+    for i, symbol in enumerate(pattern):
+        for matched in degenerate.get(symbol, symbol):
+            masks[matched] = masks.get(matched, 0) | (1 << i)
+    return masks
+
+
+def _check_arguments(pattern: str, max_errors: int):
+    """
+    Validate the pattern and error budget shared by both searches.
+
+    Raises:
+        ValueError: If the pattern is empty or max_errors is outside [0, len(pattern))
+
+    Outsource:
+    - docstrings
+    """
+    if not pattern:
+        raise ValueError("Motif must not be empty.")
+    if not (0 <= max_errors < len(pattern)):
+        raise ValueError("Number of errors must be between 0 and the motif length - 1.")
+
+
+def hamming_search(text: str, pattern: str, max_mismatches: int, degenerate=None):
+    """
+    Find all windows of `text` within `max_mismatches` substitutions of `pattern`.
+
+    Bit-parallel Shift-And with one state word per allowed mismatch
+    (Wu-Manber), so each text symbol costs O(max_mismatches) integer
+    operations regardless of the pattern length.
+
+    Args:
+        text (str): Uppercase text to search
+        pattern (str): Uppercase pattern, may contain degenerate symbols
+        max_mismatches (int): Maximum number of substitutions
+        degenerate (dict): Optional mapping of pattern symbol to the symbols it matches
+
+    Returns:
+        list: (start, mismatches) tuples, one per matching window, by start position
+
+    Raises:
+        ValueError: If the pattern is empty or max_mismatches is out of range
+
+    Outsource:
+    - docstrings
+    """
+    _check_arguments(pattern, max_mismatches)
+    masks = pattern_masks(pattern, degenerate)
+    length = len(pattern)
+    high_bit = 1 << (length - 1)
+    states = [0] * (max_mismatches + 1)
+    hits = []
+    for i, symbol in enumerate(text):
+        eq = masks.get(symbol, 0)
+        previous = states[0]
+        states[0] = ((previous << 1) | 1) & eq
+        for j in range(1, max_mismatches + 1):
+            current = states[j]
+            states[j] = (((current << 1) | 1) & eq) | ((previous << 1) | 1)
+            previous = current
+        if i + 1 >= length:
+            for j, state in enumerate(states):
+                if state & high_bit:
+                    hits.append((i + 1 - length, j))
+                    break
+    return hits
+
+
+def myers_search(text: str, pattern: str, max_distance: int, degenerate=None):
+    """
+    Find all end positions where `pattern` matches with at most `max_distance` edits.
+
+    Myers' bit-vector algorithm: the column of the edit-distance matrix is
+    kept as vertical +1/-1 delta bit-vectors, so the whole column is updated
+    with a constant number of integer operations per text symbol. Edits are
+    substitutions, insertions and deletions.
+
+    Args:
+        text (str): Uppercase text to search
+        pattern (str): Uppercase pattern, may contain degenerate symbols
+        max_distance (int): Maximum edit distance
+        degenerate (dict): Optional mapping of pattern symbol to the symbols it matches
+
+    Returns:
+        list: (end, distance) tuples, where end is the 0-based position just
+            after the last matched text symbol
+
+    Raises:
+        ValueError: If the pattern is empty or max_distance is out of range
+
+    Outsource:
+    - docstrings
+    """
+    _check_arguments(pattern, max_distance)
+    masks = pattern_masks(pattern, degenerate)
+    length = len(pattern)
+    full = (1 << length) - 1
+    high_bit = 1 << (length - 1)
+    plus = full
+    minus = 0
+    score = length
+    hits = []
+    for i, symbol in enumerate(text):
+        eq = masks.get(symbol, 0)
+        xv = eq | minus
+        xh = ((((eq & plus) + plus) & full) ^ plus) | eq
+        horizontal_plus = minus | (~(xh | plus) & full)
+        horizontal_minus = plus & xh
+        if horizontal_plus & high_bit:
+            score += 1
+        elif horizontal_minus & high_bit:
+            score -= 1
+        horizontal_plus = (horizontal_plus << 1) & full
+        horizontal_minus = (horizontal_minus << 1) & full
+        plus = horizontal_minus | (~(xv | horizontal_plus) & full)
+        minus = horizontal_plus & xv
+        if score <= max_distance:
+            hits.append((i + 1, score))
+    return hits
@@ -0,0 +1,250 @@
+from instrument import instrumented
+from storage import resolve_backend
+
+
+class BaseSequence:
+    """
+    Common base of DNASequence, RNASequence and ProteinSequence.
+
+    Holds the identifier and a storage backend (see storage.py) for the
+    sequence characters, and implements validation, length, FASTA output,
+    mutation and exact motif search once for all sequence types. The
+    `data` attribute stays a str whichever backend is used.
+
+    Subclasses set:
+        valid_chars (set): Allowed characters
+        packing_alphabet (str): Four-letter alphabet for packed storage, None if not packable
+        invalid_value_message (str): ValueError message for a bad mutate() value
+        position_message (str): IndexError message for a bad mutate() position
+
+    Attributes:
+        identifier (str): Unique identifier for the sequence
+        data (str): The sequence data in uppercase
+        backend (str): Name of the storage backend
+
+    Outsource:
+    - docstrings
+    """
+    valid_chars = set()
+    packing_alphabet = None
+    invalid_value_message = "Invalid value."
+    position_message = "Position out of range."
+    # Mutation counter: bumped by every change of the data, so caches built
+    # from the data can tell whether they are still current.
+    _version = 0
+
+    @instrumented("{cls}.construct")
+    def __init__(self, identifier: str, data: str, backend=None):
+        """
+        Initialize a sequence.
+
+        Args:
+            identifier (str): Unique identifier for the sequence
+            data (str): Sequence string (case-insensitive, will be converted to uppercase)
+            backend: Storage backend name ("str", "bytearray", "packed", "numpy", "mmap"),
+                storage class, or None for the global default
+
+        Raises:
+            ValueError: If data contains characters outside valid_chars, or the backend
+                is unknown or cannot hold this sequence type
+
+        Outsource:
+        - docstrings
+        """
+        self.identifier = identifier
+        data = data.upper()
+        invalid_chars = set(data) - self.valid_chars
+        if invalid_chars:
+            raise ValueError(self._invalid_data_message(invalid_chars))
+        self._storage = resolve_backend(backend)(data, self.packing_alphabet)
+        self._clear_caches()
+
+    @classmethod
+    def _invalid_data_message(cls, invalid_chars):
+        """Return the ValueError message for data containing `invalid_chars`."""
+        return f"Invalid sequence — contains: {invalid_chars}"
+
+    @classmethod
+    def _from_valid(cls, identifier: str, data: str, backend=None):
+        """
+        Create a sequence from data that is already known to be valid.
+
+        Used for derived sequences (complements, transcripts, translations)
+        whose data comes out of a validated sequence, so the per-character
+        check in __init__ would only repeat work.
+
+        Args:
+            identifier (str): Unique identifier for the sequence
+            data (str): Uppercase, already validated sequence string
+            backend: Storage backend, None for the global default
+
+        Returns:
+            New sequence object of class `cls`
+
+        Outsource:
+        - docstrings
+        """
+        seq = cls.__new__(cls)
+        seq.identifier = identifier
+        seq._storage = resolve_backend(backend)(data, cls.packing_alphabet)
+        seq._clear_caches()
+        return seq
+
+    def _clear_caches(self):
+        """Drop data-derived caches; called on creation and after mutation."""
+        self._motif_search = None
+
+    @property
+    def data(self):
+        """The sequence data as an uppercase str."""
+        return self._storage.text()
+
+    @data.setter
+    def data(self, value: str):
+        """Replace the whole data (not validated), keeping the storage backend."""
+        self._storage = type(self._storage)(value, self.packing_alphabet)
+        self._version += 1
+        self._clear_caches()
+
+    @property
+    def backend(self):
+        """Name of the storage backend."""
+        return self._storage.name
+
+    def __len__(self):
+        """
+        Return the length of the sequence.
+
+        Returns:
+            int: Number of nucleotides or amino acids in the sequence
+
+        Outsource:
+        - docstrings
+        """
+        return len(self._storage)
+
+    def __getitem__(self, key):
+        """
+        Return one character or a slice of the sequence as a str.
+
+        Contiguous slices decode only the requested region of the storage.
+
+        Raises:
+            IndexError: If an integer index is out of range
+
+        Outsource:
+        - docstrings
+        """
+        length = len(self._storage)
+        if isinstance(key, slice):
+            start, stop, step = key.indices(length)
+            if step == 1:
+                return self._storage.text(start, max(start, stop))
+            return self._storage.text()[key]
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError(self.position_message)
+        return self._storage.text(key, key + 1)
+
+    def __str__(self):
+        """
+        Return a formatted string representation of the sequence.
+
+        Returns:
+            str: Sequence in FASTA format (identifier on first line, sequence on second line)
+
+        Outsource:
+        - docstrings
+        """
+        return f">{self.identifier}\n{self.data}"
+
+    @instrumented("{cls}.mutate")
+    def mutate(self, position: int, value: str):
+        """
+        Replace the character at a specific position.
+
+        Args:
+            position (int): 0-based index of the character to replace
+            value (str): New character (case-insensitive)
+
+        Raises:
+            ValueError: If value is not in valid_chars
+            IndexError: If position is out of range
+
+        Outsource:
+        - docstrings
+        """
+        if value.upper() not in self.valid_chars:
+            raise ValueError(self.invalid_value_message)
+        if not (0 <= position < len(self._storage)):
+            raise IndexError(self.position_message)
+        self._storage.set(position, value.upper())
+        self._version += 1
+        self._clear_caches()
+
+    @instrumented("{cls}.find_motif")
+    def find_motif(self, motif: str):
+        """
+        Find all occurrences of a motif within the sequence.
+
+        Args:
+            motif (str): Pattern to search for (case-insensitive)
+
+        Returns:
+            list: List of 0-based positions where the motif starts, empty list if not found
+
+        Outsource:
+        - docstrings
+        """
+        return self._motif_positions(motif.upper())
+
+    @instrumented("{cls}.find_motifs")
+    def find_motifs(self, motifs):
+        """
+        Find all occurrences of several motifs at once.
+
+        Many motifs on a long sequence are found in one pass of an
+        Aho-Corasick automaton instead of one scan per motif.
+
+        Args:
+            motifs (iterable): Patterns to search for (case-insensitive)
+
+        Returns:
+            dict: Mapping of each motif, as given, to its list of 0-based start positions
+
+        Outsource:
+        - docstrings
+        """
+        motifs = list(motifs)
+        found = self._motif_searcher().positions_many(self.data, [motif.upper() for motif in motifs],
+                                                      type(self).__name__)
+        return {motif: found[motif.upper()] for motif in motifs}
+
+    def _motif_searcher(self):
+        """
+        Return the MotifSearcher of the current data, starting a new one after a mutation.
+
+        Outsource:
+        - docstrings
+        """
+        searcher = self._motif_search
+        if searcher is None or searcher.version != self._version:
+            from motif_search import MotifSearcher
+            searcher = self._motif_search = MotifSearcher(len(self.valid_chars), self._version)
+        return searcher
+
+    def _motif_positions(self, motif: str, data: str = None):
+        """
+        Return the start positions of an uppercase motif.
+
+        The search strategy (str.find scan, k-mer index or automaton) is
+        chosen per query by motif_search.MotifSearcher. Callers searching
+        several motifs pass the data they already read as `data`.
+
+        Outsource:
+        - docstrings
+        """
+        if data is None:
+            data = self.data
+        return self._motif_searcher().positions(data, motif, type(self).__name__)
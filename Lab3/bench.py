@@ -0,0 +1,354 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import timeit
+
+from ex1 import Solution
+from ex2 import Patient
+from ex22 import Hospital
+from ex31 import DNASequence
+from ex32 import CODON_TABLE, RNASequence
+from product_cache import default_cache
+
+# Sequence length (bases) and hospital size (patients, also used as the
+# number of solutions mixed) per scale.
+SCALES = {
+    "tiny": (1_000, 1_000),
+    "small": (100_000, 10_000),
+    "medium": (1_000_000, 100_000),
+    "large": (10_000_000, 1_000_000),
+    "huge": (100_000_000, 10_000_000),
+}
+DEFAULT_THRESHOLD = 0.2
+
+# Import statements timed by the startup benchmark, and the import-time budget.
+STARTUP_STATEMENTS = {
+    "package": "import sequences",
+    "dna": "from sequences import DNASequence",
+    "core_classes": "from sequences import DNASequence, RNASequence, ProteinSequence",
+}
+STARTUP_BUDGET = 0.005
+
+
+def random_dna(length: int, seed: int = 0):
+    """
+    Generate a reproducible random DNA string.
+
+    Args:
+        length (int): Number of bases
+        seed (int): Random seed
+
+    Returns:
+        str: Random sequence over A, C, G, T
+
+    Outsource:
+    - docstrings
+    """
+    rng = random.Random(seed)
+    return "".join(rng.choices("ACGT", k=length))
+
+
+def random_orf(length: int, seed: int = 0):
+    """
+    Generate a reproducible RNA open reading frame that translates without stop or unknown codons.
+
+    Args:
+        length (int): Number of bases, rounded down to whole codons
+        seed (int): Random seed
+
+    Returns:
+        str: "AUG" followed by random sense codons from CODON_TABLE
+
+    Outsource:
+    - docstrings
+    """
+    rng = random.Random(seed)
+    sense = sorted(codon for codon, amino_acid in CODON_TABLE.items() if amino_acid != '*')
+    return "AUG" + "".join(rng.choices(sense, k=max(length // 3 - 1, 0)))
+
+
+def random_patients(count: int, seed: int = 0):
+    """
+    Generate reproducible synthetic Patient objects with ids 0, 1, ...
+
+    Outsource:
+    - docstrings
+    """
+    rng = random.Random(seed)
+    diagnoses = ["Asthma", "Hypertension", "Type 1 Diabetes", "Type 2 Diabetes", "Cold"]
+    return [
+        Patient(f"Patient {i}", f"{rng.randint(1930, 2020)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                i, rng.choice(diagnoses), admitted=rng.random() < 0.5)
+        for i in range(count)
+    ]
+
+
+def _benchmarks(bases: int, patients: int):
+    """
+    Build the benchmark table for one scale.
+
+    Returns:
+        dict: Mapping of benchmark name to (setup, run); run(state) is the timed part
+
+    Outsource:
+    - docstrings
+    """
+    def dna_setup():
+        return DNASequence("bench", random_dna(bases))
+
+    def rna_setup():
+        return RNASequence("bench", random_orf(bases, seed=1))
+
+    def hospital_setup():
+        hospital = Hospital("Bench Hospital")
+        for patient in random_patients(patients):
+            hospital.add_patient(patient)
+        return hospital
+
+    def solutions_setup():
+        rng = random.Random(2)
+        return [Solution("NaCl", rng.uniform(0.1, 10.0), rng.uniform(1.0, 100.0)) for _ in range(patients)]
+
+    def mix(solutions):
+        mixture = Solution("NaCl", 1.0, 1.0)
+        for solution in solutions:
+            mixture.add(solution)
+        mixture.dilute(2)
+
+    def discharge(hospital):
+        patient = hospital.patients[-1]
+        hospital.discharge_patient(patient.id)
+        hospital.add_patient(patient)
+
+    return {
+        "dna_construct": (lambda: random_dna(bases), lambda data: DNASequence("bench", data)),
+        "find_motif": (dna_setup, lambda dna: dna.find_motif("GATTACA")),
+        "complement": (dna_setup, lambda dna: dna.complement()),
+        "transcribe": (dna_setup, lambda dna: dna.transcribe()),
+        "mutate": (dna_setup, lambda dna: dna.mutate(len(dna) // 2, "G")),
+        "translate": (rna_setup, lambda rna: rna.translate()),
+        "discharge_patient": (hospital_setup, discharge),
+        "get_patient_list": (hospital_setup, lambda hospital: hospital.get_patient_list()),
+        "solution_mix": (solutions_setup, mix),
+    }
+
+
+def run_benchmarks(scale: str = "tiny", repeat: int = 5, names=None):
+    """
+    Run the benchmarks of one scale.
+
+    Each benchmark's setup runs once. The measured part is timed with
+    timeit: Timer.autorange picks a loop count that runs for at least 0.2 s,
+    then Timer.repeat times `repeat` such loops and every loop is turned
+    into seconds per call, so short calls are not lost in timer noise. The
+    product cache is cleared before every call, so cached
+    complement/transcribe/translate results never hide a slowdown.
+
+    Args:
+        scale (str): Key of SCALES
+        repeat (int): Number of timed loops per benchmark; must be greater than 0
+        names (list): Optional subset of benchmark names to run
+
+    Returns:
+        dict: Mapping of "name@scale" to {"min": seconds, "median": seconds, "runs": repeat,
+            "number": calls per loop}, with seconds per call
+
+    Raises:
+        ValueError: If scale or a benchmark name is unknown, or repeat is not greater than 0
+
+    Outsource:
+    - docstrings
+    """
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale: {scale}")
+    if repeat <= 0:
+        raise ValueError("Number of repeats must be greater than 0.")
+    table = _benchmarks(*SCALES[scale])
+    for name in names or []:
+        if name not in table:
+            raise ValueError(f"Unknown benchmark: {name}")
+    results = {}
+    for name, (setup, run) in table.items():
+        if names and name not in names:
+            continue
+        state = setup()
+
+        def call(run=run, state=state):
+            default_cache.clear()
+            run(state)
+
+        timer = timeit.Timer(call)
+        number = timer.autorange()[0]
+        timings = [total / number for total in timer.repeat(repeat, number)]
+        results[f"{name}@{scale}"] = {"min": min(timings), "median": statistics.median(timings), "runs": repeat,
+                                      "number": number}
+    return results
+
+
+def _top_level_imports(statement: str):
+    """
+    Run a statement in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict: Module name -> cumulative import time in microseconds, for modules
+            imported directly (not as a dependency of another module)
+
+    Outsource:
+    - docstrings
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+    ).stderr
+    modules = {}
+    for line in output.splitlines():
+        fields = line.split("|")
+        if not line.startswith("import time:") or len(fields) != 3 or "cumulative" in line:
+            continue
+        name = fields[2]
+        if name.startswith(" ") and not name.startswith("  "):
+            modules[name.strip()] = int(fields[1])
+    return modules
+
+
+def import_time(statement: str, repeat: int = 10):
+    """
+    Measure the import cost of a statement, excluding interpreter startup.
+
+    The statement runs in a fresh interpreter with -X importtime; modules the
+    bare interpreter imports anyway (site, encodings, ...) are not counted.
+    The best of `repeat` runs is returned.
+
+    Args:
+        statement (str): Python statement, e.g. "from sequences import DNASequence"
+        repeat (int): Number of fresh interpreters to start
+
+    Returns:
+        float: Seconds spent importing
+
+    Outsource:
+    - docstrings
+    """
+    baseline = set(_top_level_imports("pass"))
+    best = None
+    for _ in range(repeat):
+        modules = _top_level_imports(statement)
+        total = sum(micros for name, micros in modules.items() if name not in baseline) / 1e6
+        best = total if best is None else min(best, total)
+    return best
+
+
+def run_startup(repeat: int = 10):
+    """
+    Time the imports in STARTUP_STATEMENTS.
+
+    Returns:
+        dict: Mapping of "import:<name>" to {"min": seconds, "median": seconds, "runs": repeat},
+            in the same format as run_benchmarks (median equals min here)
+
+    Outsource:
+    - docstrings
+    """
+    results = {}
+    for name, statement in STARTUP_STATEMENTS.items():
+        seconds = import_time(statement, repeat)
+        results[f"import:{name}"] = {"min": seconds, "median": seconds, "runs": repeat}
+    return results
+
+
+def compare(results, baseline, threshold: float = DEFAULT_THRESHOLD):
+    """
+    Compare results with a stored baseline.
+
+    The minimum time is compared, as it is the least noisy statistic.
+
+    Args:
+        results (dict): Output of run_benchmarks
+        baseline (dict): Previously saved output of run_benchmarks
+        threshold (float): Allowed relative slowdown, e.g. 0.2 for 20%
+
+    Returns:
+        list: (name, baseline seconds, current seconds, ratio, regressed) for
+            every benchmark present in both
+
+    Outsource:
+    - docstrings
+    """
+    rows = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["min"]
+        ratio = current["min"] / before if before else float("inf")
+        rows.append((name, before, current["min"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def format_results(results):
+    """Return a text table of benchmark timings."""
+    lines = [f"{'benchmark':<32}{'min [s]':>14}{'median [s]':>14}"]
+    for name, timing in results.items():
+        lines.append(f"{name:<32}{timing['min']:>14.3e}{timing['median']:>14.3e}")
+    return "\n".join(lines)
+
+
+def format_comparison(rows):
+    """Return a text table of a baseline comparison, marking regressions."""
+    lines = [f"{'benchmark':<32}{'baseline [s]':>14}{'current [s]':>14}{'ratio':>8}"]
+    for name, before, after, ratio, regressed in rows:
+        flag = "  SLOWER" if regressed else ""
+        lines.append(f"{name:<32}{before:>14.3e}{after:>14.3e}{ratio:>8.2f}{flag}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Returns:
+        int: Exit status, 1 if any benchmark regressed beyond the threshold or an
+            import exceeded the startup budget
+
+    Outsource:
+    - docstrings
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the sequence, hospital and solution classes.")
+    parser.add_argument("--scale", choices=list(SCALES), default="tiny")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="run only these benchmarks")
+    parser.add_argument("--save", help="write results to this JSON baseline file")
+    parser.add_argument("--compare", help="compare with this JSON baseline file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown before flagging (default: 0.2)")
+    parser.add_argument("--startup", action="store_true",
+                        help="time imports of the sequence package instead (budget: 5 ms)")
+    args = parser.parse_args(argv)
+
+    if args.startup:
+        results = run_startup(args.repeat)
+    else:
+        results = run_benchmarks(args.scale, args.repeat, args.only)
+    print(format_results(results))
+    over_budget = args.startup and any(timing["min"] > STARTUP_BUDGET for timing in results.values())
+    if over_budget:
+        print(f"\nImport time over the {STARTUP_BUDGET * 1000:.0f} ms budget.")
+    if args.save:
+        with open(args.save, "w") as handle:
+            json.dump(results, handle, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        rows = compare(results, baseline, args.threshold)
+        print()
+        print(format_comparison(rows))
+        if any(row[4] for row in rows):
+            return 1
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
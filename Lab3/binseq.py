@@ -0,0 +1,284 @@
+import mmap
+import struct
+
+from ex31 import DNASequence
+from ex32 import RNASequence
+from ex33 import ProteinSequence
+from packing import pack, unpack
+
+MAGIC = b"SEQB"
+VERSION = 1
+_FILE_HEADER = struct.Struct("<4sBxxxQQ")
+_INDEX_ENTRY = struct.Struct("<BHQQ")
+# The identifier length is stored as an unsigned 16-bit field of the index entry.
+MAX_IDENTIFIER_BYTES = 0xFFFF
+
+HEADER_SIZE = _FILE_HEADER.size
+
+KIND_DNA, KIND_RNA, KIND_PROTEIN = 0, 1, 2
+_KIND_OF_CLASS = {DNASequence: KIND_DNA, RNASequence: KIND_RNA, ProteinSequence: KIND_PROTEIN}
+CLASS_OF_KIND = {kind: cls for cls, kind in _KIND_OF_CLASS.items()}
+_ALPHABETS = {KIND_DNA: "ACGT", KIND_RNA: "ACGU"}
+
+
+def pack_nucleotides(data: str, kind: int = KIND_DNA):
+    """
+    Pack DNA or RNA data into 2 bits per base.
+
+    Args:
+        data (str): Uppercase DNA (kind 0) or RNA (kind 1) data
+        kind (int): KIND_DNA or KIND_RNA
+
+    Returns:
+        bytes: Packed data, len(data) / 4 rounded up bytes long
+
+    Outsource:
+    - docstrings
+    """
+    return bytes(pack(data, _ALPHABETS[kind]))
+
+
+def unpack_nucleotides(packed, length: int, kind: int = KIND_DNA, start: int = 0):
+    """
+    Unpack `length` bases starting at base `start` of 2-bit packed data.
+
+    Only the bytes covering the requested bases are decoded.
+
+    Outsource:
+    - docstrings
+    """
+    return unpack(packed, length, _ALPHABETS[kind], start)
+
+
+def read_header(buffer):
+    """
+    Parse the fixed header at the start of a binary sequence file.
+
+    Args:
+        buffer: The file contents or at least their first HEADER_SIZE bytes
+            (bytes, mmap or memoryview)
+
+    Returns:
+        tuple: (record count, offset of the record index)
+
+    Raises:
+        ValueError: If the buffer does not start with a header of a supported version
+
+    Outsource:
+    - docstrings
+    """
+    if len(buffer) < HEADER_SIZE:
+        raise ValueError("Not a binary sequence file.")
+    magic, version, count, index_offset = _FILE_HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Not a binary sequence file.")
+    return count, index_offset
+
+
+def read_index(buffer, count: int, position: int = 0):
+    """
+    Yield the entries of a record index, in file order.
+
+    Args:
+        buffer: Bytes holding the index (bytes, mmap or memoryview)
+        count (int): Number of records, from read_header
+        position (int): Offset of the index in buffer
+
+    Yields:
+        tuple: (kind, identifier as UTF-8 bytes, payload offset, sequence length)
+
+    Outsource:
+    - docstrings
+    """
+    for _ in range(count):
+        kind, name_length, offset, length = _INDEX_ENTRY.unpack_from(buffer, position)
+        position += _INDEX_ENTRY.size
+        yield kind, bytes(buffer[position:position + name_length]), offset, length
+        position += name_length
+
+
+def decode_region(buffer, kind: int, offset: int, start: int, end: int):
+    """
+    Decode bases (or residues) [start, end) of the record whose payload starts at `offset`.
+
+    Only the bytes covering the region are read; the range is not checked.
+
+    Args:
+        buffer: The file contents, usually a read-only mmap
+        kind (int): KIND_DNA, KIND_RNA or KIND_PROTEIN
+        offset (int): Payload offset of the record
+        start (int): 0-based start of the region (inclusive)
+        end (int): 0-based end of the region (exclusive)
+
+    Returns:
+        str: Sequence data of the region
+
+    Outsource:
+    - docstrings
+    """
+    if kind == KIND_PROTEIN:
+        return buffer[offset + start:offset + end].decode("ascii")
+    first = start // 4
+    packed = buffer[offset + first:offset + (end + 3) // 4]
+    return unpack_nucleotides(packed, end - start, kind, start - first * 4)
+
+
+def write_binary(path: str, sequences):
+    """
+    Write sequences to the native binary container format.
+
+    Layout: a fixed header (magic, version, record count, index offset),
+    the record payloads (2-bit packed DNA/RNA, 1 byte per protein residue),
+    then an index of (kind, identifier, payload offset, sequence length).
+
+    Args:
+        path (str): Output file path
+        sequences (iterable): DNASequence, RNASequence or ProteinSequence objects
+
+    Raises:
+        TypeError: If an object is not one of the three sequence types
+        ValueError: If two sequences share an identifier, or an identifier is longer
+            than MAX_IDENTIFIER_BYTES in UTF-8
+
+    Outsource:
+    - docstrings
+    """
+    entries = []
+    seen = set()
+    with open(path, "wb") as handle:
+        handle.write(_FILE_HEADER.pack(MAGIC, VERSION, 0, 0))
+        for sequence in sequences:
+            kind = _KIND_OF_CLASS.get(type(sequence))
+            if kind is None:
+                raise TypeError(f"Cannot store {type(sequence).__name__} in a binary sequence file.")
+            if sequence.identifier in seen:
+                raise ValueError(f"Duplicate identifier: {sequence.identifier}")
+            seen.add(sequence.identifier)
+            identifier = sequence.identifier.encode("utf-8")
+            if len(identifier) > MAX_IDENTIFIER_BYTES:
+                raise ValueError(f"Identifier longer than {MAX_IDENTIFIER_BYTES} bytes: {sequence.identifier[:40]}...")
+            offset = handle.tell()
+            data = sequence.data
+            if kind == KIND_PROTEIN:
+                handle.write(data.encode("ascii"))
+            else:
+                handle.write(pack_nucleotides(data, kind))
+            entries.append((kind, identifier, offset, len(data)))
+        index_offset = handle.tell()
+        for kind, identifier, offset, length in entries:
+            handle.write(_INDEX_ENTRY.pack(kind, len(identifier), offset, length))
+            handle.write(identifier)
+        handle.seek(0)
+        handle.write(_FILE_HEADER.pack(MAGIC, VERSION, len(entries), index_offset))
+
+
+class BinarySequenceFile:
+    """
+    Memory-mapped reader for the native binary container format.
+
+    Opening parses only the small index; record data stays in the mapped
+    file and is decoded when a record (or a region of it) is requested.
+
+    Attributes:
+        path (str): Input file path
+        index (dict): Mapping of identifier to (kind, payload offset, sequence length)
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a binary sequence file and read its index.
+
+        Raises:
+            ValueError: If the file is not a binary sequence file of a supported version,
+                or two records share an identifier
+
+        Outsource:
+        - docstrings
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            count, index_offset = read_header(self._map)
+        except ValueError:
+            self.close()
+            raise
+        self.index = {}
+        for kind, name, offset, length in read_index(self._map, count, index_offset):
+            identifier = name.decode("utf-8")
+            if identifier in self.index:
+                self.close()
+                raise ValueError(f"Duplicate identifier in binary sequence file: {identifier}")
+            self.index[identifier] = (kind, offset, length)
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self.index)
+
+    def __contains__(self, identifier):
+        """Return True if a record with this identifier exists."""
+        return identifier in self.index
+
+    def identifiers(self):
+        """Return the record identifiers in file order."""
+        return list(self.index)
+
+    def fetch(self, identifier: str, start: int = 0, end: int = None):
+        """
+        Decode the region [start, end) of one record without decoding the rest.
+
+        Args:
+            identifier (str): Record identifier
+            start (int): 0-based start of the region (inclusive)
+            end (int): 0-based end of the region (exclusive), defaults to the record end
+
+        Returns:
+            str: Sequence data of the region
+
+        Raises:
+            KeyError: If no record has this identifier
+            IndexError: If the region lies outside the record
+
+        Outsource:
+        - docstrings
+        """
+        kind, offset, length = self.index[identifier]
+        if end is None:
+            end = length
+        if not (0 <= start <= end <= length):
+            raise IndexError("Region out of range.")
+        return decode_region(self._map, kind, offset, start, end)
+
+    def __getitem__(self, identifier: str):
+        """
+        Load one record as a sequence object (no re-validation).
+
+        Raises:
+            KeyError: If no record has this identifier
+
+        Outsource:
+        - docstrings
+        """
+        kind = self.index[identifier][0]
+        return CLASS_OF_KIND[kind]._from_valid(identifier, self.fetch(identifier))
+
+    def __iter__(self):
+        """Yield every record as a sequence object, in file order."""
+        for identifier in self.index:
+            yield self[identifier]
+
+    def close(self):
+        """Unmap and close the file."""
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        """Return the reader for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the reader at the end of a with statement."""
+        self.close()
@@ -0,0 +1,495 @@
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from hashlib import blake2b
+from itertools import accumulate
+
+from binseq import CLASS_OF_KIND, HEADER_SIZE, decode_region, read_header, read_index, write_binary
+
+INDEX_SUFFIX = ".idx"
+INDEX_MAGIC = b"SQIX"
+INDEX_VERSION = 2
+# magic, version, record count, hash table size, names size,
+# data file size, data file modification time (ns), data index offset
+_INDEX_HEADER = struct.Struct("<4sBxxxQQQQqQ")
+_ALIGNMENT = 8
+
+
+def _identifier_hash(name: bytes):
+    """Return a stable 64-bit hash of an encoded identifier (str hashes vary between runs)."""
+    return int.from_bytes(blake2b(name, digest_size=8).digest(), "little")
+
+
+def _padding(position: int):
+    """Return the zero bytes that align `position` to _ALIGNMENT."""
+    return b"\0" * (-position % _ALIGNMENT)
+
+
+def _table_size(count: int):
+    """Return a power-of-two hash table size keeping the load factor at or below one half."""
+    size = 8
+    while size < 2 * count:
+        size *= 2
+    return size
+
+
+def build_index(path: str):
+    """
+    Write the identifier index of a binary sequence file (written by write_binary).
+
+    The index is stored next to the data as `path + ".idx"`. It holds the
+    record columns (kind, payload offset, length, identifier offsets and
+    bytes) in file order, the record numbers in identifier order for prefix
+    search and an open-addressing hash table for identifier lookup, all as
+    8-byte aligned arrays that are memory-mapped when the collection is
+    reopened, so opening costs the same for any number of records. The
+    data file's size, modification time and record index offset are stored
+    too, so an index left over from an older version of the file is detected.
+
+    Args:
+        path (str): Binary sequence file
+
+    Returns:
+        str: Path of the index file
+
+    Raises:
+        ValueError: If the file is not a binary sequence file or has duplicate identifiers
+
+    Outsource:
+    - docstrings
+    """
+    with open(path, "rb") as handle:
+        stat = os.fstat(handle.fileno())
+        count, data_index_offset = read_header(handle.read(HEADER_SIZE))
+        handle.seek(data_index_offset)
+        entries = handle.read()
+    names, kinds = [], bytearray(count)
+    offsets, lengths = array("Q", [0]) * count, array("Q", [0]) * count
+    seen = set()
+    for record, (kind, name, offset, length) in enumerate(read_index(entries, count)):
+        if name in seen:
+            raise ValueError(f"Duplicate identifier in binary sequence file: {name.decode('utf-8')}")
+        seen.add(name)
+        kinds[record], offsets[record], lengths[record] = kind, offset, length
+        names.append(name)
+    name_ends = array("Q", [0])
+    name_ends.extend(accumulate(map(len, names)))
+    order = array("Q", sorted(range(count), key=names.__getitem__))
+    table_size = _table_size(count)
+    table = array("Q", [0]) * table_size
+    for record, name in enumerate(names):
+        slot = _identifier_hash(name) & (table_size - 1)
+        while table[slot]:
+            slot = (slot + 1) & (table_size - 1)
+        table[slot] = record + 1
+    blob = b"".join(names)
+    index_path = path + INDEX_SUFFIX
+    with open(index_path, "wb") as handle:
+        handle.write(_INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, count, table_size, len(blob),
+                                        stat.st_size, stat.st_mtime_ns, data_index_offset))
+        for buffer in (offsets.tobytes(), lengths.tobytes(), name_ends.tobytes(), order.tobytes(),
+                       table.tobytes(), bytes(kinds), blob):
+            handle.write(buffer)
+            handle.write(_padding(handle.tell()))
+    return index_path
+
+
+class _MemoryStore:
+    """
+    Records kept as sequence objects in a dict (insertion order).
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self):
+        """Start empty."""
+        self.records = {}
+        self._sorted = None
+
+    def add(self, sequence):
+        """Add a sequence; the sorted identifier list is rebuilt on the next prefix search."""
+        if sequence.identifier in self.records:
+            raise ValueError(f"Duplicate identifier: {sequence.identifier}")
+        self.records[sequence.identifier] = sequence
+        self._sorted = None
+
+    def __len__(self):
+        """Return the number of records."""
+        return len(self.records)
+
+    def __contains__(self, identifier):
+        """Return True if a record has this identifier."""
+        return identifier in self.records
+
+    def identifiers(self):
+        """Return the identifiers in insertion order."""
+        return list(self.records)
+
+    def with_prefix(self, prefix: str):
+        """Return the identifiers starting with prefix, sorted."""
+        if self._sorted is None:
+            self._sorted = sorted(self.records)
+        identifiers = self._sorted
+        found = []
+        for position in range(bisect_left(identifiers, prefix), len(identifiers)):
+            if not identifiers[position].startswith(prefix):
+                break
+            found.append(identifiers[position])
+        return found
+
+    def length(self, identifier: str):
+        """Return the length of one record."""
+        return len(self.records[identifier])
+
+    def fetch(self, identifier: str, start: int, end: int):
+        """Return data[start:end] of one record (the range is already checked)."""
+        return self.records[identifier][start:end]
+
+    def load(self, identifier: str):
+        """Return the stored sequence object."""
+        return self.records[identifier]
+
+    def close(self):
+        """Nothing to release."""
+
+
+class _DiskStore:
+    """
+    Records in a memory-mapped binary sequence file with a memory-mapped index.
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, path: str):
+        """
+        Map the data file and its index, building the index first if it is missing or stale.
+
+        Raises:
+            ValueError: If the file is not a binary sequence file or has duplicate identifiers
+
+        Outsource:
+        - docstrings
+        """
+        index_path = path + INDEX_SUFFIX
+        if not self._index_current(path, index_path):
+            build_index(path)
+        self._files = [open(path, "rb"), open(index_path, "rb")]
+        self._data = mmap.mmap(self._files[0].fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = mmap.mmap(self._files[1].fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, count, table_size, names_size, _, _, _ = _INDEX_HEADER.unpack_from(self._index, 0)
+        view = memoryview(self._index)
+        self._views = [view]
+        position = _INDEX_HEADER.size
+        columns = []
+        for size, code in ((8 * count, "Q"), (8 * count, "Q"), (8 * (count + 1), "Q"), (8 * count, "Q"),
+                           (8 * table_size, "Q"), (count, "B"), (names_size, "B")):
+            column = view[position:position + size].cast(code)
+            columns.append(column)
+            position += size + (-size % _ALIGNMENT)
+        self._views.extend(columns)
+        self._offsets, self._lengths, self._name_ends, self._order, self._table, self._kinds, self._names = columns
+        self._count = count
+        self._mask = table_size - 1
+
+    @staticmethod
+    def _index_current(path: str, index_path: str):
+        """Return True if the index exists and matches the data file's size, modification time and header."""
+        if not os.path.exists(index_path):
+            return False
+        with open(index_path, "rb") as handle:
+            header = handle.read(_INDEX_HEADER.size)
+        with open(path, "rb") as handle:
+            stat = os.fstat(handle.fileno())
+            try:
+                data_header = read_header(handle.read(HEADER_SIZE))
+            except ValueError:
+                return False
+        if len(header) < _INDEX_HEADER.size:
+            return False
+        magic, version, count, _, _, data_size, data_mtime, data_index_offset = _INDEX_HEADER.unpack(header)
+        return (magic == INDEX_MAGIC and version == INDEX_VERSION
+                and (data_size, data_mtime) == (stat.st_size, stat.st_mtime_ns)
+                and (count, data_index_offset) == data_header)
+
+    def _name(self, record: int):
+        """Return the encoded identifier of a record."""
+        return self._names[self._name_ends[record]:self._name_ends[record + 1]].tobytes()
+
+    def _record(self, identifier: str):
+        """Return the record number of an identifier (hash table probe), or -1."""
+        name = identifier.encode("utf-8")
+        slot = _identifier_hash(name) & self._mask
+        table = self._table
+        while table[slot]:
+            record = table[slot] - 1
+            if self._name(record) == name:
+                return record
+            slot = (slot + 1) & self._mask
+        return -1
+
+    def __len__(self):
+        """Return the number of records."""
+        return self._count
+
+    def __contains__(self, identifier):
+        """Return True if a record has this identifier."""
+        return self._record(identifier) >= 0
+
+    def identifiers(self):
+        """Return the identifiers in file order."""
+        return [self._name(record).decode("utf-8") for record in range(self._count)]
+
+    def with_prefix(self, prefix: str):
+        """Return the identifiers starting with prefix, sorted (binary search on the sorted order)."""
+        encoded = prefix.encode("utf-8")
+        order = self._order
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name(order[middle]) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        found = []
+        for position in range(low, self._count):
+            name = self._name(order[position])
+            if not name.startswith(encoded):
+                break
+            found.append(name.decode("utf-8"))
+        return found
+
+    def _checked_record(self, identifier: str):
+        """Return the record number of an identifier, raising KeyError if there is none."""
+        record = self._record(identifier)
+        if record < 0:
+            raise KeyError(identifier)
+        return record
+
+    def length(self, identifier: str):
+        """Return the length of one record."""
+        return self._lengths[self._checked_record(identifier)]
+
+    def fetch(self, identifier: str, start: int, end: int):
+        """Decode data[start:end] of one record from the mapped file (the range is already checked)."""
+        record = self._checked_record(identifier)
+        return decode_region(self._data, self._kinds[record], self._offsets[record], start, end)
+
+    def load(self, identifier: str):
+        """Decode one record as a sequence object (no re-validation)."""
+        record = self._checked_record(identifier)
+        kind = self._kinds[record]
+        return CLASS_OF_KIND[kind]._from_valid(identifier, self.fetch(identifier, 0, self._lengths[record]))
+
+    def close(self):
+        """Release the views, unmap both files and close them."""
+        for view in reversed(self._views):
+            view.release()
+        self._data.close()
+        self._index.close()
+        for handle in self._files:
+            handle.close()
+
+
+class SequenceCollection:
+    """
+    A set of sequences addressed by identifier.
+
+    A collection is either built in memory (add sequences, then save() it)
+    or opened from a binary sequence file with open(). Lookup by identifier
+    is O(1) (a dict in memory, a memory-mapped hash table on disk), prefix
+    search uses a sorted identifier index, and fetch() returns a region of
+    a record without decoding or copying the rest. The on-disk index is
+    persisted next to the data file, so reopening even millions of records
+    only maps two files.
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, sequences=()):
+        """
+        Create an in-memory collection.
+
+        Args:
+            sequences (iterable): DNASequence, RNASequence or ProteinSequence objects
+
+        Raises:
+            ValueError: If two sequences share an identifier
+
+        Outsource:
+        - docstrings
+        """
+        self._store = _MemoryStore()
+        for sequence in sequences:
+            self.add(sequence)
+
+    @classmethod
+    def open(cls, path: str):
+        """
+        Open a binary sequence file as a read-only collection.
+
+        The persisted index (`path + ".idx"`) is used when it matches the
+        file; otherwise it is rebuilt and saved first.
+
+        Args:
+            path (str): Binary sequence file written by save() or binseq.write_binary
+
+        Returns:
+            SequenceCollection: Collection backed by the mapped file; close() it when done
+
+        Raises:
+            ValueError: If the file is not a binary sequence file or has duplicate identifiers
+
+        Outsource:
+        - docstrings
+        """
+        collection = cls.__new__(cls)
+        collection._store = _DiskStore(path)
+        return collection
+
+    def save(self, path: str):
+        """
+        Write the collection to a binary sequence file and build its index.
+
+        Args:
+            path (str): Output path; the index is written to path + ".idx"
+
+        Outsource:
+        - docstrings
+        """
+        write_binary(path, (self._store.load(identifier) for identifier in self._store.identifiers()))
+        build_index(path)
+
+    def add(self, sequence):
+        """
+        Add a sequence to an in-memory collection.
+
+        Raises:
+            ValueError: If the identifier is already present
+            TypeError: If the collection was opened from a file (read-only)
+
+        Outsource:
+        - docstrings
+        """
+        if not isinstance(self._store, _MemoryStore):
+            raise TypeError("Collections opened from a file are read-only.")
+        self._store.add(sequence)
+
+    def __len__(self):
+        """Return the number of sequences."""
+        return len(self._store)
+
+    def __contains__(self, identifier):
+        """Return True if a sequence has this identifier."""
+        return identifier in self._store
+
+    def __getitem__(self, identifier: str):
+        """
+        Return the sequence with this identifier.
+
+        Raises:
+            KeyError: If no sequence has this identifier
+
+        Outsource:
+        - docstrings
+        """
+        return self._store.load(identifier)
+
+    def __iter__(self):
+        """Iterate over the identifiers (insertion order in memory, file order on disk)."""
+        return iter(self._store.identifiers())
+
+    def identifiers(self):
+        """Return the identifiers (insertion order in memory, file order on disk)."""
+        return self._store.identifiers()
+
+    def with_prefix(self, prefix: str):
+        """
+        Find the identifiers starting with a prefix.
+
+        Args:
+            prefix (str): Identifier prefix (case-sensitive)
+
+        Returns:
+            list: Matching identifiers in sorted order
+
+        Outsource:
+        - docstrings
+        """
+        return self._store.with_prefix(prefix)
+
+    def length(self, identifier: str):
+        """
+        Return the length of a sequence without loading it.
+
+        Raises:
+            KeyError: If no sequence has this identifier
+
+        Outsource:
+        - docstrings
+        """
+        return self._store.length(identifier)
+
+    def fetch(self, identifier: str, start: int = 0, end: int = None):
+        """
+        Return the region [start, end) of a sequence as a str.
+
+        Only the region is decoded (on disk) or copied (in memory).
+
+        Args:
+            identifier (str): Sequence identifier
+            start (int): 0-based start of the region (inclusive)
+            end (int): 0-based end of the region (exclusive), defaults to the sequence end
+
+        Returns:
+            str: Sequence data of the region
+
+        Raises:
+            KeyError: If no sequence has this identifier
+            IndexError: If the region lies outside the sequence
+
+        Outsource:
+        - docstrings
+        """
+        length = self._store.length(identifier)
+        if end is None:
+            end = length
+        if not (0 <= start <= end <= length):
+            raise IndexError("Region out of range.")
+        return self._store.fetch(identifier, start, end)
+
+    def fetch_many(self, regions):
+        """
+        Yield the data of many regions lazily.
+
+        Args:
+            regions (iterable): (identifier, start, end) tuples; end may be None
+
+        Yields:
+            str: Data of each region, in order
+
+        Raises:
+            KeyError: If a region names an unknown identifier
+            IndexError: If a region lies outside its sequence
+
+        Outsource:
+        - docstrings
+        """
+        for identifier, start, end in regions:
+            yield self.fetch(identifier, start, end)
+
+    def close(self):
+        """Unmap the files of a collection opened from disk."""
+        self._store.close()
+
+    def __enter__(self):
+        """Return the collection for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the collection at the end of a with statement."""
+        self.close()
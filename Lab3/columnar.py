@@ -0,0 +1,477 @@
+import mmap
+import struct
+from array import array
+from itertools import accumulate
+
+from ex2 import Patient
+from ex22 import Hospital
+
+COLUMNS = ("id", "name", "dob", "diagnosis", "admitted")
+STRING_COLUMNS = ("name", "dob", "diagnosis")
+FORMATS = ("arrow", "parquet", "npz", "native")
+MAGIC = b"HOSC"
+VERSION = 1
+_FILE_HEADER = struct.Struct("<4sBBxxQQ")
+_ALIGNMENT = 8
+
+ID_INT, ID_STRING = 0, 1
+
+
+def _module_available(name: str):
+    """Return True if a module can be imported, without importing it."""
+    from importlib.util import find_spec
+    return find_spec(name) is not None
+
+
+def available_formats():
+    """
+    Return the export formats usable in this environment, best first.
+
+    arrow and parquet need pyarrow, npz needs NumPy; native needs nothing.
+
+    Outsource:
+    - docstrings
+    """
+    formats = []
+    if _module_available("pyarrow"):
+        formats += ["arrow", "parquet"]
+    if _module_available("numpy"):
+        formats.append("npz")
+    formats.append("native")
+    return formats
+
+
+def _python_columns(hospital):
+    """
+    Return the patient fields of a hospital as one Python list per column.
+
+    Outsource:
+    - docstrings
+    """
+    patients = hospital.patients
+    return {
+        "id": [patient.id for patient in patients],
+        "name": [str(patient.name) for patient in patients],
+        "dob": [str(patient.dob) for patient in patients],
+        "diagnosis": [str(patient.diagnosis) for patient in patients],
+        "admitted": [bool(patient.admitted) for patient in patients],
+    }
+
+
+def _integer_ids(ids):
+    """Return True if every id is a Python int, so the id column can be int64."""
+    return all(type(patient_id) is int for patient_id in ids)
+
+
+def export_hospital(hospital, path: str, format: str = None):
+    """
+    Write the patients of a hospital to a columnar file.
+
+    The id, name, dob, diagnosis and admitted fields become one column each;
+    ids are stored as 64-bit integers when they are all ints, as strings
+    otherwise.
+
+    Args:
+        hospital (Hospital): Hospital whose patients are exported
+        path (str): Output file path
+        format (str): "arrow" (Arrow IPC file), "parquet", "npz" or "native";
+            defaults to the first of available_formats()
+
+    Returns:
+        str: The format written
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If the format needs a library that is not installed
+
+    Outsource:
+    - docstrings
+    """
+    if format is None:
+        format = available_formats()[0]
+    if format not in FORMATS:
+        raise ValueError(f"Unknown columnar format: {format}")
+    columns = _python_columns(hospital)
+    if format == "native":
+        _write_native(path, hospital.name, columns)
+    elif format == "npz":
+        _write_npz(path, hospital.name, columns)
+    else:
+        _write_arrow(path, hospital.name, columns, format)
+    return format
+
+
+def _padding(position: int):
+    """Return the zero bytes that align `position` to _ALIGNMENT."""
+    return b"\0" * (-position % _ALIGNMENT)
+
+
+def _write_native(path: str, name: str, columns):
+    """
+    Write the native columnar format (standard library only).
+
+    Layout: a fixed header (magic, version, id kind, row count, hospital
+    name length), the hospital name, then one 8-byte aligned buffer per
+    numeric column and two per string column (int64 end offsets, then the
+    UTF-8 bytes), in COLUMNS order, as in Arrow's variable-size layout.
+
+    Outsource:
+    - docstrings
+    """
+    ids = columns["id"]
+    id_kind = ID_INT if _integer_ids(ids) else ID_STRING
+    encoded_name = name.encode("utf-8")
+    with open(path, "wb") as handle:
+        handle.write(_FILE_HEADER.pack(MAGIC, VERSION, id_kind, len(ids), len(encoded_name)))
+        handle.write(encoded_name)
+        for column in COLUMNS:
+            handle.write(_padding(handle.tell()))
+            values = columns[column]
+            if column == "admitted":
+                handle.write(bytes(values))
+            elif column == "id" and id_kind == ID_INT:
+                handle.write(array("q", values).tobytes())
+            else:
+                encoded = [str(value).encode("utf-8") for value in values]
+                handle.write(array("q", accumulate(map(len, encoded))).tobytes())
+                handle.write(_padding(handle.tell()))
+                handle.write(b"".join(encoded))
+
+
+def _write_npz(path: str, name: str, columns):
+    """Write one NumPy array per column (plus the hospital name) to an .npz file."""
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("The npz format requires NumPy.") from error
+    ids = columns["id"]
+    arrays = {column: numpy.array(columns[column], dtype=str) for column in STRING_COLUMNS}
+    arrays["id"] = numpy.array(ids, dtype=numpy.int64 if _integer_ids(ids) else str)
+    arrays["admitted"] = numpy.array(columns["admitted"], dtype=bool)
+    with open(path, "wb") as handle:
+        numpy.savez(handle, hospital=numpy.array(name), **arrays)
+
+
+def _write_arrow(path: str, name: str, columns, format: str):
+    """Write an Arrow IPC file or a Parquet file with pyarrow."""
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(f"The {format} format requires pyarrow.") from error
+    ids = columns["id"]
+    data = dict(columns)
+    if not _integer_ids(ids):
+        data["id"] = [str(patient_id) for patient_id in ids]
+    table = pyarrow.table(data).replace_schema_metadata({"hospital": name})
+    if format == "parquet":
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, path)
+        return
+    import pyarrow.ipc
+    with pyarrow.OSFile(path, "wb") as sink:
+        with pyarrow.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+class StringColumn:
+    """
+    Read-only view of a native string column; values are decoded on access.
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, offsets, data):
+        """Wrap int64 end offsets and the UTF-8 data buffer (both memoryviews)."""
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self):
+        """Return the number of values."""
+        return len(self._offsets)
+
+    def __getitem__(self, row: int):
+        """Decode one value."""
+        if row < 0:
+            row += len(self._offsets)
+        start = self._offsets[row - 1] if row else 0
+        return bytes(self._data[start:self._offsets[row]]).decode("utf-8")
+
+    def __iter__(self):
+        """Decode the values in order."""
+        return iter(self.tolist())
+
+    def tolist(self):
+        """
+        Decode every value into a list.
+
+        The data is decoded once; when it is pure ASCII, byte offsets are
+        character offsets and values are sliced from the decoded text.
+
+        Outsource:
+        - docstrings
+        """
+        offsets = self._offsets.tolist()
+        starts = [0] + offsets[:-1]
+        data = bytes(self._data)
+        text = data.decode("utf-8")
+        if len(text) != len(data):
+            text = data
+            return [text[start:end].decode("utf-8") for start, end in zip(starts, offsets)]
+        return [text[start:end] for start, end in zip(starts, offsets)]
+
+    def release(self):
+        """Release the underlying buffers."""
+        self._offsets.release()
+        self._data.release()
+
+
+class _NativeColumns:
+    """
+    Memory-mapped reader for the native columnar format.
+
+    Numeric columns are memoryviews cast straight onto the mapped file
+    (int64 "q" for ids, uint8 "B" for admitted) and string columns are
+    StringColumn views, so opening copies nothing.
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a native columnar file.
+
+        Raises:
+            ValueError: If the file is not a native columnar file of a supported version
+
+        Outsource:
+        - docstrings
+        """
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _FILE_HEADER.size:
+            self.close()
+            raise ValueError("Not a columnar hospital file.")
+        magic, version, id_kind, rows, name_length = _FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("Not a columnar hospital file.")
+        position = _FILE_HEADER.size
+        self.name = self._map[position:position + name_length].decode("utf-8")
+        position += name_length
+        self.rows = rows
+        self._views = []
+        self.columns = {}
+        view = memoryview(self._map)
+        self._views.append(view)
+        for column in COLUMNS:
+            position += -position % _ALIGNMENT
+            if column == "admitted":
+                self.columns[column] = view[position:position + rows]
+                position += rows
+            elif column == "id" and id_kind == ID_INT:
+                self.columns[column] = view[position:position + 8 * rows].cast("q")
+                position += 8 * rows
+            else:
+                offsets = view[position:position + 8 * rows].cast("q")
+                position += 8 * rows
+                position += -position % _ALIGNMENT
+                size = offsets[-1] if rows else 0
+                self.columns[column] = StringColumn(offsets, view[position:position + size])
+                position += size
+        self._views.extend(self.columns.values())
+
+    def close(self):
+        """Release the column views, then unmap and close the file."""
+        for view in reversed(getattr(self, "_views", [])):
+            view.release()
+        self._map.close()
+        self._file.close()
+
+
+def _read_npz(path: str):
+    """Return (hospital name, row count, columns, close) for an .npz file."""
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("Reading npz files requires NumPy.") from error
+    archive = numpy.load(path, allow_pickle=False)
+    columns = {column: archive[column] for column in COLUMNS}
+    return str(archive["hospital"]), len(columns["id"]), columns, archive.close
+
+
+def _read_arrow(path: str, parquet: bool):
+    """Return (hospital name, row count, columns, close) for an Arrow IPC or Parquet file."""
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError("Reading Arrow and Parquet files requires pyarrow.") from error
+    if parquet:
+        import pyarrow.parquet
+        table = pyarrow.parquet.read_table(path, memory_map=True)
+    else:
+        import pyarrow.ipc
+        table = pyarrow.ipc.open_file(pyarrow.memory_map(path, "r")).read_all()
+    name = (table.schema.metadata or {}).get(b"hospital", b"").decode("utf-8")
+    columns = {column: table.column(column) for column in COLUMNS}
+    return name, table.num_rows, columns, lambda: None
+
+
+def _to_list(column):
+    """Convert a column of any supported format to a list of Python values."""
+    for method in ("to_pylist", "tolist"):
+        convert = getattr(column, method, None)
+        if convert is not None:
+            return convert()
+    return list(column)
+
+
+class ColumnarHospital(Hospital):
+    """
+    A Hospital backed by the columns of an exported file.
+
+    `columns` gives direct access to the column data (pyarrow arrays,
+    NumPy arrays, or memoryviews and StringColumn views of the mapped
+    native file) for vectorized scans. Patient objects are only built when
+    a patient is needed: get_patient_list() reads the admitted column and
+    builds just the admitted patients, and the first access to `patients`
+    builds them all, after which the hospital behaves like any other.
+
+    Attributes:
+        columns (dict): Mapping of column name to column data
+        discharged (dict): As in Hospital
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, name: str, rows: int, columns, close=None):
+        """
+        Initialize a hospital over already opened columns.
+
+        Args:
+            name (str): Hospital name
+            rows (int): Number of patients
+            columns (dict): Column data for every name in COLUMNS
+            close (callable): Releases the underlying file, called by close()
+
+        Outsource:
+        - docstrings
+        """
+        super().__init__(name)
+        self._patients = None
+        self.columns = columns
+        self._rows = rows
+        self._row_patients = [None] * rows
+        self._close = close
+
+    @property
+    def patients(self):
+        """Patient objects, built from the columns on first access."""
+        if self._patients is None:
+            self._patients = self._build_patients(range(self._rows))
+        return self._patients
+
+    @patients.setter
+    def patients(self, patients):
+        """Replace the patient list."""
+        self._patients = patients
+
+    def __len__(self):
+        """Return the number of patients without building them."""
+        if self._patients is None:
+            return self._rows
+        return len(self._patients)
+
+    def _build_patients(self, rows):
+        """
+        Return the Patient objects of the given rows, building those not built yet.
+
+        Each column is converted to a Python list once per call, which is far
+        cheaper than unwrapping values one by one.
+
+        Outsource:
+        - docstrings
+        """
+        ids, names, dobs, diagnoses, admitted = (_to_list(self.columns[column]) for column in COLUMNS)
+        built = self._row_patients
+        for row in rows:
+            if built[row] is None:
+                built[row] = Patient(names[row], dobs[row], ids[row], diagnoses[row], bool(admitted[row]))
+        return [built[row] for row in rows]
+
+    def get_patient_list(self):
+        """
+        Get a list of all admitted patients in the hospital.
+
+        Before `patients` is built, only the admitted rows are turned into
+        Patient objects.
+
+        Returns:
+            list: Admitted Patient objects
+
+        Outsource:
+        - docstrings
+        """
+        if self._patients is not None:
+            return super().get_patient_list()
+        admitted = _to_list(self.columns["admitted"])
+        return self._build_patients([row for row, flag in enumerate(admitted) if flag])
+
+    def close(self):
+        """
+        Release the file behind the columns.
+
+        Build `patients` (or copy the columns) first if they are still needed.
+
+        Outsource:
+        - docstrings
+        """
+        if self._close is not None:
+            self._close()
+            self._close = None
+
+    def __enter__(self):
+        """Return the hospital for use in a with statement."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the hospital at the end of a with statement."""
+        self.close()
+
+
+def read_hospital(path: str):
+    """
+    Open a columnar hospital file written by export_hospital.
+
+    The format is detected from the file's leading bytes. Arrow, Parquet
+    and native files are memory-mapped, so opening copies no column data.
+
+    Args:
+        path (str): Input file path
+
+    Returns:
+        ColumnarHospital: Hospital over the file's columns
+
+    Raises:
+        ValueError: If the file is not a columnar hospital file
+        ImportError: If the format needs a library that is not installed
+
+    Outsource:
+    - docstrings
+    """
+    with open(path, "rb") as handle:
+        magic = handle.read(6)
+    if magic.startswith(MAGIC):
+        reader = _NativeColumns(path)
+        return ColumnarHospital(reader.name, reader.rows, reader.columns, reader.close)
+    if magic.startswith(b"ARROW1"):
+        name, rows, columns, close = _read_arrow(path, parquet=False)
+    elif magic.startswith(b"PAR1"):
+        name, rows, columns, close = _read_arrow(path, parquet=True)
+    elif magic.startswith(b"PK"):
+        name, rows, columns, close = _read_npz(path)
+    else:
+        raise ValueError("Not a columnar hospital file.")
+    return ColumnarHospital(name, rows, columns, close)
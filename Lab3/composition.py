@@ -0,0 +1,135 @@
+from array import array
+from itertools import accumulate
+
+BLOCK_BITS = 6
+BLOCK = 1 << BLOCK_BITS
+_BLOCK_BYTES = BLOCK // 8
+# Byte value -> its 8 bits as 0/1 bytes, lowest bit first.
+_EXPANDED = [bytes((value >> bit) & 1 for bit in range(8)) for value in range(256)]
+
+
+class CompositionIndex:
+    """
+    Succinct base-count index for O(1) composition queries.
+
+    For every base the index stores one bit per position (set where the
+    base occurs) and, every BLOCK positions, the number of occurrences
+    before that position as a 4-byte count. The count of a base before any
+    position is the last block count plus the set bits of the partial
+    block, so a region count is two such lookups. The whole index takes
+    about 3/16 byte per position and base, less than the sequence itself,
+    and does not keep the sequence.
+
+    Attributes:
+        length (int): Length of the sequence the index was built from
+        alphabet (str): Bases that are counted
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, data: str, alphabet: str):
+        """
+        Build the index for a sequence.
+
+        Args:
+            data (str): Uppercase sequence string
+            alphabet (str): Bases to count
+
+        Outsource:
+        - docstrings
+        """
+        self.length = len(data)
+        self.alphabet = alphabet
+        raw = data.encode("ascii")
+        size = (len(raw) // BLOCK + 1) * _BLOCK_BYTES
+        self._bits = {}
+        self._blocks = {}
+        for base in alphabet:
+            table = bytearray(b"0" * 256)
+            table[ord(base)] = ord("1")
+            # Reversed, so that bit i of the integer is position i.
+            marks = raw.translate(table)[::-1]
+            bits = int(marks, 2).to_bytes(size, "little") if marks else bytes(size)
+            self._bits[base] = bits
+            self._blocks[base] = array("I", accumulate(
+                (int.from_bytes(bits[offset:offset + _BLOCK_BYTES], "little").bit_count()
+                 for offset in range(0, size - _BLOCK_BYTES, _BLOCK_BYTES)), initial=0))
+
+    def _rank(self, base: str, position: int):
+        """Return the number of `base` in [0, position)."""
+        block = position >> BLOCK_BITS
+        offset = block * _BLOCK_BYTES
+        word = int.from_bytes(self._bits[base][offset:offset + _BLOCK_BYTES], "little")
+        return self._blocks[base][block] + (word & ((1 << (position & (BLOCK - 1))) - 1)).bit_count()
+
+    def _bounds(self, start: int, end):
+        """
+        Validate a query region and return it with `end` filled in.
+
+        Raises:
+            IndexError: If the region lies outside the sequence
+
+        Outsource:
+        - docstrings
+        """
+        if end is None:
+            end = self.length
+        if not (0 <= start <= end <= self.length):
+            raise IndexError("Region out of range.")
+        return start, end
+
+    def count(self, base: str, start: int = 0, end=None):
+        """Return the number of `base` in [start, end)."""
+        start, end = self._bounds(start, end)
+        return self._rank(base, end) - self._rank(base, start)
+
+    def counts(self, start: int = 0, end=None):
+        """Return a dict of base counts in [start, end)."""
+        start, end = self._bounds(start, end)
+        return {base: self._rank(base, end) - self._rank(base, start) for base in self.alphabet}
+
+    def gc_content(self, start: int = 0, end=None):
+        """
+        Return the fraction of G and C bases in [start, end).
+
+        Returns:
+            float: GC fraction, 0.0 for an empty region
+
+        Outsource:
+        - docstrings
+        """
+        start, end = self._bounds(start, end)
+        if end == start:
+            return 0.0
+        rank = self._rank
+        return (rank("G", end) - rank("G", start) + rank("C", end) - rank("C", start)) / (end - start)
+
+    def window_profile(self, size: int, step: int = 1):
+        """
+        Return the GC fraction of every window of the sequence.
+
+        Builds a dense G+C prefix count for the duration of the call (4 bytes
+        per position), so every window costs one subtraction.
+
+        Args:
+            size (int): Window length; must be greater than 0
+            step (int): Distance between window starts; must be greater than 0
+
+        Returns:
+            list: GC fraction of the windows starting at 0, step, 2*step, ...
+
+        Raises:
+            ValueError: If size or step is not greater than 0
+
+        Outsource:
+        - docstrings
+        """
+        if size <= 0 or step <= 0:
+            raise ValueError("Window size and step must be greater than 0.")
+        if size > self.length:
+            return []
+        g, c = self._bits["G"], self._bits["C"]
+        marks = (int.from_bytes(g, "little") | int.from_bytes(c, "little")).to_bytes(len(g), "little")
+        prefix = array("I", accumulate(b"".join(map(_EXPANDED.__getitem__, marks))[:self.length], initial=0))
+        return [(prefix[i + size] - prefix[i]) / size for i in range(0, self.length - size + 1, step)]
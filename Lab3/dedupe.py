@@ -0,0 +1,330 @@
+from array import array
+from hashlib import blake2b
+from operator import eq
+
+from kmers import HASH_MASK, alphabet_codes, rolling_hashes
+
+NUCLEOTIDE_K = 16
+PROTEIN_K = 5
+_GOLDEN = 0x9E3779B97F4A7C15
+_ALPHABETS = {}
+
+
+class Cluster:
+    """
+    A group of equal or near-equal sequences.
+
+    Only identifiers are kept, never the sequence objects, so a cluster
+    does not keep its sequences' data alive.
+
+    Attributes:
+        identifier (str): Identifier of the representative, the first sequence added
+        members (list): Identifiers of every sequence in the cluster, representative
+            first; None when members are not kept
+        size (int): Number of sequences in the cluster
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("identifier", "members", "size", "_sketch")
+
+    def __init__(self, representative, keep_members: bool = True, sketch=None):
+        """Start a cluster with its representative sequence."""
+        self.identifier = representative.identifier
+        self.members = [representative.identifier] if keep_members else None
+        self.size = 1
+        self._sketch = sketch
+
+    def _add(self, sequence):
+        """Count a sequence as a member."""
+        self.size += 1
+        if self.members is not None:
+            self.members.append(sequence.identifier)
+
+    def __len__(self):
+        """Return the number of sequences in the cluster."""
+        return self.size
+
+    def __repr__(self):
+        """Return the representative identifier and size."""
+        return f"Cluster({self.identifier!r}, size={self.size})"
+
+
+def _content_key(sequence):
+    """Return a 16-byte digest of the sequence type and data (the exact-duplicate key)."""
+    digest = blake2b(type(sequence).__name__.encode("ascii"), digest_size=16)
+    digest.update(b"\0")
+    digest.update(sequence.data.encode("ascii"))
+    return digest.digest()
+
+
+def dedupe_exact(sequences):
+    """
+    Yield the first sequence of every distinct content, lazily.
+
+    Only a 16-byte digest is kept per distinct sequence, so memory does not
+    depend on sequence length. Sequences of different types never match.
+
+    Args:
+        sequences (iterable): Sequence objects (e.g. DNASequence, ProteinSequence)
+
+    Yields:
+        Sequence objects whose data was not seen before
+
+    Outsource:
+    - docstrings
+    """
+    seen = set()
+    for sequence in sequences:
+        key = _content_key(sequence)
+        if key not in seen:
+            seen.add(key)
+            yield sequence
+
+
+def cluster_exact(sequences, keep_members: bool = True):
+    """
+    Group identical sequences.
+
+    Args:
+        sequences (iterable): Sequence objects
+        keep_members (bool): Record member identifiers (default: True)
+
+    Returns:
+        list: Cluster objects in order of first appearance
+
+    Outsource:
+    - docstrings
+    """
+    clusters = {}
+    for sequence in sequences:
+        key = _content_key(sequence)
+        cluster = clusters.get(key)
+        if cluster is None:
+            clusters[key] = Cluster(sequence, keep_members)
+        else:
+            cluster._add(sequence)
+    return list(clusters.values())
+
+
+def _alphabet(sequence_class):
+    """Return the (translation table, bits per symbol) of a sequence class, cached."""
+    codes = _ALPHABETS.get(sequence_class)
+    if codes is None:
+        table, bits, _ = alphabet_codes("".join(sorted(sequence_class.valid_chars)))
+        codes = _ALPHABETS[sequence_class] = (table, bits)
+    return codes
+
+
+def minhash_sketch(data: str, k: int, table: bytes, bits: int, size: int):
+    """
+    Compute a one-permutation MinHash sketch of the k-mer set of `data`.
+
+    Every distinct k-mer is hashed once; the hash picks one of `size` bins
+    and each bin keeps its minimum, which costs one hash per k-mer instead
+    of `size`. Empty bins borrow the value of the next non-empty bin
+    (densification), so the fraction of equal bins of two sketches
+    estimates the Jaccard similarity of their k-mer sets.
+
+    Args:
+        data (str): Sequence data
+        k (int): K-mer length
+        table (bytes): Symbol translation table from kmers.alphabet_codes
+        bits (int): Bits per symbol; bits * k must not exceed 64
+        size (int): Number of bins
+
+    Returns:
+        array: `size` unsigned 64-bit values, or None if data has no k-mer
+
+    Outsource:
+    - docstrings
+    """
+    empty = HASH_MASK + 1
+    bins = [empty] * size
+    for value in set(rolling_hashes(data, k, table, bits)):
+        value = value * _GOLDEN & HASH_MASK
+        value ^= value >> 32
+        slot = (value * size) >> 64
+        if value < bins[slot]:
+            bins[slot] = value
+    filled = [slot for slot in range(size) if bins[slot] != empty]
+    if not filled:
+        return None
+    if len(filled) < size:
+        sketch = list(bins)
+        for slot in range(size):
+            if bins[slot] == empty:
+                distance = 1
+                while bins[(slot + distance) % size] == empty:
+                    distance += 1
+                sketch[slot] = bins[(slot + distance) % size] ^ (distance * _GOLDEN & HASH_MASK)
+        bins = sketch
+    return array("Q", bins)
+
+
+def estimate_similarity(first, second):
+    """Return the fraction of equal bins of two sketches (estimated Jaccard similarity)."""
+    return sum(map(eq, first, second)) / len(first)
+
+
+class MinHashClusterer:
+    """
+    Streaming near-duplicate clustering with MinHash sketches and LSH.
+
+    Each sequence is sketched and its sketch split into bands; every
+    cluster representative sharing a band with it is a candidate (a band
+    bucket lists all of them), and the sequence joins the most similar
+    candidate at or above the threshold, or starts a new cluster (greedy leader clustering). Exact duplicates
+    of a representative are matched by content digest without sketching.
+    No sequence objects are kept: per cluster the clusterer stores the
+    representative's identifier, its 16-byte content digest, its sketch
+    (sketch_size 64-bit values) and one bucket entry per band, so memory is
+    O(clusters * (sketch_size + bands)) whatever the sequence lengths.
+    Member identifiers add one string per sequence added; pass
+    keep_members=False to drop them and keep that bound.
+
+    Attributes:
+        threshold (float): Minimum estimated Jaccard similarity to join a cluster
+        clusters (list): Cluster objects in order of creation
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, threshold: float = 0.8, sketch_size: int = 64, bands: int = 16,
+                 k: int = None, keep_members: bool = True):
+        """
+        Initialize an empty clusterer.
+
+        Args:
+            threshold (float): Minimum estimated Jaccard similarity, between 0 and 1
+            sketch_size (int): Bins per sketch; must be a multiple of bands
+            bands (int): LSH bands; more bands find less similar candidates
+            k (int): K-mer length; defaults to 16 for DNA/RNA and 5 for proteins
+            keep_members (bool): Record member identifiers (default: True)
+
+        Raises:
+            ValueError: If threshold is outside [0, 1], the sketch does not split into
+                bands, or k is not greater than 0
+
+        Outsource:
+        - docstrings
+        """
+        if not 0 <= threshold <= 1:
+            raise ValueError("Threshold must be between 0 and 1.")
+        if bands <= 0 or sketch_size <= 0 or sketch_size % bands:
+            raise ValueError("Sketch size must be a positive multiple of the number of bands.")
+        if k is not None and k <= 0:
+            raise ValueError("k must be greater than 0")
+        self.threshold = threshold
+        self.clusters = []
+        self._size = sketch_size
+        self._bands = bands
+        self._rows = sketch_size // bands
+        self._k = k
+        self._keep_members = keep_members
+        self._exact = {}
+        self._buckets = [{} for _ in range(bands)]
+
+    def _sketch(self, sequence):
+        """
+        Return the sketch of a sequence, or None if it is shorter than k.
+
+        Raises:
+            ValueError: If k is too large for 64-bit k-mer hashes of this sequence type
+
+        Outsource:
+        - docstrings
+        """
+        table, bits = _alphabet(type(sequence))
+        k = self._k or (NUCLEOTIDE_K if bits == 2 else PROTEIN_K)
+        if bits * k > 64:
+            raise ValueError(f"k must be at most {64 // bits} for {type(sequence).__name__}.")
+        return minhash_sketch(sequence.data, k, table, bits, self._size)
+
+    def add(self, sequence):
+        """
+        Assign a sequence to a cluster.
+
+        Args:
+            sequence: Sequence object (DNA, RNA or protein)
+
+        Returns:
+            Cluster: The cluster the sequence joined or started
+
+        Raises:
+            ValueError: If k is too large for this sequence type
+
+        Outsource:
+        - docstrings
+        """
+        key = _content_key(sequence)
+        cluster = self._exact.get(key)
+        if cluster is not None:
+            cluster._add(sequence)
+            return cluster
+        sketch = self._sketch(sequence)
+        kind = type(sequence).__name__
+        best, best_similarity = None, -1.0
+        band_keys = []
+        if sketch is not None:
+            rows = self._rows
+            candidates = set()
+            for band, buckets in enumerate(self._buckets):
+                band_key = hash((kind, tuple(sketch[band * rows:(band + 1) * rows])))
+                band_keys.append(band_key)
+                bucket = buckets.get(band_key)
+                if bucket is not None:
+                    candidates.update(bucket)
+            for candidate in candidates:
+                cluster = self.clusters[candidate]
+                similarity = estimate_similarity(sketch, cluster._sketch)
+                if similarity >= self.threshold and similarity > best_similarity:
+                    best, best_similarity = cluster, similarity
+        if best is not None:
+            best._add(sequence)
+            return best
+        cluster = Cluster(sequence, self._keep_members, sketch)
+        index = len(self.clusters)
+        self.clusters.append(cluster)
+        self._exact[key] = cluster
+        for buckets, band_key in zip(self._buckets, band_keys):
+            bucket = buckets.get(band_key)
+            if bucket is None:
+                buckets[band_key] = [index]
+            else:
+                bucket.append(index)
+        return cluster
+
+    def update(self, sequences):
+        """Add every sequence of an iterable."""
+        for sequence in sequences:
+            self.add(sequence)
+
+    def representatives(self):
+        """Return the representative identifier of every cluster, in order of creation."""
+        return [cluster.identifier for cluster in self.clusters]
+
+
+def cluster_minhash(sequences, threshold: float = 0.8, sketch_size: int = 64, bands: int = 16,
+                    k: int = None, keep_members: bool = True):
+    """
+    Cluster near-identical sequences (see MinHashClusterer).
+
+    Args:
+        sequences (iterable): Sequence objects
+        threshold (float): Minimum estimated Jaccard similarity of k-mer sets
+        sketch_size (int): Bins per MinHash sketch
+        bands (int): LSH bands
+        k (int): K-mer length; defaults to 16 for DNA/RNA and 5 for proteins
+        keep_members (bool): Record member identifiers (default: True)
+
+    Returns:
+        list: Cluster objects in order of creation
+
+    Outsource:
+    - docstrings
+    """
+    clusterer = MinHashClusterer(threshold, sketch_size, bands, k, keep_members)
+    clusterer.update(sequences)
+    return clusterer.clusters
@@ -1,3 +1,8 @@
+import time
+from bisect import bisect_right
+from itertools import chain
+
+
 class Patient:
     """
     Represents a patient in a hospital.
@@ -11,6 +16,9 @@ class Patient:
         id (int): The unique patient identifier.
         diagnosis (str): The patient's medical diagnosis.
         admitted (bool): Whether the patient is currently admitted. Defaults to False.
+        stays (list): Completed stays as (admitted_at, discharged_at) tuples in time order,
+            recorded by admit() and discharge(). A shared empty tuple until the first
+            stay, so patients without stays allocate no list.
 
     Outsource:
     - docstrings 
@@ -35,31 +43,99 @@ class Patient:
         self.id = id
         self.diagnosis = diagnosis
         self.admitted = admitted 
+        self.stays = ()
+        self._admitted_at = None
 
-    def admit(self):
+    def admit(self, at: float = None):
         """
         Admit the patient to the hospital.
         
         Sets the patient's admission status to True, indicating they are
-        currently admitted to the hospital.
+        currently admitted to the hospital, and opens a stay starting at `at`.
+        Admitting an already admitted patient changes nothing.
+
+        Args:
+            at (float, optional): Admission time, e.g. a POSIX timestamp. Defaults to now.
+
+        Raises:
+            ValueError: If the admission time is before the end of the previous stay.
 
         Outsource:
         - docstrings
         """
+        if self.admitted:
+            return
+        if at is None:
+            at = time.time()
+        if self.stays and at < self.stays[-1][1]:
+            raise ValueError("Admission time is before the previous discharge.")
+        self._admitted_at = at
         self.admitted = True
 
-    def discharge(self):
+    def discharge(self, at: float = None):
         """
         Discharge the patient from the hospital.
         
         Sets the patient's admission status to False, indicating they are
-        no longer admitted to the hospital.
+        no longer admitted to the hospital, and records the stay opened by
+        admit(). Patients created with admitted=True have no recorded start,
+        so their first stay is not recorded.
+
+        Args:
+            at (float, optional): Discharge time, e.g. a POSIX timestamp. Defaults to now.
+
+        Raises:
+            ValueError: If the discharge time is before the admission time.
 
         Outsource:
         - docstrings
         """
+        if self.admitted and self._admitted_at is not None:
+            if at is None:
+                at = time.time()
+            if at < self._admitted_at:
+                raise ValueError("Discharge time is before the admission time.")
+            if self.stays:
+                self.stays.append((self._admitted_at, at))
+            else:
+                self.stays = [(self._admitted_at, at)]
+        self._admitted_at = None
         self.admitted = False
 
+    def admission_history(self):
+        """
+        Return every recorded stay, including the current one.
+
+        Returns:
+            list: (admitted_at, discharged_at) tuples in time order; discharged_at is None
+                for the stay in progress.
+
+        Outsource:
+        - docstrings
+        """
+        history = list(self.stays)
+        if self.admitted and self._admitted_at is not None:
+            history.append((self._admitted_at, None))
+        return history
+
+    def was_admitted_at(self, at: float):
+        """
+        Check whether the patient was admitted at a given time (stays are half-open).
+
+        Args:
+            at (float): Time to check.
+
+        Returns:
+            bool: True if a recorded stay covers `at`.
+
+        Outsource:
+        - docstrings
+        """
+        if self.admitted and self._admitted_at is not None and at >= self._admitted_at:
+            return True
+        index = bisect_right(self.stays, (at, float("inf"))) - 1
+        return index >= 0 and at < self.stays[index][1]
+
     def __str__(self):
         """
         Return a string representation of the patient.
@@ -70,8 +146,28 @@ class Patient:
         Outsource:
         - docstrings
         """
+        return "".join(self._report_parts())
+
+    def _report_parts(self):
+        """Return the pieces of the text report returned by __str__."""
         status = "Admitted" if self.admitted else "Not Admitted"
-        return f"Patient ID: {self.id}\nName: {self.name}\nDate of Birth: {self.dob}\nDiagnosis: {self.diagnosis}\nStatus: {status}"
-    
+        return ("Patient ID: ", str(self.id), "\nName: ", str(self.name), "\nDate of Birth: ", str(self.dob),
+                "\nDiagnosis: ", str(self.diagnosis), "\nStatus: ", status)
 
 
+def write_patient_reports(patients, handle):
+    """
+    Write the text report of every patient to an open text file.
+    
+    Reports are the same as str(patient), each followed by a blank line,
+    and are streamed to the file with writelines instead of being joined
+    into one large string.
+    
+    Args:
+        patients (iterable): Patient objects.
+        handle: Open text file (or any object with a writelines method).
+
+    Outsource:
+    - docstrings
+    """
+    handle.writelines(chain.from_iterable(patient._report_parts() + ("\n\n",) for patient in patients))
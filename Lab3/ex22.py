@@ -1,4 +1,5 @@
-from ex2 import Patient 
+from ex2 import Patient, write_patient_reports
+from instrument import instrumented
 
 class Hospital:
     """
@@ -7,17 +8,23 @@ class Hospital:
     Attributes:
         name (str): The name of the hospital.
         patients (list): A list of Patient objects currently in the hospital.
+        keep_discharged (bool): Whether discharge_patient() keeps the patients it removes.
+        discharged (dict): Patients removed by discharge_patient(), by ID, so their stays
+            stay in the admission history. Only filled when keep_discharged is set.
 
     Outsource:
     - docstrings
     """
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, keep_discharged: bool = False):
         """
         Initialize a Hospital object.
         
         Args:
             name (str): The name of the hospital. Must not be empty or None.
+            keep_discharged (bool, optional): Keep discharged patients for
+                admission_index(). Defaults to False, so discharged patients are
+                released as before.
         
         Raises:
             ValueError: If the hospital name is empty or None.
@@ -29,7 +36,10 @@ class Hospital:
             raise ValueError(" Name must be written.")
         self.name = name
         self.patients = []
+        self.keep_discharged = keep_discharged
+        self.discharged = {}
 
+    @instrumented("Hospital.add_patient")
     def add_patient(self, patient_id:int):
         """
         Add a patient to the hospital.
@@ -47,10 +57,15 @@ class Hospital:
             raise ValueError("Invalid patient.")
         self.patients.append(patient_id)
 
+    @instrumented("Hospital.discharge_patient")
     def discharge_patient(self, patient_id: int):
         """
         Discharge a patient from the hospital by their ID.
         
+        Only removes the patient from the hospital; the patient's admission
+        status and stays are left to Patient.discharge. With keep_discharged,
+        the patient is also kept in `discharged`.
+        
         Args:
             patient_id (int): The ID of the patient to be discharged.
         
@@ -64,6 +79,8 @@ class Hospital:
         for patient in self.patients:
             if patient.id == patient_id:
                 self.patients.remove(patient)
+                if self.keep_discharged:
+                    self.discharged[patient_id] = patient
                 return f"Patient {patient_id} is discharged."
         return f"Patient {patient_id} not found."
 
@@ -82,6 +99,54 @@ class Hospital:
             if patient.admitted:
                 admitted_patients.append(patient)
         return admitted_patients
-    
 
-    
+    def admission_index(self):
+        """
+        Build an interval index over the stays of current and kept discharged patients.
+        
+        Returns:
+            AdmissionIndex: Index answering census(t), occupancy(t1, t2) and admitted_at(t)
+                in logarithmic time; build a new one after further admissions.
+        
+        Outsource:
+        - docstrings
+        """
+        from admissions import AdmissionIndex
+        patients = {id(patient): patient for patient in self.discharged.values()}
+        patients.update((id(patient), patient) for patient in self.patients)
+        return AdmissionIndex((patient, start, end)
+                              for patient in patients.values()
+                              for start, end in patient.admission_history())
+
+    def export_columns(self, path: str, format: str = None):
+        """
+        Write the patients to a columnar file for analytics (see columnar.py).
+        
+        Args:
+            path (str): Output file path
+            format (str, optional): "arrow", "parquet", "npz" or "native". Defaults to the
+                best format available (Arrow if pyarrow is installed).
+        
+        Returns:
+            str: The format written; read the file back with columnar.read_hospital.
+        
+        Outsource:
+        - docstrings
+        """
+        from columnar import export_hospital
+        return export_hospital(self, path, format)
+
+    def write_report(self, handle, admitted_only: bool = False):
+        """
+        Write the report of every patient (as str(patient)) to an open text file.
+        
+        The reports are streamed with writelines rather than built as one string.
+        
+        Args:
+            handle: Open text file (or any object with a writelines method)
+            admitted_only (bool, optional): Only report admitted patients. Defaults to False.
+        
+        Outsource:
+        - docstrings
+        """
+        write_patient_reports(self.get_patient_list() if admitted_only else self.patients, handle)
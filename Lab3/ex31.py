@@ -1,7 +1,64 @@
-from ex32 import RNASequence
+from base_sequence import BaseSequence
+from instrument import instrumented
 
 
-class DNASequence:
+COMPLEMENT_MAP = str.maketrans("ATGC", "TACG")
+_DNA_CODON_TABLE = None
+
+
+def _dna_codon_table():
+    """Build the DNA codon table from ex32.CODON_TABLE on first use."""
+    global _DNA_CODON_TABLE
+    if _DNA_CODON_TABLE is None:
+        from ex32 import CODON_TABLE
+        _DNA_CODON_TABLE = {codon.replace("U", "T"): amino_acid for codon, amino_acid in CODON_TABLE.items()}
+    return _DNA_CODON_TABLE
+
+
+def __getattr__(name: str):
+    """Provide DNA_CODON_TABLE lazily, so importing ex31 does not import ex32 (PEP 562)."""
+    if name == "DNA_CODON_TABLE":
+        return _dna_codon_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def translate_dna(data: str):
+    """
+    Translate DNA coding-strand data directly, as if it had been transcribed first.
+    
+    Gives the same result as translate_rna(data.replace("T", "U")) without
+    building the intermediate RNA string.
+    
+    Args:
+        data (str): Uppercase DNA sequence string
+    
+    Returns:
+        str: Amino acid string, with '?' for unknown codons, stopping at the first stop codon
+    
+    Outsource:
+    - docstrings
+    """
+    codon_table = _dna_codon_table()
+    protein = []
+    for i in range(0, len(data) - 2, 3):
+        amino_acid = codon_table.get(data[i:i + 3], '?')
+        if amino_acid == '*':
+            break
+        protein.append(amino_acid)
+    return "".join(protein)
+
+
+def _complement_data(data: str):
+    """Return the base-wise complement of DNA data."""
+    return data.translate(COMPLEMENT_MAP)
+
+
+def _transcribe_data(data: str):
+    """Return DNA data with T replaced by U."""
+    return data.replace("T", "U")
+
+
+class DNASequence(BaseSequence):
     """
     Represents a DNA sequence with methods for manipulation and analysis.
     
@@ -20,102 +77,228 @@ class DNASequence:
     - docstrings
     """
     valid_chars = {'A', 'T', 'G', 'C'}
+    packing_alphabet = "ACGT"
+    invalid_value_message = "Invalid base for mutation, must be one of A, T, G, C."
+    position_message = "Position out of range, my gene"
+
+    @classmethod
+    def _invalid_data_message(cls, invalid_chars):
+        """Return the ValueError message for invalid DNA data."""
+        return "DNA sequence can only contain A, T, G, C characters."
 
-    def __init__(self, identifier: str, data: str):
+    def _clear_caches(self):
+        """Drop the composition index and motif searcher."""
+        self._composition = None
+        self._motif_search = None
+
+    @instrumented("{cls}.find_motif")
+    def find_motif(self, motif: str, both_strands: bool = False):
         """
-        Initialize a DNA sequence.
+        Find all occurrences of a motif sequence within the DNA sequence.
+        
+        With `both_strands`, the reverse strand is searched too. Instead of
+        building the reverse complement of the whole sequence, the motif's
+        reverse complement is searched on the forward strand; a hit there is
+        a motif occurrence on the reverse strand covering the same bases.
         
         Args:
-            identifier (str): Unique identifier for the sequence
-            data (str): DNA sequence string (case-insensitive, will be converted to uppercase)
+            motif (str): Sequence pattern to search for (case-insensitive)
+            both_strands (bool): Also search the reverse strand (default: False)
+        
+        Returns:
+            list: List of 0-based positions where the motif starts, empty list if not found.
+                With `both_strands`, a list of (position, strand) tuples sorted by position,
+                where strand is "+" or "-" and position is the leftmost forward-strand
+                coordinate of the hit
         
-        Raises:
-            ValueError: If data contains characters other than A, T, G, C
-
         Outsource:
         - docstrings
+        - lines: 112, 113
         """
-        self.identifier = identifier
-        self.data = data.upper()
-        if not all(char in self.valid_chars for char in self.data):
-            raise ValueError("DNA sequence can only contain A, T, G, C characters.")
+        motif = motif.upper()
+        if not both_strands:
+            return self._motif_positions(motif)
+        data = self.data
+        reverse_motif = motif.translate(COMPLEMENT_MAP)[::-1]
+        hits = [(position, "+") for position in self._motif_positions(motif, data)]
+        hits += [(position, "-") for position in self._motif_positions(reverse_motif, data)]
+        hits.sort()
+        return hits
+    
+    def find_motif_approx(self, motif: str, max_errors: int, indels: bool = False):
+        """
+        Find approximate occurrences of a motif within the DNA sequence.
+        
+        The motif may contain IUPAC degenerate bases (e.g. N, R, Y).
+        Matching is bit-parallel and linear in the sequence length.
+        
+        Args:
+            motif (str): Sequence pattern to search for (case-insensitive)
+            max_errors (int): Maximum number of mismatches (or edits with `indels`)
+            indels (bool): Also allow insertions and deletions (default: False)
+        
+        Returns:
+            list: Without `indels`, (start, mismatches) tuples for every matching window.
+                With `indels`, (end, distance) tuples where end is the 0-based position
+                just after the last matched base
+        
+        Raises:
+            ValueError: If motif is empty or max_errors is not between 0 and len(motif) - 1
         
-    def __len__(self):
+        Outsource:
+        - docstrings
         """
-        Return the length of the DNA sequence.
+        import approx_search
+        motif = motif.upper()
+        if indels:
+            return approx_search.myers_search(self.data, motif, max_errors, approx_search.IUPAC_DNA)
+        return approx_search.hamming_search(self.data, motif, max_errors, approx_search.IUPAC_DNA)
+
+    def align(self, other, mode: str = "global", gap_open: int = 10, gap_extend: int = 1):
+        """
+        Align this DNA sequence with another one.
+        
+        Uses affine gap penalties: a gap of length L costs gap_open + (L - 1) * gap_extend.
+        Base pairs score +5 for a match and -4 for a mismatch.
+        
+        Args:
+            other (DNASequence): Sequence to align against
+            mode (str): "global" (Needleman-Wunsch) or "local" (Smith-Waterman)
+            gap_open (int): Penalty of the first position of a gap
+            gap_extend (int): Penalty of every further position of a gap
         
         Returns:
-            int: Number of nucleotides in the sequence
+            Alignment: Optimal alignment with score, gapped strings and coordinates
+        
+        Raises:
+            ValueError: If mode is not "global" or "local", or gap_extend is not between 0 and gap_open
+        
+        Outsource:
+        - docstrings
+        """
+        import alignment
+        return alignment.align(self.data, other.data, alignment.DNA_MATRIX, mode, gap_open, gap_extend)
 
+    def find_orfs(self, min_length: int = 75):
+        """
+        Find the open reading frames of the DNA sequence in all six frames.
+        
+        Start and stop codons of both strands are located in one scan, and
+        ORFs are yielded lazily, so whole genomes can be annotated without
+        translating every frame.
+        
+        Args:
+            min_length (int): Minimum ORF length in bases, stop codon included (default: 75)
+        
+        Returns:
+            generator: (start, end, frame) tuples with 0-based forward-strand coordinates
+                (end exclusive) and frame +1..+3 or -1..-3; see orf.find_orfs
+        
+        Raises:
+            ValueError: If min_length is negative
+        
         Outsource:
         - docstrings
         """
-        return len(self.data)
+        import orf
+        if min_length < 0:
+            raise ValueError("Minimum ORF length must not be negative.")
+        return orf.find_orfs(self.data, min_length, "T")
 
-    def __str__(self):
+    def kmer_counts(self, k: int):
         """
-        Return a formatted string representation of the DNA sequence.
+        Count all overlapping k-mers of the DNA sequence.
+        
+        Uses a rolling hash over the sequence, so no substring is allocated
+        per window.
+        
+        Args:
+            k (int): K-mer length; must be greater than 0
         
         Returns:
-            str: Sequence in FASTA format (identifier on first line, sequence on second line)
+            dict: Mapping of k-mer string to number of occurrences
+        
+        Raises:
+            ValueError: If k is not greater than 0
+        
+        Outsource:
+        - docstrings
+        """
+        import kmers
+        return kmers.kmer_counts(self.data, k, "ACGT")
 
+    def _composition_index(self):
+        """
+        Return the cached CompositionIndex, building it on first use (_clear_caches drops it).
+        
         Outsource:
         - docstrings
         """
-        return f">{self.identifier}\n{self.data}"
-    
-    def mutate(self, position: int, value: str):
+        from composition import CompositionIndex
+        if self._composition is None:
+            self._composition = CompositionIndex(self.data, "ACGT")
+        return self._composition
+
+    def base_counts(self, start: int = 0, end: int = None):
         """
-        Replace a nucleotide at a specific position with a new base.
+        Count each base of the DNA sequence, optionally within a region.
+        
+        Counts come from cumulative arrays built once and cached until the
+        sequence is mutated, so every query after the first is O(1).
         
         Args:
-            position (int): 0-based index of the nucleotide to replace
-            value (str): New base (A, T, G, or C - case-insensitive)
+            start (int): 0-based start of the region (inclusive)
+            end (int): 0-based end of the region (exclusive), defaults to the sequence end
+        
+        Returns:
+            dict: Mapping of base to number of occurrences
         
         Raises:
-            ValueError: If value is not a valid DNA base
-            IndexError: If position is out of range
+            IndexError: If the region lies outside the sequence
         
         Outsource:
         - docstrings
-        - lines: 85, 87, 88
         """
-        if value.upper() not in self.valid_chars:
-            raise ValueError("Invalid base for mutation, must be one of A, T, G, C.")
-        if not (0 <= position < len(self.data)):
-            raise IndexError("Position out of range, my gene")
-        before = self.data[:position]       
-        after = self.data[position + 1:]    
-        new_base = value.upper()            
-        self.data = before + new_base + after
+        return self._composition_index().counts(start, end)
 
-    def find_motif(self, motif: str):
+    def gc_content(self, start: int = 0, end: int = None):
         """
-        Find all occurrences of a motif sequence within the DNA sequence.
+        Return the fraction of G and C bases, optionally within a region.
         
         Args:
-            motif (str): Sequence pattern to search for (case-insensitive)
+            start (int): 0-based start of the region (inclusive)
+            end (int): 0-based end of the region (exclusive), defaults to the sequence end
         
         Returns:
-            list: List of 0-based positions where the motif starts, empty list if not found
+            float: GC fraction between 0 and 1 (0.0 for an empty region)
+        
+        Raises:
+            IndexError: If the region lies outside the sequence
         
         Outsource:
         - docstrings
-        - lines: 112, 113
         """
-        motif = motif.upper()
-        positions = []                                
-        seq_length = len(self.data)
-        motif_length = len(motif)
-        search_limit = seq_length - motif_length + 1
+        return self._composition_index().gc_content(start, end)
 
-        for i in range(search_limit):
-            fragment = self.data[i:i + motif_length]
-            if fragment == motif:
-                positions.append(i)
+    def window_profile(self, size: int, step: int = 1):
+        """
+        Compute the GC content of sliding windows along the sequence.
+        
+        Args:
+            size (int): Window length; must be greater than 0
+            step (int): Distance between window starts; must be greater than 0
+        
+        Returns:
+            list: GC fraction of each window, in order of window start
+        
+        Raises:
+            ValueError: If size or step is not greater than 0
+        
+        Outsource:
+        - docstrings
+        """
+        return self._composition_index().window_profile(size, step)
 
-        return positions
-    
     def complement(self):
         """
         Generate the complementary DNA strand.
@@ -133,16 +316,29 @@ class DNASequence:
         - docstrings
         - lines: 138, 139
         """
-        bases = "ATGC"
-        complements = "TACG"
-        comp_map = str.maketrans(bases, complements)
-        comp_data = self.data.translate(comp_map)
+        from product_cache import default_cache
+        comp_data = default_cache.get_or_compute("dna_complement", self.data, _complement_data)
         new_identifier = self.identifier + "_comp"
-        complementary_seq = DNASequence(new_identifier, comp_data)
+        complementary_seq = DNASequence._from_valid(new_identifier, comp_data)
 
         return complementary_seq
 
+    def reverse_complement(self):
+        """
+        Generate the reverse complement, i.e. the opposite strand read 5' to 3'.
+        
+        Returns:
+            DNASequence: New DNASequence object with the reverse complement and "_revcomp"
+                suffix in identifier
+        
+        Outsource:
+        - docstrings
+        """
+        revcomp_data = self.data.translate(COMPLEMENT_MAP)[::-1]
+        new_identifier = self.identifier + "_revcomp"
+        return DNASequence._from_valid(new_identifier, revcomp_data)
 
+    @instrumented("DNASequence.transcribe")
     def transcribe(self):
         """
         Transcribe DNA to RNA by replacing thymine (T) with uracil (U).
@@ -156,9 +352,10 @@ class DNASequence:
         Outsource:
         - docstrings
         """
-        dna_data = self.data
-        rna_data = dna_data.replace("T", "U")
+        from product_cache import default_cache
+        from ex32 import RNASequence
+        rna_data = default_cache.get_or_compute("transcribe", self.data, _transcribe_data)
         new_identifier = self.identifier + "_RNA"
-        rna_seq = RNASequence(new_identifier, rna_data)
+        rna_seq = RNASequence._from_valid(new_identifier, rna_data)
 
         return rna_seq
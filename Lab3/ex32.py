@@ -1,7 +1,45 @@
-from ex33 import ProteinSequence
+from base_sequence import BaseSequence
+from instrument import instrumented
 
 
-class RNASequence:
+COMPLEMENT_MAP = str.maketrans("AUGC", "UACG")
+CODON_TABLE = {
+    'AUG': 'M',
+    'UUU': 'F', 'UUC': 'F',
+    'UUA': 'L', 'UUG': 'L',
+    'UAA': '*', 'UAG': '*', 'UGA': '*',
+    'UGG': 'W', 'GCC': 'A', 'GAA': 'E', 'UAC': 'Y', 'UGC': 'C'
+}
+
+
+def translate_rna(data: str):
+    """
+    Translate RNA data codon by codon until the first stop codon.
+    
+    Args:
+        data (str): Uppercase RNA sequence string
+    
+    Returns:
+        str: Amino acid string, with '?' for codons missing from CODON_TABLE
+    
+    Outsource:
+    - docstrings
+    """
+    protein = []
+    for i in range(0, len(data) - 2, 3):
+        amino_acid = CODON_TABLE.get(data[i:i + 3], '?')
+        if amino_acid == '*':
+            break
+        protein.append(amino_acid)
+    return "".join(protein)
+
+
+def _complement_data(data: str):
+    """Return the base-wise complement of RNA data."""
+    return data.translate(COMPLEMENT_MAP)
+
+
+class RNASequence(BaseSequence):
     """
     Represents an RNA sequence with methods for manipulation and analysis.
     
@@ -20,100 +58,192 @@ class RNASequence:
     - docstrings
     """
     valid_chars = {'A', 'U', 'G', 'C'}
+    packing_alphabet = "ACGU"
+    invalid_value_message = "Invalid base — must be one of A, U, G, C."
+
+    @classmethod
+    def _invalid_data_message(cls, invalid_chars):
+        """Return the ValueError message for invalid RNA data."""
+        return f"Invalid RNA sequence — contains: {invalid_chars}"
 
-    def __init__(self, identifier: str, data: str):
+    def _clear_caches(self):
+        """Drop the composition index and motif searcher."""
+        self._composition = None
+        self._motif_search = None
+
+    def find_motif_approx(self, motif: str, max_errors: int, indels: bool = False):
         """
-        Initialize an RNA sequence.
+        Find approximate occurrences of a motif within the RNA sequence.
+        
+        The motif may contain IUPAC degenerate bases (e.g. N, R, Y).
+        Matching is bit-parallel and linear in the sequence length.
         
         Args:
-            identifier (str): Unique identifier for the sequence
-            data (str): RNA sequence string (case-insensitive, will be converted to uppercase)
+            motif (str): Sequence pattern to search for (case-insensitive)
+            max_errors (int): Maximum number of mismatches (or edits with `indels`)
+            indels (bool): Also allow insertions and deletions (default: False)
+        
+        Returns:
+            list: Without `indels`, (start, mismatches) tuples for every matching window.
+                With `indels`, (end, distance) tuples where end is the 0-based position
+                just after the last matched base
         
         Raises:
-            ValueError: If data contains characters other than A, U, G, C
+            ValueError: If motif is empty or max_errors is not between 0 and len(motif) - 1
         
         Outsource:
         - docstrings
         """
-        self.identifier = identifier
-        self.data = data.upper()
-        invalid_chars = set(self.data) - self.valid_chars
-        if invalid_chars:
-            raise ValueError(f"Invalid RNA sequence — contains: {invalid_chars}")
+        import approx_search
+        motif = motif.upper()
+        if indels:
+            return approx_search.myers_search(self.data, motif, max_errors, approx_search.IUPAC_RNA)
+        return approx_search.hamming_search(self.data, motif, max_errors, approx_search.IUPAC_RNA)
 
-    def __len__(self):
+    def align(self, other, mode: str = "global", gap_open: int = 10, gap_extend: int = 1):
         """
-        Return the length of the RNA sequence.
+        Align this RNA sequence with another one.
+        
+        Uses affine gap penalties: a gap of length L costs gap_open + (L - 1) * gap_extend.
+        Base pairs score +5 for a match and -4 for a mismatch.
+        
+        Args:
+            other (RNASequence): Sequence to align against
+            mode (str): "global" (Needleman-Wunsch) or "local" (Smith-Waterman)
+            gap_open (int): Penalty of the first position of a gap
+            gap_extend (int): Penalty of every further position of a gap
         
         Returns:
-            int: Number of nucleotides in the sequence
+            Alignment: Optimal alignment with score, gapped strings and coordinates
+        
+        Raises:
+            ValueError: If mode is not "global" or "local", or gap_extend is not between 0 and gap_open
+        
+        Outsource:
+        - docstrings
+        """
+        import alignment
+        return alignment.align(self.data, other.data, alignment.RNA_MATRIX, mode, gap_open, gap_extend)
 
+    def find_orfs(self, min_length: int = 75):
+        """
+        Find the open reading frames of the RNA sequence in all six frames.
+        
+        Start and stop codons of both strands are located in one scan, and
+        ORFs are yielded lazily, so whole genomes can be annotated without
+        translating every frame.
+        
+        Args:
+            min_length (int): Minimum ORF length in bases, stop codon included (default: 75)
+        
+        Returns:
+            generator: (start, end, frame) tuples with 0-based forward-strand coordinates
+                (end exclusive) and frame +1..+3 or -1..-3; see orf.find_orfs
+        
+        Raises:
+            ValueError: If min_length is negative
+        
+        Outsource:
+        - docstrings
+        """
+        import orf
+        if min_length < 0:
+            raise ValueError("Minimum ORF length must not be negative.")
+        return orf.find_orfs(self.data, min_length, "U")
+
+    def kmer_counts(self, k: int):
+        """
+        Count all overlapping k-mers of the RNA sequence.
+        
+        Uses a rolling hash over the sequence, so no substring is allocated
+        per window.
+        
+        Args:
+            k (int): K-mer length; must be greater than 0
+        
+        Returns:
+            dict: Mapping of k-mer string to number of occurrences
+        
+        Raises:
+            ValueError: If k is not greater than 0
+        
+        Outsource:
+        - docstrings
+        """
+        import kmers
+        return kmers.kmer_counts(self.data, k, "ACGU")
+
+    def _composition_index(self):
+        """
+        Return the cached CompositionIndex, building it on first use (_clear_caches drops it).
+        
         Outsource:
         - docstrings
         """
-        return len(self.data)
+        from composition import CompositionIndex
+        if self._composition is None:
+            self._composition = CompositionIndex(self.data, "ACGU")
+        return self._composition
 
-    def __str__(self):
+    def base_counts(self, start: int = 0, end: int = None):
         """
-        Return a formatted string representation of the RNA sequence.
+        Count each base of the RNA sequence, optionally within a region.
+        
+        Counts come from cumulative arrays built once and cached until the
+        sequence is mutated, so every query after the first is O(1).
+        
+        Args:
+            start (int): 0-based start of the region (inclusive)
+            end (int): 0-based end of the region (exclusive), defaults to the sequence end
         
         Returns:
-            str: Sequence in FASTA format (identifier on first line, sequence on second line)
+            dict: Mapping of base to number of occurrences
+        
+        Raises:
+            IndexError: If the region lies outside the sequence
         
         Outsource:
         - docstrings
         """
-        return f">{self.identifier}\n{self.data}"
+        return self._composition_index().counts(start, end)
 
-    def mutate(self, position: int, value: str):
+    def gc_content(self, start: int = 0, end: int = None):
         """
-        Replace a nucleotide at a specific position with a new base.
+        Return the fraction of G and C bases, optionally within a region.
         
         Args:
-            position (int): 0-based index of the nucleotide to replace
-            value (str): New base (A, U, G, or C - case-insensitive)
+            start (int): 0-based start of the region (inclusive)
+            end (int): 0-based end of the region (exclusive), defaults to the sequence end
+        
+        Returns:
+            float: GC fraction between 0 and 1 (0.0 for an empty region)
         
         Raises:
-            ValueError: If value is not a valid RNA base
-            IndexError: If position is out of range
+            IndexError: If the region lies outside the sequence
         
         Outsource:
         - docstrings
-        - lines: 86, 88,89
         """
-        if value.upper() not in self.valid_chars:
-            raise ValueError("Invalid base — must be one of A, U, G, C.")
-        if not (0 <= position < len(self.data)):
-            raise IndexError("Position out of range.")
-        before = self.data[:position]
-        after = self.data[position + 1:]
-        new_base = value.upper()
-        self.data = before + new_base + after
+        return self._composition_index().gc_content(start, end)
 
-    def find_motif(self, motif: str):
+    def window_profile(self, size: int, step: int = 1):
         """
-        Find all occurrences of a motif sequence within the RNA sequence.
+        Compute the GC content of sliding windows along the sequence.
         
         Args:
-            motif (str): Sequence pattern to search for (case-insensitive)
+            size (int): Window length; must be greater than 0
+            step (int): Distance between window starts; must be greater than 0
         
         Returns:
-            list: List of 0-based positions where the motif starts, empty list if not found
+            list: GC fraction of each window, in order of window start
+        
+        Raises:
+            ValueError: If size or step is not greater than 0
         
         Outsource:
         - docstrings
-        - lines: 111-113
         """
-        positions = []
-        seq_length = len(self.data)
-        motif = motif.upper()
-        motif_length = len(motif)
-        search_limit = seq_length - motif_length + 1
-        for i in range(search_limit):
-            fragment = self.data[i:i + motif_length]
-            if fragment == motif:
-                positions.append(i)
-        return positions
+        return self._composition_index().window_profile(size, step)
 
     def complement(self):
         """
@@ -132,15 +262,14 @@ class RNASequence:
         - docstrings
         - lines: 137, 138
         """
-        bases = "AUGC"
-        complements = "UACG"
-        comp_map = str.maketrans(bases, complements)
-        comp_data = self.data.translate(comp_map)
+        from product_cache import default_cache
+        comp_data = default_cache.get_or_compute("rna_complement", self.data, _complement_data)
         new_identifier = self.identifier + "_comp"
-        complementary_seq = RNASequence(new_identifier, comp_data)
+        complementary_seq = RNASequence._from_valid(new_identifier, comp_data)
 
         return complementary_seq
 
+    @instrumented("RNASequence.translate")
     def translate(self):
         """
         Translate the RNA sequence into a protein sequence using the genetic code.
@@ -158,22 +287,12 @@ class RNASequence:
         
         Outsource:
         - docstrings
-        - lines: codon_table (whole), for i in range... if amino_acid == '*': break
-        """
-        codon_table = {
-            'AUG': 'M',
-            'UUU': 'F', 'UUC': 'F',
-            'UUA': 'L', 'UUG': 'L',
-            'UAA': '*', 'UAG': '*', 'UGA': '*',
-            'UGG': 'W', 'GCC': 'A', 'GAA': 'E', 'UAC': 'Y', 'UGC': 'C'
-        }
-        protein = ""
-        seq_length = len(self.data)
-        for i in range(0, seq_length - 2, 3):
-            codon = self.data[i:i + 3]
-            amino_acid = codon_table.get(codon, '?')
-            if amino_acid == '*':
-                break
-            protein += amino_acid
+        - lines: CODON_TABLE (whole), translate_rna loop
+        """
+        from product_cache import default_cache
+        from ex33 import ProteinSequence
+        protein = default_cache.get_or_compute("translate", self.data, translate_rna)
         new_identifier = self.identifier + "_PROT"
-        return ProteinSequence(new_identifier, protein)
+        if "?" in protein:
+            return ProteinSequence(new_identifier, protein)
+        return ProteinSequence._from_valid(new_identifier, protein)
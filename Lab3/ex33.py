@@ -1,4 +1,7 @@
-class ProteinSequence:
+from base_sequence import BaseSequence
+
+
+class ProteinSequence(BaseSequence):
     """
     Represents a protein sequence with methods for manipulation and analysis.
     
@@ -17,97 +20,160 @@ class ProteinSequence:
     - docstrings
     """
     valid_chars = set("ACDEFGHIKLMNPQRSTVWY*")
+    invalid_value_message = "Invalid amino acid."
+
+    @classmethod
+    def _invalid_data_message(cls, invalid_chars):
+        """Return the ValueError message for invalid protein data."""
+        return f"Invalid protein sequence — contains: {invalid_chars}"
 
-    def __init__(self, identifier: str, data: str):
+    def _clear_caches(self):
+        """Drop the residue property tables and motif searcher."""
+        self._properties = None
+        self._motif_search = None
+
+    def _property_table(self):
         """
-        Initialize a protein sequence.
+        Return the cached ProteinProperties, recomputing them if `data` changed.
         
-        Args:
-            identifier (str): Unique identifier for the sequence
-            data (str): Protein sequence string (case-insensitive, will be converted to uppercase)
+        Outsource:
+        - docstrings
+        """
+        from protein_properties import ProteinProperties
+        if self._properties is None or self._properties.version != self._version:
+            self._properties = ProteinProperties(self.data, self._version)
+        return self._properties
+
+    def molecular_weight(self):
+        """
+        Calculate the average molecular weight of the protein.
         
-        Raises:
-            ValueError: If data contains invalid amino acid characters
+        Returns:
+            float: Molecular weight in daltons (0.0 for an empty sequence)
         
         Outsource:
         - docstrings
         """
-        self.identifier = identifier
-        self.data = data.upper()
-        invalid_chars = set(self.data) - self.valid_chars
-        if invalid_chars:
-            raise ValueError(f"Invalid protein sequence — contains: {invalid_chars}")
+        return self._property_table().molecular_weight()
 
-    def __len__(self):
+    def isoelectric_point(self):
         """
-        Return the length of the protein sequence.
+        Estimate the isoelectric point (pI) of the protein.
         
         Returns:
-            int: Number of amino acids in the sequence
+            float: pH at which the protein carries no net charge
         
         Outsource:
         - docstrings
         """
-        return len(self.data)
+        return self._property_table().isoelectric_point()
 
-    def __str__(self):
+    def aa_composition(self):
         """
-        Return a formatted string representation of the protein sequence.
+        Calculate the amino acid composition of the protein.
         
         Returns:
-            str: Sequence in FASTA format (identifier on first line, sequence on second line)
+            dict: Mapping of each of the 20 amino acids to its fraction of the sequence
         
         Outsource:
         - docstrings
         """
-        return f">{self.identifier}\n{self.data}"
+        return self._property_table().composition()
 
-    def mutate(self, position: int, value: str):
+    def hydrophobicity_profile(self, window: int = 9):
         """
-        Replace an amino acid at a specific position with a new residue.
+        Compute a sliding-window Kyte-Doolittle hydropathy profile.
         
         Args:
-            position (int): 0-based index of the amino acid to replace
-            value (str): New amino acid (single-letter code, case-insensitive)
+            window (int): Window length; must be greater than 0 (default: 9)
+        
+        Returns:
+            list: Mean hydropathy of each window, in order of window start
         
         Raises:
-            ValueError: If value is not a valid amino acid character
-            IndexError: If position is out of range
+            ValueError: If window is not greater than 0
         
         Outsource:
         - docstrings
-        - lines: 83, 85, 86
-        """
-        if value.upper() not in self.valid_chars:
-            raise ValueError("Invalid amino acid.")
-        if not (0 <= position < len(self.data)):
-            raise IndexError("Position out of range.")
-        before = self.data[:position]
-        after = self.data[position + 1:]
-        new_residue = value.upper()
-        self.data = before + new_residue + after
+        """
+        return self._property_table().hydropathy_profile(self.data, window)
 
-    def find_motif(self, motif: str):
+    def find_motif_approx(self, motif: str, max_errors: int, indels: bool = False):
         """
-        Find all occurrences of a motif sequence within the protein sequence.
+        Find approximate occurrences of a motif within the protein sequence.
+        
+        The motif may contain X to match any amino acid.
+        Matching is bit-parallel and linear in the sequence length.
         
         Args:
-            motif (str): Amino acid pattern to search for (case-insensitive)
+            motif (str): Sequence pattern to search for (case-insensitive)
+            max_errors (int): Maximum number of mismatches (or edits with `indels`)
+            indels (bool): Also allow insertions and deletions (default: False)
         
         Returns:
-            list: List of 0-based positions where the motif starts, empty list if not found
+            list: Without `indels`, (start, mismatches) tuples for every matching window.
+                With `indels`, (end, distance) tuples where end is the 0-based position
+                just after the last matched base
+        
+        Raises:
+            ValueError: If motif is empty or max_errors is not between 0 and len(motif) - 1
         
         Outsource:
         - docstrings
-        - lines: 108, 110
         """
-        positions = []
-        seq_length = len(self.data)
+        import approx_search
         motif = motif.upper()
-        motif_length = len(motif)
-        search_limit = seq_length - motif_length + 1
-        for i in range(search_limit):
-            fragment = self.data[i:i + motif_length]
-            if fragment == motif:
-                positions.append(i)
-        return positions
+        if indels:
+            return approx_search.myers_search(self.data, motif, max_errors, approx_search.PROTEIN_WILDCARDS)
+        return approx_search.hamming_search(self.data, motif, max_errors, approx_search.PROTEIN_WILDCARDS)
+
+    def align(self, other, mode: str = "global", gap_open: int = 10, gap_extend: int = 1,
+              matrix: str = "BLOSUM62"):
+        """
+        Align this protein sequence with another one.
+        
+        Uses affine gap penalties: a gap of length L costs gap_open + (L - 1) * gap_extend.
+        Residue pairs are scored with the BLOSUM62 (default) or PAM250 matrix.
+        
+        Args:
+            other (ProteinSequence): Sequence to align against
+            mode (str): "global" (Needleman-Wunsch) or "local" (Smith-Waterman)
+            gap_open (int): Penalty of the first position of a gap
+            gap_extend (int): Penalty of every further position of a gap
+            matrix (str): Substitution matrix, "BLOSUM62" or "PAM250"
+        
+        Returns:
+            Alignment: Optimal alignment with score, gapped strings and coordinates
+        
+        Raises:
+            ValueError: If mode is not "global" or "local", the matrix is unknown, or gap_extend is not between 0 and gap_open
+        
+        Outsource:
+        - docstrings
+        """
+        import alignment
+        if matrix not in alignment.PROTEIN_MATRICES:
+            raise ValueError(f"Unknown substitution matrix: {matrix}")
+        return alignment.align(self.data, other.data, alignment.PROTEIN_MATRICES[matrix], mode, gap_open, gap_extend)
+
+    def kmer_counts(self, k: int):
+        """
+        Count all overlapping k-mers of the protein sequence.
+        
+        Uses a rolling hash over the sequence, so no substring is allocated
+        per window.
+        
+        Args:
+            k (int): K-mer length; must be greater than 0
+        
+        Returns:
+            dict: Mapping of k-mer string to number of occurrences
+        
+        Raises:
+            ValueError: If k is not greater than 0
+        
+        Outsource:
+        - docstrings
+        """
+        import kmers
+        return kmers.kmer_counts(self.data, k, "".join(sorted(self.valid_chars)))
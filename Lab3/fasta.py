@@ -0,0 +1,202 @@
+import gzip
+import io
+from itertools import chain
+
+from bgzf import BgzfReader, BgzfWriter
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def open_fasta(path: str, mode: str = "r", compression: str = None):
+    """
+    Open a plain, gzip or BGZF FASTA file as text.
+
+    When reading, gzip (and BGZF, which is valid gzip) is detected from the
+    file's magic bytes. When writing, the compression is taken from the
+    argument, or from the extension: ".gz" for gzip, ".bgz"/".bgzf" for BGZF.
+
+    Args:
+        path (str): File path
+        mode (str): "r" to read or "w" to write
+        compression (str): None, "gzip" or "bgzf" (writing only; default: from extension)
+
+    Returns:
+        Text file object
+
+    Raises:
+        ValueError: If mode or compression is unknown
+
+    Outsource:
+    - docstrings
+    """
+    if mode == "r":
+        with open(path, "rb") as raw:
+            compressed = raw.read(2) == GZIP_MAGIC
+        if compressed:
+            return gzip.open(path, "rt", encoding="ascii")
+        return open(path, "r", encoding="ascii")
+    if mode != "w":
+        raise ValueError('Mode must be "r" or "w".')
+    if compression is None:
+        if path.endswith((".bgz", ".bgzf")):
+            compression = "bgzf"
+        elif path.endswith(".gz"):
+            compression = "gzip"
+    if compression == "bgzf":
+        return BgzfWriter(path)
+    if compression == "gzip":
+        return io.TextIOWrapper(gzip.open(path, "wb"), encoding="ascii")
+    if compression is None:
+        return open(path, "w", encoding="ascii")
+    raise ValueError('Compression must be None, "gzip" or "bgzf".')
+
+
+def read_fasta(handle):
+    """
+    Read FASTA records from an open text file lazily.
+
+    Records are yielded one at a time, so whole files never have to be
+    loaded into memory. Sequence lines are joined and converted to uppercase.
+
+    Args:
+        handle (iterable): Open text file (or any iterable of lines)
+
+    Yields:
+        tuple: (identifier, data) for every record in the file
+
+    Outsource:
+    - docstrings
+    """
+    identifier = None
+    chunks = []
+    for line in handle:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(">"):
+            if identifier is not None:
+                yield identifier, "".join(chunks).upper()
+            identifier = line[1:].strip()
+            chunks = []
+        else:
+            chunks.append(line)
+    if identifier is not None:
+        yield identifier, "".join(chunks).upper()
+
+
+def fasta_chunks(identifier: str, data: str, width: int = None):
+    """
+    Yield the text of one FASTA record in pieces.
+
+    The header and each sequence line are yielded separately (line breaks as
+    their own pieces), so a record is never copied into one large string.
+
+    Args:
+        identifier (str): Record identifier
+        data (str): Sequence data
+        width (int): Line width for the sequence; None writes it on one line
+
+    Yields:
+        str: Consecutive pieces of the record, ending with a newline
+
+    Outsource:
+    - docstrings
+    """
+    yield f">{identifier}\n"
+    if width is None or len(data) <= width:
+        yield data
+        yield "\n"
+        return
+    for start in range(0, len(data), width):
+        yield data[start:start + width]
+        yield "\n"
+
+
+def write_fasta(sequences, handle, width: int = None):
+    """
+    Write sequence objects to an open text file in FASTA format.
+
+    Records are streamed to the file with writelines, so the output is
+    never built as one string.
+
+    Args:
+        sequences (iterable): Objects with `identifier` and `data` attributes
+        handle: Open text file (or any object with a writelines method)
+        width (int): Line width for the sequence data; None (default) writes each
+            sequence on one line
+
+    Raises:
+        ValueError: If width is not greater than 0
+
+    Outsource:
+    - docstrings
+    """
+    if width is not None and width <= 0:
+        raise ValueError("Line width must be greater than 0.")
+    handle.writelines(chain.from_iterable(
+        fasta_chunks(sequence.identifier, sequence.data, width) for sequence in sequences))
+
+
+def index_bgzf_fasta(path: str):
+    """
+    Map every record of a BGZF FASTA file to where it starts.
+
+    Blocks are decompressed once, in order; for each record the virtual
+    offset of its ">" and its uncompressed length are kept, so a record can
+    later be read with fetch_bgzf_record() by decompressing only the blocks
+    it lies in.
+
+    Args:
+        path (str): BGZF-compressed FASTA file
+
+    Returns:
+        dict: Mapping of identifier to (virtual offset, length in bytes)
+
+    Raises:
+        ValueError: If the file is not BGZF or two records share an identifier
+
+    Outsource:
+    - docstrings
+    """
+    starts = []
+    with BgzfReader(path) as reader:
+        position = 0
+        previous = b"\n"
+        for number, (offset, _, size) in enumerate(reader.index):
+            data = reader.read_block(number)
+            search = previous + data
+            found = search.find(b"\n>")
+            while found >= 0:
+                virtual_offset = (offset << 16) | found
+                end = data.find(b"\n", found)
+                header = data[found:end] if end >= 0 else reader.read(virtual_offset, 1 << 16).split(b"\n", 1)[0]
+                starts.append((header[1:].decode("ascii").strip(), virtual_offset, position + found))
+                found = search.find(b"\n>", found + 1)
+            previous = data[-1:]
+            position += size
+    index = {}
+    for number, (identifier, virtual_offset, start) in enumerate(starts):
+        if identifier in index:
+            raise ValueError(f"Duplicate identifier: {identifier}")
+        end = starts[number + 1][2] if number + 1 < len(starts) else position
+        index[identifier] = (virtual_offset, end - start)
+    return index
+
+
+def fetch_bgzf_record(reader, entry):
+    """
+    Read one record located by index_bgzf_fasta().
+
+    Args:
+        reader (BgzfReader): Open reader of the indexed file
+        entry (tuple): (virtual offset, length) from the index
+
+    Returns:
+        tuple: (identifier, data) as yielded by read_fasta
+
+    Outsource:
+    - docstrings
+    """
+    virtual_offset, length = entry
+    text = reader.read(virtual_offset, length).decode("ascii")
+    return next(read_fasta(text.splitlines()))
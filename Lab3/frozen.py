@@ -0,0 +1,370 @@
+import sys
+from functools import lru_cache
+
+from base_sequence import BaseSequence
+from ex31 import COMPLEMENT_MAP, DNASequence
+from ex32 import COMPLEMENT_MAP as RNA_COMPLEMENT_MAP
+from ex32 import RNASequence, translate_rna
+from ex33 import ProteinSequence
+
+
+@lru_cache(maxsize=65536)
+def derived_identifier(identifier: str, suffix: str):
+    """
+    Return the interned identifier of a derived sequence.
+
+    Repeated derivations of the same sequence reuse one identifier string
+    instead of concatenating a new one every time.
+
+    Args:
+        identifier (str): Identifier of the source sequence
+        suffix (str): Suffix marking the derivation, e.g. "_comp"
+
+    Returns:
+        str: Interned identifier + suffix
+
+    Outsource:
+    - docstrings
+    """
+    return sys.intern(identifier + suffix)
+
+
+def _complement_dna(data: str):
+    """Return the base-wise complement of DNA data."""
+    return data.translate(COMPLEMENT_MAP)
+
+
+def _reverse_complement_dna(data: str):
+    """Return the reverse complement of DNA data."""
+    return data.translate(COMPLEMENT_MAP)[::-1]
+
+
+def _transcribe_dna(data: str):
+    """Return DNA data with T replaced by U."""
+    return data.replace("T", "U")
+
+
+def _complement_rna(data: str):
+    """Return the base-wise complement of RNA data."""
+    return data.translate(RNA_COMPLEMENT_MAP)
+
+
+class _FrozenSequence:
+    """
+    Immutable sequence with a cached hash and lazily derived data.
+
+    A frozen sequence either owns its data or is a view of a parent
+    sequence plus a derivation (complement, transcription, ...). A view
+    computes its data only when `data` is first read and then keeps it.
+    Element-wise derivations also answer `len()` and indexing/slicing
+    straight from the parent without materializing the whole view.
+
+    Attributes:
+        identifier (str): Unique identifier for the sequence
+        data (str): The sequence data (computed on first access for views)
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("identifier", "_data", "_parent", "_derive", "_elementwise", "_hash",
+                 "_composition", "_properties", "_motif_search", "__weakref__")
+    mutable_class = None
+    _version = 0
+
+    _motif_positions = BaseSequence._motif_positions
+    _motif_searcher = BaseSequence._motif_searcher
+    find_motifs = BaseSequence.find_motifs
+
+    def __init__(self, identifier: str, data: str):
+        """
+        Initialize a frozen sequence, validating data like the mutable class does.
+
+        Args:
+            identifier (str): Unique identifier for the sequence
+            data (str): Sequence string (case-insensitive, will be converted to uppercase)
+
+        Raises:
+            ValueError: If data contains characters invalid for the sequence type
+
+        Outsource:
+        - docstrings
+        """
+        checked = self.mutable_class(identifier, data)
+        self._init(identifier, checked.data, None, None, False)
+
+    def _init(self, identifier, data, parent, derive, elementwise):
+        """Set all slots; used by __init__ and the alternative constructors."""
+        set_slot = object.__setattr__
+        set_slot(self, "identifier", identifier)
+        set_slot(self, "_data", data)
+        set_slot(self, "_parent", parent)
+        set_slot(self, "_derive", derive)
+        set_slot(self, "_elementwise", elementwise)
+        set_slot(self, "_hash", None)
+        set_slot(self, "_composition", None)
+        set_slot(self, "_properties", None)
+        set_slot(self, "_motif_search", None)
+
+    @classmethod
+    def _view(cls, identifier: str, parent, derive, elementwise: bool = False):
+        """
+        Create a frozen sequence whose data is derive(parent.data), computed lazily.
+
+        Outsource:
+        - docstrings
+        """
+        seq = cls.__new__(cls)
+        seq._init(identifier, None, parent, derive, elementwise)
+        return seq
+
+    @classmethod
+    def from_sequence(cls, sequence):
+        """
+        Freeze a mutable sequence without copying or re-validating its data.
+
+        Args:
+            sequence: Mutable sequence of the matching type
+
+        Returns:
+            Frozen sequence sharing the same data string
+
+        Outsource:
+        - docstrings
+        """
+        seq = cls.__new__(cls)
+        seq._init(sequence.identifier, sequence.data, None, None, False)
+        return seq
+
+    def thaw(self):
+        """Return a mutable copy of the sequence (the data string is shared)."""
+        return self.mutable_class._from_valid(self.identifier, self.data)
+
+    @property
+    def data(self):
+        """The sequence data, derived from the parent on first access for views."""
+        if self._data is None:
+            object.__setattr__(self, "_data", self._derive(self._parent.data))
+            object.__setattr__(self, "_parent", None)
+        return self._data
+
+    def __setattr__(self, name, value):
+        """
+        Allow only the private caches to be set; public attributes are frozen.
+
+        Raises:
+            AttributeError: On any attempt to set a public attribute
+
+        Outsource:
+        - docstrings
+        """
+        if not name.startswith("_"):
+            raise AttributeError(f"{type(self).__name__} is immutable.")
+        object.__setattr__(self, name, value)
+
+    def __len__(self):
+        """Return the length of the sequence, without materializing element-wise views."""
+        if self._data is None and self._elementwise:
+            return len(self._parent)
+        return len(self.data)
+
+    def __getitem__(self, key):
+        """
+        Return one symbol or a slice of the sequence as a string.
+
+        Element-wise views derive only the requested part from the parent.
+
+        Outsource:
+        - docstrings
+        """
+        if self._data is None and self._elementwise:
+            return self._derive(self._parent[key])
+        return self.data[key]
+
+    def __str__(self):
+        """Return the sequence in FASTA format."""
+        return f">{self.identifier}\n{self.data}"
+
+    def __eq__(self, other):
+        """Equality: same frozen type, identifier and data."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.identifier == other.identifier and self.data == other.data
+
+    def __hash__(self):
+        """Return the hash of identifier and data, computed once."""
+        if self._hash is None:
+            object.__setattr__(self, "_hash", hash((type(self).__name__, self.identifier, self.data)))
+        return self._hash
+
+    def mutate(self, position: int, value: str):
+        """
+        Return a new frozen sequence with one symbol replaced.
+
+        The sequence itself is immutable, so unlike the mutable classes this
+        returns the mutated copy instead of changing the object.
+
+        Args:
+            position (int): 0-based index of the symbol to replace
+            value (str): New symbol (case-insensitive)
+
+        Returns:
+            Frozen sequence of the same type with the replaced symbol
+
+        Raises:
+            ValueError: If value is not valid for the sequence type
+            IndexError: If position is out of range
+
+        Outsource:
+        - docstrings
+        """
+        seq = self.thaw()
+        seq.mutate(position, value)
+        return type(self).from_sequence(seq)
+
+
+class FrozenProteinSequence(_FrozenSequence):
+    """
+    Immutable ProteinSequence.
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ()
+    mutable_class = ProteinSequence
+    valid_chars = ProteinSequence.valid_chars
+
+    find_motif = ProteinSequence.find_motif
+    find_motif_approx = ProteinSequence.find_motif_approx
+    kmer_counts = ProteinSequence.kmer_counts
+    align = ProteinSequence.align
+    _property_table = ProteinSequence._property_table
+    molecular_weight = ProteinSequence.molecular_weight
+    isoelectric_point = ProteinSequence.isoelectric_point
+    aa_composition = ProteinSequence.aa_composition
+    hydrophobicity_profile = ProteinSequence.hydrophobicity_profile
+
+
+class FrozenRNASequence(_FrozenSequence):
+    """
+    Immutable RNASequence with lazily derived complement and translation.
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ()
+    mutable_class = RNASequence
+    valid_chars = RNASequence.valid_chars
+
+    find_motif = RNASequence.find_motif
+    find_motif_approx = RNASequence.find_motif_approx
+    kmer_counts = RNASequence.kmer_counts
+    align = RNASequence.align
+    _composition_index = RNASequence._composition_index
+    base_counts = RNASequence.base_counts
+    gc_content = RNASequence.gc_content
+    window_profile = RNASequence.window_profile
+
+    def complement(self):
+        """
+        Return the complementary RNA strand as a lazy view.
+
+        Returns:
+            FrozenRNASequence: View with "_comp" suffix in identifier
+
+        Outsource:
+        - docstrings
+        """
+        identifier = derived_identifier(self.identifier, "_comp")
+        return FrozenRNASequence._view(identifier, self, _complement_rna, elementwise=True)
+
+    def translate(self):
+        """
+        Return the translated protein as a lazy view.
+
+        Translation follows RNASequence.translate; it runs when the protein's
+        data is first needed, and an unknown codon raises ValueError at that point.
+
+        Returns:
+            FrozenProteinSequence: View with "_PROT" suffix in identifier
+
+        Outsource:
+        - docstrings
+        """
+        identifier = derived_identifier(self.identifier, "_PROT")
+        return FrozenProteinSequence._view(identifier, self, _translate_checked)
+
+
+class FrozenDNASequence(_FrozenSequence):
+    """
+    Immutable DNASequence with lazily derived complement, reverse complement and transcript.
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ()
+    mutable_class = DNASequence
+    valid_chars = DNASequence.valid_chars
+
+    find_motif = DNASequence.find_motif
+    find_motif_approx = DNASequence.find_motif_approx
+    kmer_counts = DNASequence.kmer_counts
+    align = DNASequence.align
+    _composition_index = DNASequence._composition_index
+    base_counts = DNASequence.base_counts
+    gc_content = DNASequence.gc_content
+    window_profile = DNASequence.window_profile
+
+    def complement(self):
+        """
+        Return the complementary DNA strand as a lazy view.
+
+        Returns:
+            FrozenDNASequence: View with "_comp" suffix in identifier
+
+        Outsource:
+        - docstrings
+        """
+        identifier = derived_identifier(self.identifier, "_comp")
+        return FrozenDNASequence._view(identifier, self, _complement_dna, elementwise=True)
+
+    def reverse_complement(self):
+        """
+        Return the reverse complement as a lazy view.
+
+        Returns:
+            FrozenDNASequence: View with "_revcomp" suffix in identifier
+
+        Outsource:
+        - docstrings
+        """
+        identifier = derived_identifier(self.identifier, "_revcomp")
+        return FrozenDNASequence._view(identifier, self, _reverse_complement_dna)
+
+    def transcribe(self):
+        """
+        Return the transcribed RNA as a lazy view.
+
+        Returns:
+            FrozenRNASequence: View with "_RNA" suffix in identifier
+
+        Outsource:
+        - docstrings
+        """
+        identifier = derived_identifier(self.identifier, "_RNA")
+        return FrozenRNASequence._view(identifier, self, _transcribe_dna, elementwise=True)
+
+
+def _translate_checked(data: str):
+    """
+    Translate RNA data, rejecting unknown codons like ProteinSequence does.
+
+    Raises:
+        ValueError: If the translation contains an unknown codon ('?')
+
+    Outsource:
+    - docstrings
+    """
+    protein = translate_rna(data)
+    if "?" in protein:
+        raise ValueError("Invalid protein sequence — contains: {'?'}")
+    return protein
@@ -0,0 +1,438 @@
+import argparse
+import random
+import sys
+import time
+
+from ex31 import DNASequence
+from ex32 import RNASequence
+from frozen import FrozenDNASequence, FrozenRNASequence
+from motif_search import STRATEGIES, search_positions
+from parallel import translate_many
+from pipeline import SequenceStream
+
+OPERATIONS = ("find_motif", "complement", "transcribe", "translate", "mutate")
+DEFAULT_SIZES = (16, 1_000, 100_000)
+
+# Codon table of the original RNASequence.translate, kept here on purpose so
+# that later edits to ex32.CODON_TABLE are caught as mismatches.
+_REFERENCE_CODONS = {
+    'AUG': 'M',
+    'UUU': 'F', 'UUC': 'F',
+    'UUA': 'L', 'UUG': 'L',
+    'UAA': '*', 'UAG': '*', 'UGA': '*',
+    'UGG': 'W', 'GCC': 'A', 'GAA': 'E', 'UAC': 'Y', 'UGC': 'C'
+}
+_SENSE_CODONS = sorted(codon for codon, amino_acid in _REFERENCE_CODONS.items() if amino_acid != '*')
+
+
+# Reference implementations: straight copies of the original, unoptimized
+# method bodies, working on plain strings.
+
+def reference_find_motif(data: str, motif: str):
+    """Return motif start positions with the original slice-and-compare loop."""
+    data = data.upper()
+    motif = motif.upper()
+    positions = []
+    for i in range(len(data) - len(motif) + 1):
+        if data[i:i + len(motif)] == motif:
+            positions.append(i)
+    return positions
+
+
+def reference_complement(data: str):
+    """Return the complement of DNA data as the original complement() did."""
+    return data.upper().translate(str.maketrans("ATGC", "TACG"))
+
+
+def reference_transcribe(data: str):
+    """Return the RNA transcript of DNA data as the original transcribe() did."""
+    return data.upper().replace("T", "U")
+
+
+def reference_translate(data: str):
+    """
+    Translate RNA data as the original translate() did.
+
+    Raises:
+        ValueError: If the protein contains an unknown codon ('?'), as ProteinSequence did
+
+    Outsource:
+    - docstrings
+    """
+    data = data.upper()
+    protein = ""
+    for i in range(0, len(data) - 2, 3):
+        amino_acid = _REFERENCE_CODONS.get(data[i:i + 3], '?')
+        if amino_acid == '*':
+            break
+        protein += amino_acid
+    if "?" in protein:
+        raise ValueError("Invalid protein sequence")
+    return protein
+
+
+def reference_mutate(data: str, position: int, value: str):
+    """
+    Return DNA data with one base replaced, validating as the original mutate() did.
+
+    Raises:
+        ValueError: If value is not a DNA base
+        IndexError: If position is out of range
+
+    Outsource:
+    - docstrings
+    """
+    data = data.upper()
+    if value.upper() not in {'A', 'T', 'G', 'C'}:
+        raise ValueError("Invalid base for mutation")
+    if not (0 <= position < len(data)):
+        raise IndexError("Position out of range")
+    return data[:position] + value.upper() + data[position + 1:]
+
+
+REFERENCES = {
+    "find_motif": reference_find_motif,
+    "complement": reference_complement,
+    "transcribe": reference_transcribe,
+    "translate": reference_translate,
+    "mutate": reference_mutate,
+}
+
+
+def _as_sequence(sequence_class, backend=None):
+    """Return a prepare step building a `sequence_class` object (with a storage backend) from the data argument."""
+    def prepare(data, *rest):
+        if backend is None:
+            return (sequence_class("fuzz", data),) + rest
+        return (sequence_class("fuzz", data, backend=backend),) + rest
+    return prepare
+
+
+def _mutated(sequence, position, value):
+    """Run mutate() and return the resulting data (frozen sequences return a copy)."""
+    result = sequence.mutate(position, value)
+    return (result if result is not None else sequence).data
+
+
+def _stream(kind: str):
+    """Return a prepare step wrapping the data argument in a single-record SequenceStream."""
+    def prepare(data):
+        return (SequenceStream([("fuzz", data)], kind),)
+    return prepare
+
+
+def _stream_stage(stage: str):
+    """Return a run step applying one SequenceStream stage and collecting the record."""
+    def run(stream):
+        return getattr(stream, stage)().collect()[0].data
+    return run
+
+
+def _unchanged(*args):
+    """Prepare step passing the reference arguments through."""
+    return args
+
+
+# Operation -> backend name -> (prepare, run). prepare turns the reference
+# arguments into run's arguments (e.g. builds the sequence object) and is not
+# timed, so speedups compare the operations themselves.
+BACKENDS = {
+    "find_motif": {
+        "DNASequence": (_as_sequence(DNASequence), lambda sequence, motif: sequence.find_motif(motif)),
+        "FrozenDNASequence": (_as_sequence(FrozenDNASequence), lambda sequence, motif: sequence.find_motif(motif)),
+    },
+    "complement": {
+        "DNASequence": (_as_sequence(DNASequence), lambda sequence: sequence.complement().data),
+        "FrozenDNASequence": (_as_sequence(FrozenDNASequence), lambda sequence: sequence.complement().data),
+        "SequenceStream": (_stream("dna"), _stream_stage("complement")),
+    },
+    "transcribe": {
+        "DNASequence": (_as_sequence(DNASequence), lambda sequence: sequence.transcribe().data),
+        "FrozenDNASequence": (_as_sequence(FrozenDNASequence), lambda sequence: sequence.transcribe().data),
+        "SequenceStream": (_stream("dna"), _stream_stage("transcribe")),
+    },
+    "translate": {
+        "RNASequence": (_as_sequence(RNASequence), lambda sequence: sequence.translate().data),
+        "FrozenRNASequence": (_as_sequence(FrozenRNASequence), lambda sequence: sequence.translate().data),
+        "SequenceStream": (_stream("rna"), _stream_stage("translate")),
+        "translate_many": (_as_sequence(RNASequence),
+                           lambda sequence: translate_many([sequence], workers=1)[0].data),
+    },
+    "mutate": {
+        "DNASequence": (_as_sequence(DNASequence), _mutated),
+        "FrozenDNASequence": (_as_sequence(FrozenDNASequence), _mutated),
+    },
+}
+
+
+# Every non-default storage backend that needs no optional dependency.
+for _storage in ("bytearray", "packed", "mmap"):
+    _label = f"DNASequence[{_storage}]"
+    BACKENDS["find_motif"][_label] = (_as_sequence(DNASequence, _storage),
+                                      lambda sequence, motif: sequence.find_motif(motif))
+    BACKENDS["complement"][_label] = (_as_sequence(DNASequence, _storage), lambda sequence: sequence.complement().data)
+    BACKENDS["transcribe"][_label] = (_as_sequence(DNASequence, _storage), lambda sequence: sequence.transcribe().data)
+    BACKENDS["mutate"][_label] = (_as_sequence(DNASequence, _storage), _mutated)
+    BACKENDS["translate"][f"RNASequence[{_storage}]"] = (_as_sequence(RNASequence, _storage),
+                                                        lambda sequence: sequence.translate().data)
+
+# Every motif search strategy, forced, plus the multi-motif entry point.
+for _strategy in STRATEGIES:
+    BACKENDS["find_motif"][f"find_motif[{_strategy}]"] = (
+        lambda data, motif: (data.upper(), motif.upper()),
+        lambda data, motif, strategy=_strategy: search_positions(data, motif, strategy))
+BACKENDS["find_motif"]["DNASequence.find_motifs"] = (_as_sequence(DNASequence),
+                                                     lambda sequence, motif: sequence.find_motifs([motif])[motif])
+
+
+def register_backend(operation: str, name: str, run, prepare=None):
+    """
+    Add an accelerated implementation to be checked against the reference.
+
+    Args:
+        operation (str): One of OPERATIONS
+        name (str): Backend name used in reports
+        run (callable): The timed implementation; receives prepare's result as arguments
+        prepare (callable): Untimed setup receiving the reference arguments and returning
+            a tuple of arguments for run (default: pass them through)
+
+    Raises:
+        ValueError: If operation is unknown
+
+    Outsource:
+    - docstrings
+    """
+    if operation not in BACKENDS:
+        raise ValueError(f"Unknown operation: {operation}")
+    BACKENDS[operation][name] = (prepare or _unchanged, run)
+
+
+def _random_dna(rng, size: int):
+    """Return random DNA; sometimes low-complexity, sometimes lowercase."""
+    style = rng.random()
+    if style < 0.2:
+        unit = "".join(rng.choices("ACGT", k=rng.randint(1, 3)))
+        data = (unit * (size // len(unit) + 1))[:size]
+    else:
+        data = "".join(rng.choices("ACGT", k=size))
+    return data.lower() if rng.random() < 0.1 else data
+
+
+def _random_rna(rng, size: int):
+    """Return random RNA that is mostly an open reading frame, occasionally with stops or unknown codons."""
+    codons = rng.choices(_SENSE_CODONS, k=size // 3)
+    if codons and rng.random() < 0.3:
+        codons[rng.randrange(len(codons))] = rng.choice(["UAA", "UAG", "UGA"])
+    if codons and rng.random() < 0.2:
+        codons[rng.randrange(len(codons))] = rng.choice(["GGG", "ACU", "CCA"])
+    return "".join(codons) + "".join(rng.choices("ACGU", k=size % 3))
+
+
+def generate_case(operation: str, rng, size: int):
+    """
+    Generate random arguments for one operation.
+
+    Args:
+        operation (str): One of OPERATIONS
+        rng (random.Random): Random number generator
+        size (int): Sequence length
+
+    Returns:
+        tuple: Arguments for the reference function and backends
+
+    Outsource:
+    - docstrings
+    """
+    if operation == "translate":
+        return (_random_rna(rng, size),)
+    data = _random_dna(rng, size)
+    if operation == "find_motif":
+        length = rng.randint(1, 8)
+        if data and rng.random() < 0.7:
+            start = rng.randrange(len(data))
+            motif = data[start:start + length]
+        else:
+            motif = "".join(rng.choices("ACGT", k=length))
+        return data, motif.lower() if rng.random() < 0.1 else motif
+    if operation == "mutate":
+        position = rng.randint(-1, len(data)) if rng.random() < 0.1 else rng.randrange(max(len(data), 1))
+        value = rng.choice("ACGTacgt") if rng.random() < 0.95 else rng.choice("XNU")
+        return data, position, value
+    return (data,)
+
+
+def _outcome(prepare, run, args):
+    """
+    Run one implementation on one case.
+
+    Returns:
+        tuple: (("ok", result) or ("error", exception type name), seconds spent in run)
+
+    Outsource:
+    - docstrings
+    """
+    try:
+        prepared = prepare(*args)
+    except (ValueError, IndexError, KeyError) as error:
+        return ("error", type(error).__name__), 0.0
+    started = time.perf_counter()
+    try:
+        result = ("ok", run(*prepared))
+    except (ValueError, IndexError, KeyError) as error:
+        result = ("error", type(error).__name__)
+    return result, time.perf_counter() - started
+
+
+def _implementations(operation: str):
+    """Return (prepare, run) for the reference and every backend of an operation."""
+    return {"reference": (_unchanged, REFERENCES[operation]), **BACKENDS[operation]}
+
+
+def check_case(operation: str, args, backends=None):
+    """
+    Run one case through the reference and every backend of an operation.
+
+    Args:
+        operation (str): One of OPERATIONS
+        args (tuple): Arguments for the reference function
+        backends (list): Backend names to check (default: all registered)
+
+    Returns:
+        list: (backend name, expected outcome, actual outcome) for every backend that differs
+
+    Outsource:
+    - docstrings
+    """
+    expected = _outcome(_unchanged, REFERENCES[operation], args)[0]
+    mismatches = []
+    for name, (prepare, run) in BACKENDS[operation].items():
+        if backends is not None and name not in backends:
+            continue
+        actual = _outcome(prepare, run, args)[0]
+        if actual != expected:
+            mismatches.append((name, expected, actual))
+    return mismatches
+
+
+class FuzzReport:
+    """
+    Mismatches and timings collected by run_differential.
+
+    Attributes:
+        mismatches (list): Dicts with operation, backend, size, args, expected and actual
+        timings (dict): (operation, implementation, size) -> total seconds, where
+            implementation is "reference" or a backend name
+        cases (int): Number of cases run
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self):
+        """Create an empty report."""
+        self.mismatches = []
+        self.timings = {}
+        self.cases = 0
+
+    def speedups(self):
+        """
+        Return reference time divided by backend time per operation, backend and size.
+
+        Returns:
+            dict: (operation, backend, size) -> speedup ratio (> 1 means faster than reference)
+
+        Outsource:
+        - docstrings
+        """
+        ratios = {}
+        for (operation, name, size), seconds in self.timings.items():
+            if name == "reference":
+                continue
+            reference = self.timings[(operation, "reference", size)]
+            ratios[(operation, name, size)] = reference / seconds if seconds else float("inf")
+        return ratios
+
+    def __str__(self):
+        """Return a text summary: speedup table followed by the first mismatches."""
+        lines = [f"{self.cases} cases, {len(self.mismatches)} mismatches",
+                 f"{'operation':<12}{'backend':<20}{'size':>10}{'speedup':>10}"]
+        for (operation, name, size), ratio in sorted(self.speedups().items()):
+            lines.append(f"{operation:<12}{name:<20}{size:>10}{ratio:>10.2f}")
+        for mismatch in self.mismatches[:10]:
+            summary = tuple(arg[:40] + "..." if isinstance(arg, str) and len(arg) > 40 else arg
+                            for arg in mismatch["args"])
+            lines.append(f"MISMATCH {mismatch['operation']}/{mismatch['backend']} size={mismatch['size']} "
+                         f"args={summary}: expected {mismatch['expected']!r:.80}, got {mismatch['actual']!r:.80}")
+        return "\n".join(lines)
+
+
+def run_differential(operations=OPERATIONS, sizes=DEFAULT_SIZES, cases: int = 20, seed: int = 0):
+    """
+    Run random cases through the references and all backends, timing each.
+
+    Only the operation itself is timed; building sequence objects (and their
+    validation) happens in the untimed prepare step.
+
+    Args:
+        operations (iterable): Operations to fuzz
+        sizes (iterable): Sequence lengths to generate
+        cases (int): Cases per operation and size
+        seed (int): Random seed, so failing runs can be reproduced
+
+    Returns:
+        FuzzReport: Mismatches and timings
+
+    Raises:
+        ValueError: If an operation is unknown
+
+    Outsource:
+    - docstrings
+    """
+    report = FuzzReport()
+    rng = random.Random(seed)
+    for operation in operations:
+        if operation not in REFERENCES:
+            raise ValueError(f"Unknown operation: {operation}")
+        implementations = _implementations(operation)
+        for size in sizes:
+            for _ in range(cases):
+                args = generate_case(operation, rng, size)
+                outcomes = {}
+                for name, (prepare, run) in implementations.items():
+                    outcomes[name], elapsed = _outcome(prepare, run, args)
+                    key = (operation, name, size)
+                    report.timings[key] = report.timings.get(key, 0.0) + elapsed
+                expected = outcomes.pop("reference")
+                for name, actual in outcomes.items():
+                    if actual != expected:
+                        report.mismatches.append({
+                            "operation": operation, "backend": name, "size": size,
+                            "args": args, "expected": expected, "actual": actual,
+                        })
+                report.cases += 1
+    return report
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Returns:
+        int: Exit status, 1 if any backend disagreed with the reference
+
+    Outsource:
+    - docstrings
+    """
+    parser = argparse.ArgumentParser(description="Differential fuzzing of accelerated sequence operations.")
+    parser.add_argument("--operations", nargs="*", default=list(OPERATIONS), choices=OPERATIONS)
+    parser.add_argument("--sizes", nargs="*", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--cases", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    report = run_differential(args.operations, args.sizes, args.cases, args.seed)
+    print(report)
+    return 1 if report.mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
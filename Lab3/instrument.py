@@ -0,0 +1,328 @@
+import time
+
+# tracemalloc, cProfile, pstats and json are imported only when memory
+# tracking, profiling or JSON export is used, and functools/contextlib are
+# not used at all, so importing the domain classes (which are decorated
+# with @instrumented) stays cheap.
+
+_enabled = False
+_track_memory = False
+_started_tracing = False
+# Operation name -> [calls, seconds, bytes]
+_stats = {}
+
+
+def enable(memory: bool = False):
+    """
+    Start recording instrumented operations.
+
+    Args:
+        memory (bool): Also record net bytes allocated per operation (starts tracemalloc,
+            which slows every allocation down while it runs)
+
+    Outsource:
+    - docstrings
+    """
+    global _enabled, _track_memory, _started_tracing
+    if memory:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+    _track_memory = memory
+    _enabled = True
+
+
+def disable():
+    """Stop recording; collected statistics are kept until reset()."""
+    global _enabled, _track_memory, _started_tracing
+    _enabled = False
+    _track_memory = False
+    if _started_tracing:
+        import tracemalloc
+        tracemalloc.stop()
+        _started_tracing = False
+
+
+def is_enabled():
+    """Return True while operations are being recorded."""
+    return _enabled
+
+
+def reset():
+    """Discard all collected statistics."""
+    _stats.clear()
+
+
+def _record(name: str, seconds: float, allocated: int):
+    """Add one call of an operation to the statistics."""
+    entry = _stats.get(name)
+    if entry is None:
+        _stats[name] = [1, seconds, allocated]
+    else:
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] += allocated
+
+
+def instrumented(name: str):
+    """
+    Decorator recording calls, cumulative time and bytes allocated of a function.
+
+    While recording is disabled the wrapper only checks a module flag and
+    calls the function, so decorated hot paths stay near full speed.
+
+    Args:
+        name (str): Operation name used in reports, e.g. "DNASequence.find_motif".
+            In methods, "{cls}" is replaced with the class name of the instance,
+            so a method defined on a base class is reported per subclass
+
+    Returns:
+        Decorator
+
+    Outsource:
+    - docstrings
+    """
+    per_class = "{cls}" in name
+
+    def decorator(func):
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            label = name.format(cls=type(args[0]).__name__) if per_class else name
+            with measure(label):
+                return func(*args, **kwargs)
+        for attribute in ("__module__", "__name__", "__qualname__", "__doc__"):
+            setattr(wrapper, attribute, getattr(func, attribute))
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorator
+
+
+class measure:
+    """
+    Context manager recording the enclosed block as one call of an operation.
+
+    Does nothing while recording is disabled. Time and bytes are inclusive:
+    instrumented calls made inside the block are counted in both.
+
+    Args:
+        name (str): Operation name used in reports
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("name", "_active", "_memory", "_before", "_started")
+
+    def __init__(self, name: str):
+        """Remember the operation name."""
+        self.name = name
+
+    def __enter__(self):
+        """Start timing (and allocation tracking in memory mode) if recording is enabled."""
+        self._active = _enabled
+        if not self._active:
+            return self
+        self._memory = False
+        self._before = 0
+        if _track_memory:
+            import tracemalloc
+            self._memory = tracemalloc.is_tracing()
+            if self._memory:
+                self._before = tracemalloc.get_traced_memory()[0]
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Record the call, also when the block raised."""
+        if not self._active:
+            return
+        seconds = time.perf_counter() - self._started
+        allocated = 0
+        if self._memory:
+            import tracemalloc
+            allocated = max(tracemalloc.get_traced_memory()[0] - self._before, 0)
+        _record(self.name, seconds, allocated)
+
+
+class recording:
+    """
+    Context manager enabling recording for the enclosed block.
+
+    Args:
+        memory (bool): Also record bytes allocated (see enable)
+        clear (bool): Discard previously collected statistics first
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, memory: bool = False, clear: bool = True):
+        """Remember the recording options."""
+        self.memory = memory
+        self.clear = clear
+
+    def __enter__(self):
+        """Enable recording, clearing earlier statistics unless told not to."""
+        if self.clear:
+            reset()
+        enable(self.memory)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Disable recording; the statistics are kept."""
+        disable()
+
+
+def snapshot():
+    """
+    Return the collected statistics.
+
+    Returns:
+        dict: Mapping of operation name to {"calls", "seconds", "bytes"}
+
+    Outsource:
+    - docstrings
+    """
+    return {
+        name: {"calls": calls, "seconds": seconds, "bytes": allocated}
+        for name, (calls, seconds, allocated) in _stats.items()
+    }
+
+
+def report():
+    """
+    Return the statistics as a text table, slowest operations first.
+
+    Outsource:
+    - docstrings
+    """
+    lines = [f"{'operation':<36}{'calls':>10}{'total [s]':>14}{'per call [us]':>16}{'bytes':>14}"]
+    for name, (calls, seconds, allocated) in sorted(_stats.items(), key=lambda item: -item[1][1]):
+        lines.append(f"{name:<36}{calls:>10}{seconds:>14.6f}{seconds / calls * 1e6:>16.2f}{allocated:>14}")
+    return "\n".join(lines)
+
+
+def to_json():
+    """Return the statistics as a JSON string."""
+    import json
+    return json.dumps(snapshot(), indent=2, sort_keys=True)
+
+
+def to_prometheus(prefix: str = "lab3"):
+    """
+    Return the statistics in the Prometheus text exposition format.
+
+    Three counters are exported, each labelled with the operation name:
+    `<prefix>_operation_calls_total`, `<prefix>_operation_seconds_total`
+    and `<prefix>_operation_bytes_total`.
+
+    Outsource:
+    - docstrings
+    """
+    metrics = [
+        ("calls_total", "Number of calls", 0),
+        ("seconds_total", "Cumulative wall time in seconds", 1),
+        ("bytes_total", "Net bytes allocated (memory mode only)", 2),
+    ]
+    lines = []
+    for suffix, help_text, column in metrics:
+        metric = f"{prefix}_operation_{suffix}"
+        lines.append(f"# HELP {metric} {help_text}.")
+        lines.append(f"# TYPE {metric} counter")
+        for name, entry in sorted(_stats.items()):
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            lines.append(f'{metric}{{operation="{label}"}} {entry[column]}')
+    return "\n".join(lines) + "\n"
+
+
+class Capture:
+    """
+    Result of a profile() block.
+
+    Attributes:
+        profile (pstats.Stats): cProfile statistics, or None before the block ends
+        allocations (list): Top tracemalloc statistics by size, grouped by line
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self):
+        """Create an empty capture, filled in when the profile() block exits."""
+        self.profile = None
+        self.allocations = []
+
+    def text(self, limit: int = 20, sort: str = "cumulative"):
+        """
+        Return the profile and the largest allocation sites as text.
+
+        Args:
+            limit (int): Number of functions and allocation sites to list
+            sort (str): pstats sort key
+
+        Outsource:
+        - docstrings
+        """
+        import io
+        stream = io.StringIO()
+        if self.profile is not None:
+            self.profile.stream = stream
+            self.profile.sort_stats(sort).print_stats(limit)
+        for statistic in self.allocations[:limit]:
+            stream.write(f"{statistic}\n")
+        return stream.getvalue()
+
+
+class profile:
+    """
+    Context manager capturing a cProfile profile (and tracemalloc allocations) of a block.
+
+    Example:
+        with profile() as capture:
+            sequence.find_motif("GATTACA")
+        print(capture.text())
+
+    Args:
+        memory (bool): Also capture allocation sites with tracemalloc
+        limit (int): Number of allocation sites kept
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, memory: bool = True, limit: int = 50):
+        """Remember the capture options."""
+        self.memory = memory
+        self.limit = limit
+
+    def __enter__(self):
+        """
+        Start profiling.
+
+        Returns:
+            Capture: Filled in when the block exits
+
+        Outsource:
+        - docstrings
+        """
+        import cProfile
+        import tracemalloc
+        self._capture = Capture()
+        self._profiler = cProfile.Profile()
+        self._was_tracing = tracemalloc.is_tracing()
+        if self.memory and not self._was_tracing:
+            tracemalloc.start()
+        self._profiler.enable()
+        return self._capture
+
+    def __exit__(self, *exc_info):
+        """Stop profiling and fill in the capture."""
+        self._profiler.disable()
+        import pstats
+        import tracemalloc
+        self._capture.profile = pstats.Stats(self._profiler)
+        if self.memory:
+            self._capture.allocations = tracemalloc.take_snapshot().statistics("lineno")[:self.limit]
+            if not self._was_tracing:
+                tracemalloc.stop()
@@ -0,0 +1,341 @@
+from fasta import read_fasta
+from packing import packing_tables
+
+NUCLEOTIDES = "ACGT"
+DENSE_TABLE_BITS = 16
+# Sequences shorter than this are counted in pure Python even when NumPy is installed.
+NUMPY_MIN_LENGTH = 256
+HASH_MASK = 0xFFFFFFFFFFFFFFFF
+UNKNOWN_CODE = 255
+
+
+def alphabet_codes(alphabet: str):
+    """
+    Build the byte translation table and bit width for an alphabet.
+
+    Every symbol gets a small integer code; all other bytes map to
+    UNKNOWN_CODE. DNA and RNA share the 2-bit codes of packing.py (T and U
+    are both 3).
+
+    Args:
+        alphabet (str): Symbols that may appear in counted k-mers
+
+    Returns:
+        tuple: (translation table, bits per symbol, symbols indexed by code)
+
+    Outsource:
+    - docstrings
+    """
+    upper = alphabet.upper()
+    if set(upper) <= set("ACGTU"):
+        codes = packing_tables("ACGU" if "U" in upper else "ACGT")[2]
+        shared = "TUtu"
+    else:
+        codes = {symbol: code for code, symbol in enumerate(sorted(set(upper)))}
+        shared = ""
+    symbols = list(codes)
+    table = bytearray([UNKNOWN_CODE]) * 256
+    for symbol, code in codes.items():
+        table[ord(symbol)] = code
+        table[ord(symbol.lower())] = code
+    for symbol in shared:
+        table[ord(symbol)] = 3
+    bits = max(1, (len(symbols) - 1).bit_length())
+    return bytes(table), bits, symbols
+
+
+def _decode(value: int, k: int, bits: int, symbols):
+    """
+    Turn a packed k-mer hash back into its string.
+
+    Outsource:
+    - docstrings
+    """
+    mask = (1 << bits) - 1
+    chars = []
+    for _ in range(k):
+        chars.append(symbols[value & mask])
+        value >>= bits
+    return "".join(reversed(chars))
+
+
+def _bincount(numpy, data: str, k: int, table: bytes, bits: int, size: int):
+    """
+    Count the packed hashes of all k-mers of `data` with NumPy.
+
+    Builds every window's hash with k shifted array ORs, drops the windows
+    that contain an unknown symbol and counts the rest with numpy.bincount.
+
+    Returns:
+        numpy.ndarray: Count of every hash value, `size` entries long
+
+    Outsource:
+    - docstrings
+    """
+    codes = numpy.frombuffer(data.encode("ascii", "replace").translate(table), dtype=numpy.uint8)
+    windows = len(codes) - k + 1
+    if windows <= 0:
+        return numpy.zeros(size, dtype=numpy.int64)
+    values = numpy.zeros(windows, dtype=numpy.int64)
+    for offset in range(k):
+        values <<= bits
+        values |= codes[offset:offset + windows]
+    unknown = numpy.concatenate(([0], numpy.cumsum(codes == UNKNOWN_CODE)))
+    known = unknown[k:] == unknown[:-k]
+    return numpy.bincount(values[known], minlength=size)
+
+
+def rolling_hashes(data: str, k: int, table: bytes, bits: int):
+    """
+    Yield the packed hash of every k-mer in `data`.
+
+    The hash is updated in O(1) per position by shifting in the code of the
+    next symbol, so no substring is ever allocated. Windows containing a
+    symbol outside the alphabet are skipped.
+
+    Outsource:
+    - docstrings
+    """
+    mask = (1 << (bits * k)) - 1
+    value = 0
+    filled = 0
+    for code in data.encode("ascii", "replace").translate(table):
+        if code == UNKNOWN_CODE:
+            value = 0
+            filled = 0
+            continue
+        value = ((value << bits) | code) & mask
+        filled += 1
+        if filled >= k:
+            yield value
+
+
+class CountMinSketch:
+    """
+    Fixed-size approximate counter for very large k-mer spaces.
+
+    Estimates never undercount; overcounts are bounded by the table width.
+    Memory stays at width * depth integers regardless of how many distinct
+    keys are added.
+
+    Attributes:
+        width (int): Number of counters per row
+        depth (int): Number of independent hash rows
+        total (int): Sum of all added counts
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, width: int = 1 << 16, depth: int = 4):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            width (int): Counters per row; must be greater than 0
+            depth (int): Number of rows; must be greater than 0
+
+        Raises:
+            ValueError: If width or depth is not greater than 0
+
+        Outsource:
+        - docstrings
+        """
+        if width <= 0 or depth <= 0:
+            raise ValueError("Sketch width and depth must be greater than 0")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._rows = [[0] * width for _ in range(depth)]
+        self._seeds = [0x9E3779B97F4A7C15 * (row + 1) & HASH_MASK for row in range(depth)]
+
+    def _slots(self, key: int):
+        """Return the counter index of `key` in every row."""
+        return [(((key ^ seed) * 0xBF58476D1CE4E5B9 & HASH_MASK) >> 17) % self.width for seed in self._seeds]
+
+    def add(self, key: int, count: int = 1):
+        """Add `count` occurrences of the integer `key`."""
+        for row, slot in zip(self._rows, self._slots(key)):
+            row[slot] += count
+        self.total += count
+
+    def estimate(self, key: int):
+        """Return the (over-)estimated count of the integer `key`."""
+        return min(row[slot] for row, slot in zip(self._rows, self._slots(key)))
+
+
+class KmerCounter:
+    """
+    Accumulate k-mer counts across many sequences.
+
+    Small k uses a dense table indexed by the packed hash: a NumPy array
+    filled with numpy.bincount when NumPy is installed, a list otherwise.
+    Large k falls back to a dict, or to a CountMinSketch when `approximate`
+    is set, to keep memory bounded.
+
+    Attributes:
+        k (int): Length of the counted k-mers
+        alphabet (str): Symbols that may appear in k-mers
+        sequences (int): Number of sequences added so far
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, k: int, alphabet: str = NUCLEOTIDES, approximate: bool = False):
+        """
+        Initialize an empty counter.
+
+        Args:
+            k (int): K-mer length; must be greater than 0
+            alphabet (str): Symbols that may appear in k-mers (default: DNA)
+            approximate (bool): Use a CountMinSketch instead of exact counts
+                for k too large for the dense table
+
+        Raises:
+            ValueError: If k is not greater than 0
+
+        Outsource:
+        - docstrings
+        """
+        if k <= 0:
+            raise ValueError("k must be greater than 0")
+        self.k = k
+        self.alphabet = alphabet
+        self.sequences = 0
+        self._table, self._bits, self._symbols = alphabet_codes(alphabet)
+        self._dense = None
+        self._sparse = None
+        self._sketch = None
+        if self._bits * k <= DENSE_TABLE_BITS:
+            try:
+                import numpy
+                self._dense = numpy.zeros(1 << (self._bits * k), dtype=numpy.int64)
+            except ImportError:
+                self._dense = [0] * (1 << (self._bits * k))
+        elif approximate:
+            self._sketch = CountMinSketch()
+        else:
+            self._sparse = {}
+
+    def update(self, data: str):
+        """
+        Count every k-mer of `data` into the running totals.
+
+        Args:
+            data (str): Sequence string
+
+        Outsource:
+        - docstrings
+        """
+        if self._dense is not None and not isinstance(self._dense, list) and len(data) >= NUMPY_MIN_LENGTH:
+            import numpy
+            self._dense += _bincount(numpy, data, self.k, self._table, self._bits, len(self._dense))
+            self.sequences += 1
+            return
+        hashes = rolling_hashes(data, self.k, self._table, self._bits)
+        if self._dense is not None:
+            dense = self._dense
+            for value in hashes:
+                dense[value] += 1
+        elif self._sparse is not None:
+            sparse = self._sparse
+            for value in hashes:
+                sparse[value] = sparse.get(value, 0) + 1
+        else:
+            for value in hashes:
+                self._sketch.add(value)
+        self.sequences += 1
+
+    def count(self, kmer: str):
+        """
+        Return the count of a single k-mer (an estimate in approximate mode).
+
+        Args:
+            kmer (str): K-mer of length k
+
+        Raises:
+            ValueError: If kmer does not have length k
+
+        Outsource:
+        - docstrings
+        """
+        if len(kmer) != self.k:
+            raise ValueError(f"K-mer must have length {self.k}.")
+        values = list(rolling_hashes(kmer, self.k, self._table, self._bits))
+        if not values:
+            return 0
+        if self._dense is not None:
+            return int(self._dense[values[0]])
+        if self._sparse is not None:
+            return self._sparse.get(values[0], 0)
+        return self._sketch.estimate(values[0])
+
+    def counts(self):
+        """
+        Return all non-zero k-mer counts.
+
+        Returns:
+            dict: Mapping of k-mer string to count
+
+        Raises:
+            ValueError: In approximate mode, where k-mers are not stored
+
+        Outsource:
+        - docstrings
+        """
+        if self._sketch is not None:
+            raise ValueError("Approximate counters can only be queried with count().")
+        if self._dense is not None:
+            dense = self._dense if isinstance(self._dense, list) else self._dense.tolist()
+            items = ((value, n) for value, n in enumerate(dense) if n)
+        else:
+            items = self._sparse.items()
+        return {_decode(value, self.k, self._bits, self._symbols): n for value, n in items}
+
+
+def kmer_counts(data: str, k: int, alphabet: str = NUCLEOTIDES):
+    """
+    Count all overlapping k-mers of a sequence in a single pass.
+
+    Args:
+        data (str): Sequence string
+        k (int): K-mer length; must be greater than 0
+        alphabet (str): Symbols that may appear in k-mers (default: DNA)
+
+    Returns:
+        dict: Mapping of k-mer string to number of occurrences
+
+    Raises:
+        ValueError: If k is not greater than 0
+
+    Outsource:
+    - docstrings
+    """
+    counter = KmerCounter(k, alphabet)
+    counter.update(data)
+    return counter.counts()
+
+
+def count_fasta_kmers(handle, k: int, alphabet: str = NUCLEOTIDES, approximate: bool = False):
+    """
+    Stream a FASTA file and accumulate k-mer counts over all its records.
+
+    Only one record is held in memory at a time.
+
+    Args:
+        handle (iterable): Open FASTA text file
+        k (int): K-mer length; must be greater than 0
+        alphabet (str): Symbols that may appear in k-mers (default: DNA)
+        approximate (bool): Use a CountMinSketch for large k
+
+    Returns:
+        KmerCounter: Counter holding the accumulated counts
+
+    Outsource:
+    - docstrings
+    """
+    counter = KmerCounter(k, alphabet, approximate)
+    for _, data in read_fasta(handle):
+        counter.update(data)
+    return counter
@@ -0,0 +1,397 @@
+from array import array
+from collections import deque
+
+from instrument import is_enabled, measure
+
+STRATEGIES = ("naive", "find", "index", "automaton")
+# The k-mer index takes about as long to build as several hundred str.find
+# scans of the same data, so it is built once that many queries were
+# answered by scanning; short sequences are scanned about as fast as the
+# index is probed.
+INDEX_MIN_QUERIES = 512
+INDEX_MIN_LENGTH = 1 << 16
+INDEX_KEY_BITS = 16
+# One automaton pass costs about as much as ~50 str.find scans, and building
+# it about as much as scanning a few thousand symbols per motif.
+AUTOMATON_MIN_MOTIFS = 64
+AUTOMATON_MIN_LENGTH = 1 << 15
+
+
+def naive_positions(data: str, motif: str):
+    """
+    Return the start positions of motif with the original slice-and-compare loop.
+
+    Kept as the reference strategy; every other strategy returns exactly
+    the same (overlapping) positions.
+
+    Outsource:
+    - docstrings
+    """
+    positions = []
+    motif_length = len(motif)
+    for i in range(len(data) - motif_length + 1):
+        if data[i:i + motif_length] == motif:
+            positions.append(i)
+    return positions
+
+
+def find_positions(data: str, motif: str):
+    """
+    Return the start positions of motif by repeated str.find.
+
+    str.find runs CPython's fastsearch, which already skips ahead with a
+    Boyer-Moore-Horspool style table (and switches to Two-Way for long
+    motifs), so only the hits themselves cost Python-level work. Restarting
+    one character after each hit keeps overlapping occurrences.
+
+    Outsource:
+    - docstrings
+    """
+    positions = []
+    find = data.find
+    position = find(motif)
+    while position >= 0:
+        positions.append(position)
+        position = find(motif, position + 1)
+    return positions
+
+
+def index_k(alphabet_size: int):
+    """Return the k-mer length of a MotifIndex, so that keys cover about INDEX_KEY_BITS bits."""
+    return max(1, INDEX_KEY_BITS // max(1, (alphabet_size - 1).bit_length()))
+
+
+class MotifIndex:
+    """
+    Positions of every k-mer of a sequence, for answering many motif queries.
+
+    A motif of at least k symbols is looked up by its rarest k-mer, and
+    only the positions of that k-mer are checked against the data, so a
+    query costs O(occurrences of that k-mer) instead of a scan of the whole
+    sequence. Positions are stored in 64-bit arrays.
+
+    Attributes:
+        data (str): Indexed sequence data
+        k (int): K-mer length; shorter motifs cannot be looked up
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, data: str, k: int):
+        """
+        Index every k-mer of data.
+
+        Raises:
+            ValueError: If k is not greater than 0
+
+        Outsource:
+        - docstrings
+        """
+        if k <= 0:
+            raise ValueError("k must be greater than 0")
+        self.data = data
+        self.k = k
+        lists = {}
+        windows = map(data.__getitem__, map(slice, range(len(data) - k + 1), range(k, len(data) + 1)))
+        for position, kmer in enumerate(windows):
+            positions = lists.get(kmer)
+            if positions is None:
+                lists[kmer] = [position]
+            else:
+                positions.append(position)
+        self._positions = {kmer: array("q", positions) for kmer, positions in lists.items()}
+
+    def positions(self, motif: str):
+        """
+        Return the start positions of motif, in increasing order.
+
+        Raises:
+            ValueError: If the motif is shorter than k
+
+        Outsource:
+        - docstrings
+        """
+        k = self.k
+        if len(motif) < k:
+            raise ValueError(f"Motif must be at least {k} symbols long.")
+        empty = ()
+        best_offset, best = 0, None
+        for offset in range(len(motif) - k + 1):
+            candidates = self._positions.get(motif[offset:offset + k], empty)
+            if best is None or len(candidates) < len(best):
+                best_offset, best = offset, candidates
+                if not candidates:
+                    return []
+        if len(motif) == k:
+            return best.tolist()
+        startswith = self.data.startswith
+        return [position - best_offset for position in best
+                if position >= best_offset and startswith(motif, position - best_offset)]
+
+
+class MotifAutomaton:
+    """
+    Aho-Corasick automaton finding many motifs in one pass over a sequence.
+
+    Each data symbol costs one transition lookup whatever the number of
+    motifs, and overlapping occurrences of every motif are reported.
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, motifs):
+        """
+        Build the automaton.
+
+        Args:
+            motifs (iterable): Non-empty motifs (duplicates are merged)
+
+        Raises:
+            ValueError: If a motif is empty
+
+        Outsource:
+        - docstrings
+        """
+        self.motifs = list(dict.fromkeys(motifs))
+        if not all(self.motifs):
+            raise ValueError("Motifs must not be empty.")
+        children = [{}]
+        outputs = [[]]
+        for number, motif in enumerate(self.motifs):
+            state = 0
+            for symbol in motif:
+                child = children[state].get(symbol)
+                if child is None:
+                    child = children[state][symbol] = len(children)
+                    children.append({})
+                    outputs.append([])
+                state = child
+            outputs[state].append(number)
+        # Breadth-first: a state's transitions are completed from its failure
+        # state, which is shallower and therefore already complete.
+        transitions = [dict(children[0])]
+        transitions.extend({} for _ in range(len(children) - 1))
+        failure = [0] * len(children)
+        queue = deque(children[0].values())
+        while queue:
+            state = queue.popleft()
+            row = transitions[state]
+            row.update(transitions[failure[state]])
+            for symbol, child in children[state].items():
+                failure[child] = transitions[failure[state]].get(symbol, 0)
+                row[symbol] = child
+                queue.append(child)
+            outputs[state] = outputs[state] + outputs[failure[state]]
+        self._transitions = transitions
+        self._outputs = outputs
+
+    def search(self, data: str):
+        """
+        Find every motif in data.
+
+        Returns:
+            dict: Mapping of motif to its start positions in increasing order
+
+        Outsource:
+        - docstrings
+        """
+        lengths = [len(motif) for motif in self.motifs]
+        found = [[] for _ in self.motifs]
+        transitions, outputs = self._transitions, self._outputs
+        state = 0
+        for end, symbol in enumerate(data, 1):
+            state = transitions[state].get(symbol, 0)
+            if outputs[state]:
+                for number in outputs[state]:
+                    found[number].append(end - lengths[number])
+        return dict(zip(self.motifs, found))
+
+
+def choose_strategy(data_length: int, motif_length: int, motif_count: int = 1, indexed: bool = False):
+    """
+    Pick the search strategy for a query.
+
+    Rules, from measurements of the pure-Python implementations:
+    - "index" when a k-mer index of the data exists and covers the motif
+      length (the caller checks the length);
+    - "automaton" for at least AUTOMATON_MIN_MOTIFS motifs on data of at
+      least AUTOMATON_MIN_LENGTH symbols;
+    - "find" otherwise; it is faster than the "naive" loop for every data
+      and motif length, which is therefore never chosen.
+
+    Args:
+        data_length (int): Sequence length
+        motif_length (int): Motif length
+        motif_count (int): Number of motifs searched together
+        indexed (bool): Whether a usable index exists
+
+    Returns:
+        str: One of STRATEGIES
+
+    Outsource:
+    - docstrings
+    """
+    if motif_length > data_length:
+        return "find"
+    if indexed:
+        return "index"
+    if motif_count >= AUTOMATON_MIN_MOTIFS and data_length >= AUTOMATON_MIN_LENGTH:
+        return "automaton"
+    return "find"
+
+
+def search_positions(data: str, motif: str, strategy: str = None):
+    """
+    Return the start positions of one motif, without any cached state.
+
+    Args:
+        data (str): Sequence data
+        motif (str): Motif, in the same case as data
+        strategy (str): One of STRATEGIES, or None to choose automatically
+
+    Returns:
+        list: 0-based start positions, overlapping occurrences included
+
+    Raises:
+        ValueError: If the strategy is unknown
+
+    Outsource:
+    - docstrings
+    """
+    if strategy is None:
+        strategy = choose_strategy(len(data), len(motif))
+    if strategy == "naive":
+        return naive_positions(data, motif)
+    if strategy == "find":
+        return find_positions(data, motif)
+    if strategy == "index":
+        if not motif or len(motif) > len(data):
+            return find_positions(data, motif)
+        return MotifIndex(data, len(motif)).positions(motif)
+    if strategy == "automaton":
+        if not motif:
+            return find_positions(data, motif)
+        return MotifAutomaton([motif]).search(data)[motif]
+    raise ValueError(f"Unknown strategy: {strategy}")
+
+
+class MotifSearcher:
+    """
+    Motif search over one sequence's data, choosing the strategy per query.
+
+    Counts the queries the k-mer index could answer and builds the index
+    once they would have paid for it; later queries of at least k symbols
+    use it. The data is passed to every query rather than kept, so a
+    searcher without an index holds no copy of it; the caller passes the
+    same data each time and starts a new searcher when it changes
+    (sequences compare `version` with their mutation counter). With
+    instrumentation enabled, every query is also recorded as
+    "<owner>.find_motif[<strategy>]".
+
+    Attributes:
+        version (int): Version of the data the searcher belongs to, set by the caller
+        k (int): K-mer length of the index
+        queries (int): Queries long enough for the index, answered so far
+        index (MotifIndex): The index, None until built
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("version", "k", "queries", "index")
+
+    def __init__(self, alphabet_size: int, version: int = 0):
+        """
+        Start without an index.
+
+        Args:
+            alphabet_size (int): Number of valid symbols, which sets the index k
+            version (int): Version of the data the searcher belongs to
+
+        Outsource:
+        - docstrings
+        """
+        self.version = version
+        self.k = index_k(alphabet_size)
+        self.queries = 0
+        self.index = None
+
+    def _indexed(self, data: str, motif_length: int, count: int = 1):
+        """Count indexable queries, build the index when due and return whether it can be used."""
+        if motif_length < self.k or len(data) < INDEX_MIN_LENGTH:
+            return False
+        if self.index is None:
+            self.queries += count
+            if self.queries < INDEX_MIN_QUERIES:
+                return False
+            self.index = MotifIndex(data, self.k)
+        return True
+
+    def _run(self, strategy: str, owner: str, operation: str, search, *args):
+        """Run search(*args), recorded under the strategy when instrumentation is on."""
+        if not is_enabled():
+            return search(*args)
+        with measure(f"{owner}.{operation}[{strategy}]"):
+            return search(*args)
+
+    def positions(self, data: str, motif: str, owner: str = "sequence"):
+        """
+        Return the start positions of one motif.
+
+        Args:
+            data (str): Sequence data
+            motif (str): Motif, in the same case as data
+            owner (str): Name used in instrumentation, e.g. the sequence class
+
+        Returns:
+            list: 0-based start positions, overlapping occurrences included
+
+        Outsource:
+        - docstrings
+        """
+        indexed = INDEX_MIN_LENGTH <= len(data) and len(motif) <= len(data) and self._indexed(data, len(motif))
+        strategy = choose_strategy(len(data), len(motif), indexed=indexed)
+        if strategy == "index":
+            return self._run(strategy, owner, "find_motif", self.index.positions, motif)
+        if not is_enabled():
+            return find_positions(data, motif)
+        return self._run(strategy, owner, "find_motif", find_positions, data, motif)
+
+    def positions_many(self, data: str, motifs, owner: str = "sequence"):
+        """
+        Return the start positions of several motifs.
+
+        Motifs the index can answer are looked up in it; the rest are found
+        with one automaton pass if there are enough of them, or one scan each.
+
+        Args:
+            data (str): Sequence data
+            motifs (iterable): Motifs, in the same case as data
+            owner (str): Name used in instrumentation, e.g. the sequence class
+
+        Returns:
+            dict: Mapping of every distinct motif to its start positions
+
+        Outsource:
+        - docstrings
+        """
+        found = {}
+        motifs = list(dict.fromkeys(motifs))
+        for motif in motifs:
+            if len(motif) > len(data):
+                found[motif] = []
+        motifs = [motif for motif in motifs if motif not in found]
+        indexable = [motif for motif in motifs if len(motif) >= self.k]
+        if indexable and self._indexed(data, self.k, len(indexable)):
+            for motif in indexable:
+                found[motif] = self._run("index", owner, "find_motifs", self.index.positions, motif)
+        remaining = [motif for motif in motifs if motif not in found]
+        searchable = [motif for motif in remaining if motif]
+        strategy = choose_strategy(len(data), 1, len(searchable))
+        if strategy == "automaton":
+            found.update(self._run(strategy, owner, "find_motifs", MotifAutomaton(searchable).search, data))
+        for motif in remaining:
+            if motif not in found:
+                found[motif] = self._run("find", owner, "find_motifs", find_positions, data, motif)
+        return found
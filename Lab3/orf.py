@@ -0,0 +1,99 @@
+import re
+
+# Forward start/stop codons and their reverse complements, as they read on
+# the forward strand. A reverse-strand ORF starts at a CAT and ends at one
+# of the reverse stops to its left.
+_CODONS = {
+    "T": (("ATG",), ("TAA", "TAG", "TGA"), ("CAT",), ("TTA", "CTA", "TCA")),
+}
+_CODONS["U"] = tuple(tuple(codon.replace("T", "U") for codon in codons) for codons in _CODONS["T"])
+_PATTERNS = {}
+
+FORWARD_START, FORWARD_STOP, REVERSE_START, REVERSE_STOP = 1, 2, 3, 4
+
+
+def _codon_pattern(thymine: str):
+    """
+    Return the compiled pattern matching every start or stop codon on both strands.
+
+    The four alternatives are capturing groups inside a lookahead, so one
+    scan reports overlapping codons in all six frames and `match.lastindex`
+    tells which kind of codon was found.
+
+    Outsource:
+    - docstrings
+    """
+    pattern = _PATTERNS.get(thymine)
+    if pattern is None:
+        groups = ("({})".format("|".join(codons)) for codons in _CODONS[thymine])
+        pattern = re.compile("(?=" + "|".join(groups) + ")")
+        _PATTERNS[thymine] = pattern
+    return pattern
+
+
+def find_orfs(data: str, min_length: int = 75, thymine: str = "T"):
+    """
+    Yield the open reading frames of nucleotide data in all six frames.
+
+    A single scan over the data finds every start and stop codon of both
+    strands; each frame then keeps only the position of its pending start,
+    so memory use does not grow with the sequence and ORFs are yielded as
+    soon as the scan has passed them (ordered by where they close, not by
+    start). For every stop codon only the longest ORF is reported, i.e. the
+    one from the first start after the previous in-frame stop; ORFs that run
+    off the end of the sequence without a stop codon are skipped.
+
+    There is deliberately no NumPy path (unlike the optional ones in
+    storage.py and columnar.py): per-frame codon index arrays would have to
+    encode the whole sequence up front, costing several bytes per base and
+    losing the lazy, constant-memory scan, while the regex scan already runs
+    in C.
+
+    Args:
+        data (str): Uppercase DNA or RNA sequence string
+        min_length (int): Minimum ORF length in bases, stop codon included (default: 75)
+        thymine (str): "T" for DNA or "U" for RNA data (default: "T")
+
+    Yields:
+        tuple: (start, end, frame) where start and end are 0-based forward-strand
+            coordinates (end exclusive, stop codon included) and frame is +1, +2, +3
+            for the forward strand or -1, -2, -3 for the reverse strand, counted
+            from the respective 5' end
+
+    Raises:
+        ValueError: If min_length is negative
+
+    Outsource:
+    - docstrings
+    """
+    if min_length < 0:
+        raise ValueError("Minimum ORF length must not be negative.")
+    length = len(data)
+    forward_start = [None, None, None]
+    reverse_start = [None, None, None]
+    reverse_stop = [None, None, None]
+    for match in _codon_pattern(thymine).finditer(data):
+        position = match.start()
+        kind = match.lastindex
+        phase = position % 3
+        if kind == FORWARD_START:
+            if forward_start[phase] is None:
+                forward_start[phase] = position
+        elif kind == FORWARD_STOP:
+            start = forward_start[phase]
+            if start is not None:
+                forward_start[phase] = None
+                if position + 3 - start >= min_length:
+                    yield start, position + 3, phase + 1
+        elif kind == REVERSE_START:
+            reverse_start[phase] = position
+        else:
+            start, stop = reverse_start[phase], reverse_stop[phase]
+            if start is not None and stop is not None and start + 3 - stop >= min_length:
+                yield stop, start + 3, -((length - start - 3) % 3 + 1)
+            reverse_start[phase] = None
+            reverse_stop[phase] = position
+    for phase in range(3):
+        start, stop = reverse_start[phase], reverse_stop[phase]
+        if start is not None and stop is not None and start + 3 - stop >= min_length:
+            yield stop, start + 3, -((length - start - 3) % 3 + 1)
@@ -0,0 +1,330 @@
+from bisect import bisect_left, bisect_right
+
+from instrument import instrumented
+
+MAX_CACHED_MOTIFS = 16
+_DNA_COMPLEMENT = str.maketrans("ACGT", "TGCA")
+_RNA_COMPLEMENT = str.maketrans("ACGU", "UGCA")
+_shared = None
+
+
+def _reference_cache(reference):
+    """
+    Return the dict of values derived from `reference` that overlays share.
+
+    Entries are (data version, value) pairs and are only valid while the
+    reference's mutation counter still has that version (the same check as
+    the other sequence caches). The cache does not keep references alive.
+
+    Outsource:
+    - docstrings
+    """
+    global _shared
+    if _shared is None:
+        from weakref import WeakKeyDictionary
+        _shared = WeakKeyDictionary()
+    cache = _shared.get(reference)
+    if cache is None:
+        cache = _shared[reference] = {}
+    return cache
+
+
+def _shared_value(reference, key, compute):
+    """Return compute() for `reference`, computed once per reference data and shared by all overlays."""
+    cache = _reference_cache(reference)
+    entry = cache.get(key)
+    if entry is None or entry[0] != reference._version:
+        if key[0] == "motif" and len(cache) >= MAX_CACHED_MOTIFS:
+            for stale in [name for name in cache if name[0] == "motif"]:
+                del cache[stale]
+        entry = cache[key] = (reference._version, compute())
+    return entry[1]
+
+
+class VariantOverlay:
+    """
+    A sequence represented as a shared reference plus a sparse set of variants.
+
+    Each variant replaces reference[position:position + ref_length] with
+    `alt`, so substitutions, insertions (ref_length 0) and deletions (empty
+    alt) are all one kind of edit. Variants are kept sorted by reference
+    position and must not overlap. The reference is never copied: thousands
+    of haplotypes can share one reference object, and length, slicing, motif
+    search, complement and transcription work without building the full
+    variant sequence. The reference must not be mutated while overlays use it.
+
+    Attributes:
+        reference (BaseSequence): The shared reference sequence
+        identifier (str): Identifier of the overlay sequence
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, reference, variants=(), identifier: str = None):
+        """
+        Initialize an overlay.
+
+        Args:
+            reference (BaseSequence): Reference sequence (DNA, RNA or protein)
+            variants (iterable): (position, ref_length, alt) tuples in reference coordinates
+            identifier (str): Identifier of the overlay, defaults to the reference identifier
+
+        Raises:
+            ValueError: If a variant contains invalid characters, is empty or overlaps another one
+            IndexError: If a variant lies outside the reference
+
+        Outsource:
+        - docstrings
+        """
+        self.reference = reference
+        self.identifier = reference.identifier if identifier is None else identifier
+        self._starts = []
+        self._ends = []
+        self._alts = []
+        self._layout = None
+        for position, ref_length, alt in variants:
+            self.add_variant(position, ref_length, alt)
+
+    def add_variant(self, position: int, ref_length: int, alt: str):
+        """
+        Replace reference[position:position + ref_length] with alt.
+
+        Args:
+            position (int): 0-based reference position where the variant starts
+            ref_length (int): Number of reference characters replaced (0 for an insertion)
+            alt (str): Replacement characters (case-insensitive, empty for a deletion)
+
+        Raises:
+            ValueError: If alt contains invalid characters, the variant changes nothing,
+                or it overlaps an existing variant (two insertions at one position overlap)
+            IndexError: If the variant lies outside the reference
+
+        Outsource:
+        - docstrings
+        """
+        reference = self.reference
+        alt = alt.upper()
+        if not set(alt) <= reference.valid_chars:
+            raise ValueError(reference.invalid_value_message)
+        if ref_length < 0 or position < 0 or position + ref_length > len(reference):
+            raise IndexError(reference.position_message)
+        if ref_length == 0 and not alt:
+            raise ValueError("Empty variant: nothing replaced and nothing inserted.")
+        end = position + ref_length
+        # An insertion goes before a substitution or deletion at the same position.
+        index = bisect_left(self._starts, position)
+        if ref_length and index < len(self._starts) and self._starts[index] == self._ends[index] == position:
+            index += 1
+        if index and self._ends[index - 1] > position:
+            raise ValueError("Variant overlaps an existing variant.")
+        if index < len(self._starts):
+            next_start, next_end = self._starts[index], self._ends[index]
+            if next_start < end or (ref_length == 0 and next_start == next_end == position):
+                raise ValueError("Variant overlaps an existing variant.")
+        self._starts.insert(index, position)
+        self._ends.insert(index, end)
+        self._alts.insert(index, alt)
+        self._layout = None
+
+    def substitute(self, position: int, bases: str):
+        """Replace len(bases) reference characters starting at position."""
+        self.add_variant(position, len(bases), bases)
+
+    def insert(self, position: int, bases: str):
+        """Insert bases before the reference character at position."""
+        self.add_variant(position, 0, bases)
+
+    def delete(self, position: int, length: int = 1):
+        """Delete `length` reference characters starting at position."""
+        self.add_variant(position, length, "")
+
+    @property
+    def variants(self):
+        """List of (position, ref_length, alt) tuples sorted by reference position."""
+        return [(start, end - start, alt) for start, end, alt in zip(self._starts, self._ends, self._alts)]
+
+    def _get_layout(self):
+        """
+        Return (overlay starts, overlay ends) of every variant's alt, rebuilt after edits.
+
+        Outsource:
+        - docstrings
+        """
+        if self._layout is None:
+            starts, ends = [], []
+            shift = 0
+            for start, end, alt in zip(self._starts, self._ends, self._alts):
+                starts.append(start + shift)
+                shift += len(alt) - (end - start)
+                ends.append(end + shift)
+            self._layout = (starts, ends)
+        return self._layout
+
+    def __len__(self):
+        """Return the length of the variant sequence."""
+        ends = self._get_layout()[1]
+        if not ends:
+            return len(self.reference)
+        return ends[-1] + len(self.reference) - self._ends[-1]
+
+    def _text(self, start: int, stop: int):
+        """
+        Return characters start..stop (0 <= start <= stop <= len(self)) of the variant sequence.
+
+        Only the reference pieces and alts inside the range are decoded and
+        copied; the rest of the reference is never read.
+
+        Outsource:
+        - docstrings
+        """
+        overlay_starts, overlay_ends = self._get_layout()
+        reference = self.reference
+        count = len(overlay_starts)
+        length = len(self)
+        parts = []
+        position = start
+        index = bisect_right(overlay_ends, start)
+        while position < stop:
+            piece_end = overlay_starts[index] if index < count else length
+            if position < piece_end:
+                shift = (self._ends[index - 1] - overlay_ends[index - 1]) if index else 0
+                end = min(stop, piece_end)
+                parts.append(reference[position + shift:end + shift])
+                position = end
+            if position < stop and index < count:
+                end = min(stop, overlay_ends[index])
+                parts.append(self._alts[index][position - overlay_starts[index]:end - overlay_starts[index]])
+                position = end
+            index += 1
+        return "".join(parts)
+
+    def __getitem__(self, key):
+        """
+        Return one character or a slice of the variant sequence as a str.
+
+        Raises:
+            IndexError: If an integer index is out of range
+
+        Outsource:
+        - docstrings
+        """
+        length = len(self)
+        if isinstance(key, slice):
+            indices = range(*key.indices(length))
+            if not indices:
+                return ""
+            if indices.step == 1:
+                return self._text(indices.start, indices.stop)
+            low = min(indices[0], indices[-1])
+            text = self._text(low, max(indices[0], indices[-1]) + 1)
+            return "".join(text[i - low] for i in indices)
+        if key < 0:
+            key += length
+        if not 0 <= key < length:
+            raise IndexError("Overlay index out of range.")
+        return self._text(key, key + 1)
+
+    @property
+    def data(self):
+        """The full variant sequence as a str (materialized on every access)."""
+        return self._text(0, len(self))
+
+    def __str__(self):
+        """Return the overlay in FASTA format."""
+        return f">{self.identifier}\n{self.data}"
+
+    def to_sequence(self):
+        """Return the variant sequence as a new object of the reference's class."""
+        return type(self.reference)._from_valid(self.identifier, self.data)
+
+    @instrumented("VariantOverlay.find_motif")
+    def find_motif(self, motif: str):
+        """
+        Find all occurrences of a motif in the variant sequence.
+
+        Reference hits are computed once per reference and motif and shared
+        by every overlay of that reference; hits that do not touch a variant
+        are shifted to overlay coordinates, and only short windows around the
+        variants are searched again.
+
+        Args:
+            motif (str): Sequence pattern to search for (case-insensitive)
+
+        Returns:
+            list: Sorted 0-based positions in the variant sequence where the motif starts
+
+        Outsource:
+        - docstrings
+        """
+        motif = motif.upper()
+        size = len(motif)
+        if not size:
+            return list(range(len(self) + 1))
+        reference = self.reference
+        overlay_starts, overlay_ends = self._get_layout()
+        starts, ends = self._starts, self._ends
+        count = len(starts)
+        hits = set()
+        for position in _shared_value(reference, ("motif", motif),
+                                      lambda: reference._motif_positions(motif)):
+            index = bisect_right(ends, position)
+            if index < count and starts[index] < position + size:
+                continue
+            hits.add(position + (overlay_ends[index - 1] - ends[index - 1] if index else 0))
+        length = len(self)
+        for alt_start, alt_end in zip(overlay_starts, overlay_ends):
+            low = max(0, alt_start - size + 1)
+            window = self._text(low, min(length, alt_end + size - 1))
+            found = window.find(motif)
+            while found != -1:
+                position = low + found
+                if position < alt_end and position + size > alt_start:
+                    hits.add(position)
+                found = window.find(motif, found + 1)
+        return sorted(hits)
+
+    def _derived(self, operation: str, suffix: str, table):
+        """
+        Return a new overlay on the shared derived reference with every alt mapped through table.
+
+        Outsource:
+        - docstrings
+        """
+        derived_reference = _shared_value(self.reference, (operation,), getattr(self.reference, operation))
+        overlay = VariantOverlay(derived_reference, identifier=self.identifier + suffix)
+        overlay._starts = list(self._starts)
+        overlay._ends = list(self._ends)
+        overlay._alts = [alt.translate(table) for alt in self._alts]
+        return overlay
+
+    def complement(self):
+        """
+        Return the complementary strand as an overlay (DNA or RNA references).
+
+        The complemented reference is built once and shared by all overlays
+        of the same reference.
+
+        Returns:
+            VariantOverlay: Overlay with "_comp" suffix in identifier
+
+        Outsource:
+        - docstrings
+        """
+        table = _RNA_COMPLEMENT if "U" in self.reference.valid_chars else _DNA_COMPLEMENT
+        return self._derived("complement", "_comp", table)
+
+    def transcribe(self):
+        """
+        Return the RNA transcript as an overlay (DNA references).
+
+        The transcribed reference is built once and shared by all overlays
+        of the same reference.
+
+        Returns:
+            VariantOverlay: Overlay with "_RNA" suffix in identifier
+
+        Outsource:
+        - docstrings
+        """
+        return self._derived("transcribe", "_RNA", str.maketrans("T", "U"))
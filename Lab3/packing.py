@@ -0,0 +1,71 @@
+from itertools import product
+
+# 2-bit nucleotide packing shared by the packed storage backend, the binary
+# container format and the k-mer counter: four bases per byte, first base in
+# the high bits, codes in alphabet order (A=0, C=1, G=2, T/U=3 for "ACGT"/"ACGU").
+
+_TABLES = {}
+
+
+def packing_tables(alphabet: str):
+    """
+    Return (pack, unpack, codes) tables for a four-letter alphabet.
+
+    pack maps four characters to one byte, unpack maps a byte back to four
+    characters and codes maps a character to its 2-bit code. Tables are
+    built once per alphabet.
+
+    Args:
+        alphabet (str): The four characters, in code order (e.g. "ACGT")
+
+    Raises:
+        ValueError: If alphabet does not have exactly four characters
+
+    Outsource:
+    - docstrings
+    """
+    tables = _TABLES.get(alphabet)
+    if tables is None:
+        if len(alphabet) != 4:
+            raise ValueError("2-bit packing needs a four-letter alphabet.")
+        words = ["".join(chars) for chars in product(alphabet, repeat=4)]
+        tables = ({word: i for i, word in enumerate(words)}, words, {char: i for i, char in enumerate(alphabet)})
+        _TABLES[alphabet] = tables
+    return tables
+
+
+def pack(data: str, alphabet: str = "ACGT"):
+    """
+    Pack data over a four-letter alphabet into 2 bits per character.
+
+    Args:
+        data (str): Uppercase data over `alphabet`
+        alphabet (str): The four characters, in code order
+
+    Returns:
+        bytearray: Packed data, len(data) / 4 rounded up bytes long; the
+            last byte is padded with the first character of the alphabet
+
+    Outsource:
+    - docstrings
+    """
+    table = packing_tables(alphabet)[0]
+    padded = data + alphabet[0] * (-len(data) % 4)
+    return bytearray(map(table.__getitem__, (padded[i:i + 4] for i in range(0, len(padded), 4))))
+
+
+def unpack(packed, length: int, alphabet: str = "ACGT", start: int = 0):
+    """
+    Unpack `length` characters starting at character `start` of packed data.
+
+    Only the bytes covering the requested characters are decoded.
+
+    Outsource:
+    - docstrings
+    """
+    table = packing_tables(alphabet)[1]
+    first = start // 4
+    last = (start + length + 3) // 4
+    text = "".join(map(table.__getitem__, packed[first:last]))
+    offset = start - first * 4
+    return text[offset:offset + length]
@@ -0,0 +1,137 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from ex32 import translate_rna
+from ex33 import ProteinSequence
+
+
+def _partition(spans, parts: int):
+    """
+    Split record spans into at most `parts` contiguous chunks of similar total length.
+
+    Chunks are contiguous so that concatenating their results keeps input order.
+
+    Outsource:
+    - docstrings
+    """
+    total = sum(end - start for start, end in spans)
+    target = total / parts
+    chunks = []
+    current = []
+    size = 0
+    for span in spans:
+        current.append(span)
+        size += span[1] - span[0]
+        if size >= target and len(chunks) < parts - 1:
+            chunks.append(current)
+            current = []
+            size = 0
+    if current or not chunks:
+        chunks.append(current)
+    return chunks
+
+
+def _translate_chunk(buffer_name: str, spans):
+    """
+    Translate the records of one chunk from shared memory (runs in a worker).
+
+    Args:
+        buffer_name (str): Name of the shared memory block holding all RNA data
+        spans (list): (start, end) byte offsets of the records in the block
+
+    Returns:
+        tuple: (proteins, process id, number of bases, seconds spent)
+
+    Outsource:
+    - docstrings
+    """
+    started = time.perf_counter()
+    block = shared_memory.SharedMemory(name=buffer_name)
+    try:
+        buffer = block.buf
+        proteins = [translate_rna(bytes(buffer[start:end]).decode("ascii")) for start, end in spans]
+        del buffer
+    finally:
+        block.close()
+    bases = sum(end - start for start, end in spans)
+    return proteins, os.getpid(), bases, time.perf_counter() - started
+
+
+def translate_many(sequences, workers: int = None, return_report: bool = False):
+    """
+    Translate many RNA sequences in parallel worker processes.
+
+    All sequence data is copied once into a shared memory block; workers
+    receive only the block name and their (start, end) offsets, so nothing
+    sequence-sized is pickled. Records are split into contiguous chunks of
+    similar total length, one per worker, and results are returned in
+    input order.
+
+    Args:
+        sequences (list): RNASequence objects to translate
+        workers (int): Number of worker processes (default: CPU count);
+            1 translates in the current process
+        return_report (bool): Also return per-worker throughput
+
+    Returns:
+        list: ProteinSequence objects with "_PROT" suffix in identifier, in input order.
+            With `return_report`, a (proteins, report) tuple where report is a list of
+            dicts with pid, records, bases, seconds and bases_per_second per chunk
+
+    Raises:
+        ValueError: If workers is not greater than 0, or a translation contains an unknown codon
+
+    Outsource:
+    - docstrings
+    """
+    sequences = list(sequences)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("Number of workers must be greater than 0.")
+
+    if workers == 1 or len(sequences) < 2:
+        started = time.perf_counter()
+        chunk_proteins = [translate_rna(sequence.data) for sequence in sequences]
+        bases = sum(map(len, sequences))
+        results = [(chunk_proteins, os.getpid(), bases, time.perf_counter() - started)]
+    else:
+        spans = []
+        offset = 0
+        for sequence in sequences:
+            spans.append((offset, offset + len(sequence)))
+            offset += len(sequence)
+        payload = "".join(sequence.data for sequence in sequences).encode("ascii")
+        chunks = _partition(spans, min(workers, len(sequences)))
+        block = shared_memory.SharedMemory(create=True, size=max(len(payload), 1))
+        try:
+            block.buf[:len(payload)] = payload
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                futures = [pool.submit(_translate_chunk, block.name, chunk) for chunk in chunks]
+                results = [future.result() for future in futures]
+        finally:
+            block.close()
+            block.unlink()
+
+    proteins = []
+    report = []
+    records = iter(sequences)
+    for chunk_proteins, pid, bases, seconds in results:
+        for protein in chunk_proteins:
+            identifier = next(records).identifier + "_PROT"
+            if "?" in protein:
+                proteins.append(ProteinSequence(identifier, protein))
+            else:
+                proteins.append(ProteinSequence._from_valid(identifier, protein))
+        report.append({
+            "pid": pid,
+            "records": len(chunk_proteins),
+            "bases": bases,
+            "seconds": seconds,
+            "bases_per_second": bases / seconds if seconds else 0.0,
+        })
+    if return_report:
+        return proteins, report
+    return proteins
@@ -0,0 +1,216 @@
+from ex31 import DNASequence, translate_dna
+from ex31 import _complement_data as _complement_dna
+from ex31 import _transcribe_data as _transcribe_dna
+from ex32 import RNASequence, translate_rna
+from ex32 import _complement_data as _complement_rna
+from ex33 import ProteinSequence
+from fasta import read_fasta
+
+SEQUENCE_CLASSES = {"dna": DNASequence, "rna": RNASequence, "protein": ProteinSequence}
+
+
+def _reverse_complement_dna(data: str):
+    """Return the reverse complement of DNA data."""
+    return _complement_dna(data)[::-1]
+
+
+# stage name: (input kind, output kind, identifier suffix, data function)
+_STAGES = {
+    "complement": (None, None, "_comp", None),
+    "reverse_complement": ("dna", "dna", "_revcomp", _reverse_complement_dna),
+    "transcribe": ("dna", "rna", "_RNA", _transcribe_dna),
+    "translate": ("rna", "protein", "_PROT", translate_rna),
+}
+_COMPLEMENT = {"dna": _complement_dna, "rna": _complement_rna}
+
+
+class SequenceStream:
+    """
+    Lazy, composable pipeline over a stream of sequence records.
+
+    Stages are only recorded when chained; nothing runs until the stream is
+    iterated, and then records flow through all stages one at a time, so
+    memory stays constant however many records there are. Consecutive
+    transcribe().translate() stages are fused into a single step that
+    translates DNA codons directly, without building the RNA string.
+
+    Attributes:
+        kind (str): Type of the records the stream yields: "dna", "rna" or "protein"
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, records, kind: str = "dna"):
+        """
+        Initialize a stream over sequence objects or (identifier, data) tuples.
+
+        Tuples are validated with the sequence class of `kind` as they are read;
+        sequence objects are trusted.
+
+        Args:
+            records (iterable): Sequence objects or (identifier, data) tuples
+            kind (str): "dna", "rna" or "protein"
+
+        Raises:
+            ValueError: If kind is unknown
+
+        Outsource:
+        - docstrings
+        """
+        if kind not in SEQUENCE_CLASSES:
+            raise ValueError('Stream kind must be "dna", "rna" or "protein".')
+        self.kind = kind
+        self._records = records
+        self._input_kind = kind
+        self._stages = ()
+
+    @classmethod
+    def from_fasta(cls, handle, kind: str = "dna"):
+        """
+        Create a stream reading records lazily from an open FASTA file.
+
+        Outsource:
+        - docstrings
+        """
+        return cls(read_fasta(handle), kind)
+
+    def _then(self, stage: str, argument=None):
+        """
+        Return a new stream with one more stage, checking that the stage fits.
+
+        Raises:
+            ValueError: If the stage cannot be applied to the current record kind
+
+        Outsource:
+        - docstrings
+        """
+        if stage in _STAGES:
+            needed, produced, _, _ = _STAGES[stage]
+            if needed is not None and needed != self.kind:
+                raise ValueError(f"{stage}() needs a {needed.upper()} stream, not {self.kind.upper()}.")
+            if stage == "complement" and self.kind == "protein":
+                raise ValueError("complement() needs a DNA or RNA stream, not PROTEIN.")
+        else:
+            produced = None
+        stream = SequenceStream.__new__(SequenceStream)
+        stream.kind = produced or self.kind
+        stream._records = self._records
+        stream._input_kind = self._input_kind
+        stream._stages = self._stages + ((stage, self.kind, argument),)
+        return stream
+
+    def complement(self):
+        """Add a complement stage (DNA or RNA)."""
+        return self._then("complement")
+
+    def reverse_complement(self):
+        """Add a reverse complement stage (DNA)."""
+        return self._then("reverse_complement")
+
+    def transcribe(self):
+        """Add a DNA to RNA transcription stage."""
+        return self._then("transcribe")
+
+    def translate(self):
+        """Add an RNA to protein translation stage."""
+        return self._then("translate")
+
+    def filter(self, predicate):
+        """
+        Keep only records for which predicate(sequence) is true.
+
+        Args:
+            predicate (callable): Receives a sequence object of the current kind
+
+        Outsource:
+        - docstrings
+        """
+        return self._then("filter", predicate)
+
+    def _source(self):
+        """Yield (identifier, data) tuples from the input records."""
+        sequence_class = SEQUENCE_CLASSES[self._input_kind]
+        for record in self._records:
+            if isinstance(record, tuple):
+                identifier, data = record
+                yield identifier, sequence_class(identifier, data).data
+            else:
+                yield record.identifier, record.data
+
+    def _plan(self):
+        """
+        Turn the recorded stages into data functions, fusing transcribe + translate.
+
+        Returns:
+            list: (kind, identifier suffix, data function or None, filter predicate or None)
+
+        Outsource:
+        - docstrings
+        """
+        plan = []
+        stages = list(self._stages)
+        i = 0
+        while i < len(stages):
+            stage, kind, argument = stages[i]
+            if stage == "filter":
+                plan.append((kind, "", None, argument))
+            elif stage == "transcribe" and i + 1 < len(stages) and stages[i + 1][0] == "translate":
+                plan.append(("protein", "_RNA_PROT", translate_dna, None))
+                i += 1
+            elif stage == "complement":
+                plan.append((kind, "_comp", _COMPLEMENT[kind], None))
+            else:
+                _, produced, suffix, function = _STAGES[stage]
+                plan.append((produced, suffix, function, None))
+            i += 1
+        return plan
+
+    def __iter__(self):
+        """
+        Run the pipeline lazily, yielding one sequence object per surviving record.
+
+        Raises:
+            ValueError: If an input tuple is invalid, or a translation hits an unknown codon
+
+        Outsource:
+        - docstrings
+        """
+        records = self._source()
+        for kind, suffix, function, predicate in self._plan():
+            if predicate is not None:
+                records = _filtered(records, SEQUENCE_CLASSES[kind], predicate)
+            else:
+                records = _mapped(records, suffix, function)
+        output_class = SEQUENCE_CLASSES[self.kind]
+        for identifier, data in records:
+            yield _build(output_class, identifier, data)
+
+    def collect(self):
+        """Run the pipeline and return all resulting sequences as a list."""
+        return list(self)
+
+
+def _build(sequence_class, identifier: str, data: str):
+    """
+    Build an output sequence, validating only proteins with unknown codons.
+
+    Outsource:
+    - docstrings
+    """
+    if sequence_class is ProteinSequence and "?" in data:
+        return ProteinSequence(identifier, data)
+    return sequence_class._from_valid(identifier, data)
+
+
+def _mapped(records, suffix: str, function):
+    """Apply a data function to every record and extend its identifier."""
+    for identifier, data in records:
+        yield identifier + suffix, function(data)
+
+
+def _filtered(records, sequence_class, predicate):
+    """Yield only the records whose sequence object satisfies predicate."""
+    for identifier, data in records:
+        if predicate(_build(sequence_class, identifier, data)):
+            yield identifier, data
@@ -0,0 +1,142 @@
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MIN_LENGTH = 64
+
+
+class ProductCache:
+    """
+    Process-wide LRU cache of derived sequence data.
+
+    Results of complement, transcribe and translate are stored under the
+    operation name and the source data string itself, so equal sequences
+    in different objects share one entry (the string hash is computed once
+    per string by Python and then cached on it). The total size of cached
+    source and result strings is kept under a byte budget by evicting the
+    least recently used entries.
+
+    Attributes:
+        max_bytes (int): Byte budget; 0 disables caching
+        min_length (int): Sequences shorter than this are not cached
+        current_bytes (int): Bytes currently held by cached entries
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups that had to compute the result
+        evictions (int): Number of entries dropped to stay within the budget
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, min_length: int = DEFAULT_MIN_LENGTH):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_bytes (int): Byte budget; must not be negative (0 disables caching)
+            min_length (int): Minimum source length worth caching
+
+        Raises:
+            ValueError: If max_bytes is negative
+
+        Outsource:
+        - docstrings
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache budget must not be negative.")
+        self.max_bytes = max_bytes
+        self.min_length = min_length
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get_or_compute(self, operation: str, data: str, compute):
+        """
+        Return compute(data), reusing a cached result when possible.
+
+        Args:
+            operation (str): Name of the derivation, part of the cache key
+            data (str): Source sequence data
+            compute (callable): Function producing the result from data
+
+        Returns:
+            str: Derived data
+
+        Outsource:
+        - docstrings
+        """
+        if len(data) < self.min_length or self.max_bytes == 0:
+            return compute(data)
+        key = (operation, data)
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = compute(data)
+        size = len(data) + len(result)
+        if size <= self.max_bytes:
+            self._entries[key] = result
+            self.current_bytes += size
+            self._evict()
+        return result
+
+    def _evict(self):
+        """Drop least recently used entries until the budget is met."""
+        while self.current_bytes > self.max_bytes:
+            (_, data), result = self._entries.popitem(last=False)
+            self.current_bytes -= len(data) + len(result)
+            self.evictions += 1
+
+    def resize(self, max_bytes: int):
+        """
+        Change the byte budget, evicting entries if it shrank.
+
+        Raises:
+            ValueError: If max_bytes is negative
+
+        Outsource:
+        - docstrings
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache budget must not be negative.")
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def stats(self):
+        """
+        Return the cache counters.
+
+        Returns:
+            dict: entries, bytes, max_bytes, hits, misses, evictions and hit_rate
+
+        Outsource:
+        - docstrings
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+default_cache = ProductCache()
@@ -0,0 +1,161 @@
+from array import array
+from itertools import accumulate
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+# Average residue masses in daltons (amino acid minus one water).
+RESIDUE_MASSES = {
+    "A": 71.0788, "R": 156.1875, "N": 114.1038, "D": 115.0886, "C": 103.1388,
+    "E": 129.1155, "Q": 128.1307, "G": 57.0519, "H": 137.1411, "I": 113.1594,
+    "L": 113.1594, "K": 128.1741, "M": 131.1926, "F": 147.1766, "P": 97.1167,
+    "S": 87.0782, "T": 101.1051, "W": 186.2132, "Y": 163.1760, "V": 99.1326,
+}
+WATER_MASS = 18.01524
+
+# Kyte-Doolittle hydropathy index.
+HYDROPATHY = {
+    "A": 1.8, "R": -4.5, "N": -3.5, "D": -3.5, "C": 2.5, "Q": -3.5, "E": -3.5,
+    "G": -0.4, "H": -3.2, "I": 4.5, "L": 3.8, "K": -3.9, "M": 1.9, "F": 2.8,
+    "P": -1.6, "S": -0.8, "T": -0.7, "W": -0.9, "Y": -1.3, "V": 4.2,
+}
+
+# pKa values of ionizable groups (EMBOSS set).
+PKA_N_TERMINUS = 8.6
+PKA_C_TERMINUS = 3.6
+PKA_POSITIVE = {"K": 10.8, "R": 12.5, "H": 6.5}
+PKA_NEGATIVE = {"D": 3.9, "E": 4.1, "C": 8.5, "Y": 10.1}
+
+# Per-byte lookup table, so a residue's hydropathy is one index of its ASCII code.
+HYDROPATHY_BY_BYTE = array("d", [0.0] * 256)
+for _residue, _value in HYDROPATHY.items():
+    HYDROPATHY_BY_BYTE[ord(_residue)] = _value
+del _residue, _value
+
+
+class ProteinProperties:
+    """
+    Physicochemical properties of one protein sequence.
+
+    Residue counts are taken once with C-level `str.count` calls; every
+    property is derived from those counts rather than by walking the
+    sequence. The hydropathy prefix sums are built on first use, from the
+    data passed to hydropathy_profile; the sequence itself is not kept.
+
+    Attributes:
+        length (int): Length of the protein sequence, stops included
+        counts (dict): Mapping of amino acid to number of occurrences
+        version (int): Version of the data the properties belong to, set by the caller
+
+    Outsource:
+    - docstrings
+    """
+
+    def __init__(self, data: str, version: int = 0):
+        """
+        Count the residues of a protein sequence.
+
+        Args:
+            data (str): Uppercase protein sequence (a '*' stop is ignored)
+            version (int): Version of the data the properties belong to
+
+        Outsource:
+        - docstrings
+        """
+        self.length = len(data)
+        self.version = version
+        self.counts = {residue: data.count(residue) for residue in AMINO_ACIDS}
+        self._hydropathy_prefix = None
+
+    def residue_total(self):
+        """Return the number of amino acids, not counting stop symbols."""
+        return sum(self.counts.values())
+
+    def composition(self):
+        """
+        Return the fraction of each amino acid in the sequence.
+
+        Returns:
+            dict: Mapping of amino acid to fraction (all 0.0 for an empty sequence)
+
+        Outsource:
+        - docstrings
+        """
+        total = self.residue_total()
+        if total == 0:
+            return {residue: 0.0 for residue in AMINO_ACIDS}
+        return {residue: count / total for residue, count in self.counts.items()}
+
+    def molecular_weight(self):
+        """
+        Return the average molecular weight in daltons.
+
+        Returns:
+            float: Sum of residue masses plus one water, 0.0 for an empty sequence
+
+        Outsource:
+        - docstrings
+        """
+        if self.residue_total() == 0:
+            return 0.0
+        return sum(RESIDUE_MASSES[residue] * count for residue, count in self.counts.items()) + WATER_MASS
+
+    def net_charge(self, ph: float):
+        """
+        Return the net charge of the protein at a given pH (Henderson-Hasselbalch).
+
+        Outsource:
+        - docstrings
+        """
+        positive = 1 / (1 + 10 ** (ph - PKA_N_TERMINUS))
+        for residue, pka in PKA_POSITIVE.items():
+            positive += self.counts[residue] / (1 + 10 ** (ph - pka))
+        negative = 1 / (1 + 10 ** (PKA_C_TERMINUS - ph))
+        for residue, pka in PKA_NEGATIVE.items():
+            negative += self.counts[residue] / (1 + 10 ** (pka - ph))
+        return positive - negative
+
+    def isoelectric_point(self):
+        """
+        Return the pH at which the net charge is zero, found by bisection.
+
+        Returns:
+            float: Isoelectric point, accurate to 0.001 pH units
+
+        Outsource:
+        - docstrings
+        """
+        low, high = 0.0, 14.0
+        while high - low > 0.001:
+            middle = (low + high) / 2
+            if self.net_charge(middle) > 0:
+                low = middle
+            else:
+                high = middle
+        return round((low + high) / 2, 3)
+
+    def hydropathy_profile(self, data: str, window: int = 9):
+        """
+        Return the mean Kyte-Doolittle hydropathy of every window.
+
+        Each window mean is one subtraction of two prefix sums.
+
+        Args:
+            data (str): The protein sequence the properties were computed from
+            window (int): Window length; must be greater than 0
+
+        Returns:
+            list: Mean hydropathy of the windows starting at every position
+
+        Raises:
+            ValueError: If window is not greater than 0
+
+        Outsource:
+        - docstrings
+        """
+        if window <= 0:
+            raise ValueError("Window size must be greater than 0.")
+        if self._hydropathy_prefix is None:
+            values = map(HYDROPATHY_BY_BYTE.__getitem__, data.encode("ascii"))
+            self._hydropathy_prefix = array("d", accumulate(values, initial=0.0))
+        prefix = self._hydropathy_prefix
+        return [(prefix[i + window] - prefix[i]) / window for i in range(self.length - window + 1)]
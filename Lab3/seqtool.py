@@ -0,0 +1,240 @@
+import argparse
+import os
+import sys
+from collections import deque
+from functools import partial
+from itertools import chain, islice
+
+from fasta import fasta_chunks, open_fasta, read_fasta
+
+COMMANDS = ("complement", "transcribe", "translate", "motif", "stats")
+ALPHABETS = {"dna": "ACGT", "rna": "ACGU"}
+
+
+def _chunks(records, size: int):
+    """Yield lists of at most `size` records."""
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _read_inputs(paths):
+    """Yield (identifier, data) records from every input file in turn; "-" is stdin."""
+    for path in paths:
+        if path == "-":
+            yield from read_fasta(sys.stdin)
+        else:
+            with open_fasta(path) as handle:
+                yield from read_fasta(handle)
+
+
+def _format_fasta(sequences, width: int = None):
+    """Return sequences as one FASTA text block (one chunk of the output)."""
+    return "".join(chain.from_iterable(fasta_chunks(sequence.identifier, sequence.data, width)
+                                       for sequence in sequences))
+
+
+def _stats_line(sequence, kind: str):
+    """Return the tab-separated statistics line of one sequence."""
+    data = sequence.data
+    if kind == "protein":
+        return f"{sequence.identifier}\t{len(data)}\t{sequence.molecular_weight():.2f}\n"
+    counts = [data.count(base) for base in ALPHABETS[kind]]
+    gc = (counts[1] + counts[2]) / len(data) if data else 0.0
+    return "\t".join([sequence.identifier, str(len(data))] + [str(count) for count in counts] + [f"{gc:.4f}"]) + "\n"
+
+
+def process_chunk(command: str, options: dict, records):
+    """
+    Run one command on a chunk of records (runs in a worker with --workers > 1).
+
+    Args:
+        command (str): One of COMMANDS
+        options (dict): kind, reverse, pattern, both_strands and width from the command line
+        records (list): (identifier, data) tuples as read from FASTA
+
+    Returns:
+        str: Output text for the chunk (FASTA for transformations, tab-separated lines otherwise)
+
+    Raises:
+        ValueError: If a record is invalid for the sequence kind, or a translation hits an unknown codon
+
+    Outsource:
+    - docstrings
+    """
+    from pipeline import SEQUENCE_CLASSES, SequenceStream
+
+    kind = options["kind"]
+    stream = SequenceStream(records, kind)
+    if command == "complement":
+        stream = stream.reverse_complement() if options["reverse"] else stream.complement()
+        return _format_fasta(stream, options["width"])
+    if command == "transcribe":
+        return _format_fasta(stream.transcribe(), options["width"])
+    if command == "translate":
+        if kind == "dna":
+            stream = stream.transcribe()
+        return _format_fasta(stream.translate(), options["width"])
+    sequence_class = SEQUENCE_CLASSES[kind]
+    lines = []
+    for identifier, data in records:
+        sequence = sequence_class(identifier, data)
+        if command == "stats":
+            lines.append(_stats_line(sequence, kind))
+        elif options["both_strands"]:
+            lines.extend(f"{identifier}\t{position}\t{strand}\n"
+                         for position, strand in sequence.find_motif(options["pattern"], both_strands=True))
+        else:
+            lines.extend(f"{identifier}\t{position}\n" for position in sequence.find_motif(options["pattern"]))
+    return "".join(lines)
+
+
+def _ordered_map(function, chunks, workers: int):
+    """
+    Apply function to every chunk, yielding results in input order.
+
+    With more than one worker, chunks run in a process pool with at most
+    2 * workers chunks in flight, so memory stays bounded on huge inputs.
+
+    Outsource:
+    - docstrings
+    """
+    if workers == 1:
+        for chunk in chunks:
+            yield function(chunk)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(function, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _add_common_arguments(parser):
+    """Add the input, output and parallelism options shared by every command."""
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="FASTA files, plain or gzip/BGZF compressed (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--kind", choices=("dna", "rna", "protein"), default="dna", help="input sequence type")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="records per work unit (default: 1000)")
+    parser.add_argument("--width", type=int, default=None,
+                        help="wrap FASTA output lines to this width (default: no wrapping)")
+
+
+def _parser():
+    """
+    Build the argument parser.
+
+    Returns:
+        tuple: (top-level parser, mapping of command to its subparser)
+
+    Outsource:
+    - docstrings
+    """
+    parser = argparse.ArgumentParser(
+        prog="seqtool", description="Stream FASTA records through sequence operations.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    complement = commands.add_parser("complement", help="complement DNA or RNA")
+    complement.add_argument("--reverse", action="store_true", help="reverse complement (DNA)")
+    motif = commands.add_parser("motif", help="report motif positions (id, position)")
+    motif.add_argument("pattern", help="motif to search for")
+    motif.add_argument("--both-strands", action="store_true", help="also search the reverse strand (DNA)")
+    subparsers = {
+        "complement": complement,
+        "transcribe": commands.add_parser("transcribe", help="transcribe DNA to RNA"),
+        "translate": commands.add_parser("translate", help="translate RNA (or DNA) to protein"),
+        "motif": motif,
+        "stats": commands.add_parser("stats", help="per-record length and base counts/GC (protein: length and weight)"),
+    }
+    for command in COMMANDS:
+        _add_common_arguments(subparsers[command])
+    return parser, subparsers
+
+
+def _parse_arguments(argv):
+    """
+    Parse the command line, allowing options and file names in any order.
+
+    argparse cannot intermix optionals with a `nargs="*"` positional under
+    subcommands, so the command is picked first and its own parser then
+    parses the rest with parse_intermixed_args.
+
+    Outsource:
+    - docstrings
+    """
+    parser, subparsers = _parser()
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] not in subparsers:
+        parser.parse_args(argv)
+    subparser = subparsers[argv[0]]
+    args = subparser.parse_intermixed_args(argv[1:])
+    args.command = argv[0]
+    return subparser, args
+
+
+def main(argv=None):
+    """
+    Command-line entry point: `python seqtool.py COMMAND [options] [FILE ...]`.
+
+    Returns:
+        int: Exit status, 0 on success, 1 if a record could not be processed
+
+    Outsource:
+    - docstrings
+    """
+    parser, args = _parse_arguments(argv)
+    if args.workers <= 0 or args.chunk_size <= 0 or (args.width is not None and args.width <= 0):
+        parser.error("--workers, --chunk-size and --width must be greater than 0")
+    if args.command == "motif" and args.both_strands and args.kind != "dna":
+        parser.error("--both-strands needs --kind dna")
+    if args.command == "complement" and (args.kind == "protein" or (args.reverse and args.kind != "dna")):
+        parser.error("complement needs --kind dna (or rna without --reverse)")
+    if args.command == "transcribe" and args.kind != "dna":
+        parser.error("transcribe needs --kind dna")
+    if args.command == "translate" and args.kind == "protein":
+        parser.error("translate needs --kind dna or rna")
+
+    options = {
+        "kind": args.kind,
+        "reverse": getattr(args, "reverse", False),
+        "pattern": getattr(args, "pattern", None),
+        "both_strands": getattr(args, "both_strands", False),
+        "width": args.width,
+    }
+    function = partial(process_chunk, args.command, options)
+    to_stdout = args.output == "-"
+    output = sys.stdout if to_stdout else open_fasta(args.output, "w")
+    try:
+        if args.command == "stats":
+            columns = ["length", "molecular_weight"] if args.kind == "protein" else \
+                ["length"] + list(ALPHABETS[args.kind]) + ["gc"]
+            output.write("#id\t" + "\t".join(columns) + "\n")
+        for text in _ordered_map(function, _chunks(_read_inputs(args.inputs), args.chunk_size), args.workers):
+            output.write(text)
+        if to_stdout:
+            output.flush()
+    except ValueError as error:
+        print(f"seqtool: error: {error}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`); stop quietly like other Unix
+        # tools, pointing stdout at /dev/null so the final flush cannot fail.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if not to_stdout:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Single entry point for the sequence classes and engines.
+
+Nothing is imported until a name is first used (PEP 562 module
+__getattr__), so `import sequences` is nearly free and
+`from sequences import DNASequence` loads only the DNA class and its base;
+the RNA and protein classes, alignment, k-mer, composition, I/O and
+parallel engines are imported when they are first needed.
+
+Outsource:
+- docstrings
+"""
+
+# Public name -> flat module defining it.
+_EXPORTS = {
+    "BaseSequence": "base_sequence",
+    "DNASequence": "ex31",
+    "RNASequence": "ex32",
+    "ProteinSequence": "ex33",
+    "CODON_TABLE": "ex32",
+    "translate_dna": "ex31",
+    "translate_rna": "ex32",
+    "FrozenDNASequence": "frozen",
+    "FrozenRNASequence": "frozen",
+    "FrozenProteinSequence": "frozen",
+    "SequenceStream": "pipeline",
+    "translate_many": "parallel",
+    "find_orfs": "orf",
+    "VariantOverlay": "overlay",
+    "open_fasta": "fasta",
+    "read_fasta": "fasta",
+    "write_fasta": "fasta",
+    "write_binary": "binseq",
+    "BinarySequenceFile": "binseq",
+    "SequenceCollection": "collection",
+    "set_default_backend": "storage",
+    "get_default_backend": "storage",
+}
+# Engine modules available as attributes, e.g. sequences.alignment.
+_MODULES = ("alignment", "approx_search", "composition", "kmers", "product_cache",
+            "protein_properties", "storage", "instrument", "orf", "dedupe", "motif_search")
+
+__all__ = sorted(_EXPORTS) + list(_MODULES)
+
+
+def __getattr__(name: str):
+    """
+    Import the module providing `name` on first access and cache the result.
+
+    Raises:
+        AttributeError: If the package has no such name
+
+    Outsource:
+    - docstrings
+    """
+    if name in _EXPORTS:
+        value = getattr(__import__(_EXPORTS[name]), name)
+    elif name in _MODULES:
+        value = __import__(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the lazily available names."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,246 @@
+from packing import pack, packing_tables, unpack
+
+# Storage backends hold the characters of one sequence. Each backend is
+# constructed from already validated, uppercase text and provides:
+#     __len__()            number of characters
+#     text(start, stop)    the data, or only characters [start, stop), as a str
+#     set(position, char)  replace one character in place
+# Backends other than StrStorage keep only their compact representation:
+# text() decodes a new str on every call and does not keep it, so holding a
+# sequence costs the buffer alone. Callers that read the data several times
+# should read it once into a local; callers that need a region should pass
+# start and stop so that only that region is decoded.
+
+
+class StrStorage:
+    """
+    Data kept as an immutable Python str (the original representation).
+
+    Reads are free; set() builds a new string, so a mutation costs O(n).
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("_text",)
+    name = "str"
+
+    def __init__(self, data: str, alphabet: str = None):
+        """Store data as is; `alphabet` is accepted for protocol compatibility and ignored."""
+        self._text = data
+
+    def __len__(self):
+        """Return the number of characters."""
+        return len(self._text)
+
+    def text(self, start: int = 0, stop: int = None):
+        """Return the data, or characters [start, stop), as a str."""
+        if start == 0 and stop is None:
+            return self._text
+        return self._text[start:stop]
+
+    def set(self, position: int, char: str):
+        """Replace one character (builds a new string)."""
+        self._text = self._text[:position] + char + self._text[position + 1:]
+
+
+class BytearrayStorage:
+    """
+    Data kept as a mutable bytearray, one byte per character.
+
+    set() is O(1); text() decodes the buffer on every call.
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("_buffer",)
+    name = "bytearray"
+
+    def __init__(self, data: str, alphabet: str = None):
+        """Copy data into a bytearray; `alphabet` is ignored."""
+        self._buffer = bytearray(data.encode("ascii"))
+
+    def __len__(self):
+        """Return the number of characters."""
+        return len(self._buffer)
+
+    def text(self, start: int = 0, stop: int = None):
+        """Decode the data, or only characters [start, stop), into a str."""
+        return self._buffer[start:stop].decode("ascii")
+
+    def set(self, position: int, char: str):
+        """Replace one character in place."""
+        self._buffer[position] = ord(char)
+
+
+class PackedStorage:
+    """
+    Nucleotide data packed into 2 bits per base (four bases per byte).
+
+    Needs a four-letter alphabet, so it can hold DNA or RNA but not proteins.
+    set() is O(1).
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("_packed", "_length", "_alphabet")
+    name = "packed"
+
+    def __init__(self, data: str, alphabet: str = None):
+        """
+        Pack data.
+
+        Args:
+            data (str): Validated uppercase data over `alphabet`
+            alphabet (str): The four characters, in code order (e.g. "ACGT")
+
+        Raises:
+            ValueError: If alphabet is not a four-letter alphabet
+
+        Outsource:
+        - docstrings
+        """
+        if alphabet is None or len(alphabet) != 4:
+            raise ValueError("Packed storage needs a four-letter nucleotide alphabet.")
+        self._packed = pack(data, alphabet)
+        self._length = len(data)
+        self._alphabet = alphabet
+
+    def __len__(self):
+        """Return the number of bases."""
+        return self._length
+
+    def text(self, start: int = 0, stop: int = None):
+        """Unpack the data, or only bases [start, stop), into a str."""
+        stop = self._length if stop is None else min(stop, self._length)
+        return unpack(self._packed, max(stop - start, 0), self._alphabet, start)
+
+    def set(self, position: int, char: str):
+        """Replace one base in place."""
+        shift = 6 - 2 * (position % 4)
+        code = packing_tables(self._alphabet)[2][char]
+        index = position // 4
+        self._packed[index] = (self._packed[index] & ~(3 << shift)) | (code << shift)
+
+
+class NumpyStorage:
+    """
+    Data kept in a NumPy uint8 array, one byte per character.
+
+    Requires NumPy, which is imported only when this backend is used.
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("_array",)
+    name = "numpy"
+
+    def __init__(self, data: str, alphabet: str = None):
+        """
+        Copy data into a uint8 array; `alphabet` is ignored.
+
+        Raises:
+            ImportError: If NumPy is not installed
+
+        Outsource:
+        - docstrings
+        """
+        try:
+            import numpy
+        except ImportError as error:
+            raise ImportError("The numpy storage backend requires NumPy.") from error
+        self._array = numpy.frombuffer(data.encode("ascii"), dtype=numpy.uint8).copy()
+
+    def __len__(self):
+        """Return the number of characters."""
+        return len(self._array)
+
+    def text(self, start: int = 0, stop: int = None):
+        """Decode the data, or only characters [start, stop), into a str."""
+        return self._array[start:stop].tobytes().decode("ascii")
+
+    def set(self, position: int, char: str):
+        """Replace one character in place."""
+        self._array[position] = ord(char)
+
+
+class MmapStorage:
+    """
+    Data kept in an anonymous memory map, outside the Python heap.
+
+    set() is O(1). The mapping is released when the storage is garbage collected.
+
+    Outsource:
+    - docstrings
+    """
+    __slots__ = ("_map", "_length")
+    name = "mmap"
+
+    def __init__(self, data: str, alphabet: str = None):
+        """Copy data into a new anonymous mapping; `alphabet` is ignored."""
+        import mmap
+        self._length = len(data)
+        self._map = mmap.mmap(-1, max(self._length, 1))
+        self._map[:self._length] = data.encode("ascii")
+
+    def __len__(self):
+        """Return the number of characters."""
+        return self._length
+
+    def text(self, start: int = 0, stop: int = None):
+        """Decode the data, or only characters [start, stop), into a str."""
+        stop = self._length if stop is None else min(stop, self._length)
+        return self._map[start:max(stop, start)].decode("ascii")
+
+    def set(self, position: int, char: str):
+        """Replace one character in place."""
+        self._map[position] = ord(char)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (StrStorage, BytearrayStorage, PackedStorage, NumpyStorage, MmapStorage)
+}
+_default_backend = "str"
+
+
+def set_default_backend(name: str):
+    """
+    Set the backend used by sequences created without an explicit backend.
+
+    Args:
+        name (str): Key of BACKENDS
+
+    Raises:
+        ValueError: If the backend is unknown
+
+    Outsource:
+    - docstrings
+    """
+    global _default_backend
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown storage backend: {name}")
+    _default_backend = name
+
+
+def get_default_backend():
+    """Return the name of the default storage backend."""
+    return _default_backend
+
+
+def resolve_backend(backend=None):
+    """
+    Return the storage class for a backend name, class or None (the default).
+
+    Raises:
+        ValueError: If a backend name is unknown
+
+    Outsource:
+    - docstrings
+    """
+    if backend is None:
+        return BACKENDS[_default_backend]
+    if isinstance(backend, str):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown storage backend: {backend}")
+        return BACKENDS[backend]
+    return backend
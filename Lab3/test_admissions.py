@@ -0,0 +1,128 @@
+import random
+
+import pytest
+
+from admissions import AdmissionIndex
+from ex2 import Patient
+from ex22 import Hospital
+
+"""
+Outsource:
+- tests
+"""
+
+
+class TestPatientHistory:
+    """Tests for the admission history kept by Patient in ex2.py"""
+
+    def test_stays_recorded(self):
+        """Test that admit/discharge pairs are recorded as stays"""
+        patient = Patient("Anna Nowak", "2005-10-11", "P1", "Asthma")
+        patient.admit(at=10)
+        patient.admit(at=12)
+        patient.discharge(at=20)
+        patient.admit(at=30)
+        assert patient.stays == [(10, 20)]
+        assert patient.admission_history() == [(10, 20), (30, None)]
+        assert patient.admitted is True
+
+    def test_was_admitted_at(self):
+        """Test point queries, with half-open stays"""
+        patient = Patient("Anna Nowak", "2005-10-11", "P1", "Asthma")
+        for start, end in [(0, 5), (10, 15), (20, 25)]:
+            patient.admit(at=start)
+            patient.discharge(at=end)
+        patient.admit(at=40)
+        assert [t for t in range(50) if patient.was_admitted_at(t)] == \
+            list(range(0, 5)) + list(range(10, 15)) + list(range(20, 25)) + list(range(40, 50))
+
+    def test_default_time_and_errors(self):
+        """Test the current-time default and out-of-order times"""
+        patient = Patient("Anna Nowak", "2005-10-11", "P1", "Asthma")
+        patient.admit()
+        patient.discharge()
+        assert patient.stays[0][0] <= patient.stays[0][1]
+        with pytest.raises(ValueError):
+            patient.admit(at=patient.stays[0][1] - 100)
+        patient.admit(at=patient.stays[0][1] + 1)
+        with pytest.raises(ValueError):
+            patient.discharge(at=0)
+
+    def test_constructed_admitted(self):
+        """Test that a patient created admitted has no recorded start"""
+        patient = Patient("Jane Smith", "1985-03-20", "P2", "Asthma", admitted=True)
+        patient.discharge(at=5)
+        assert patient.admitted is False
+        assert patient.stays == ()
+
+
+class TestAdmissionIndex:
+    """Tests for the interval index in admissions.py"""
+
+    def test_queries(self):
+        """Test census, occupancy and admitted_at on a small index"""
+        index = AdmissionIndex([("a", 0, 10), ("b", 5, 15), ("c", 12, None), ("d", 20, 20)])
+        assert len(index) == 4
+        assert index.census(5) == 2
+        assert index.census(10) == 1
+        assert index.census(100) == 1
+        assert index.admitted_at(12) == ["b", "c"]
+        assert index.admitted_at(-1) == []
+        assert index.occupancy(9, 13) == 3
+        assert index.occupancy(15, 21) == 2
+        with pytest.raises(ValueError):
+            index.occupancy(5, 5)
+        with pytest.raises(ValueError):
+            AdmissionIndex([("a", 5, 1)])
+
+    def test_matches_brute_force(self):
+        """Test random stays against a linear scan"""
+        rng = random.Random(11)
+        stays = []
+        for i in range(500):
+            start = rng.uniform(0, 1000)
+            stays.append((i, start, None if rng.random() < 0.05 else start + rng.expovariate(1 / 30)))
+        index = AdmissionIndex(stays)
+        for _ in range(200):
+            t1 = rng.uniform(-10, 1100)
+            t2 = t1 + rng.uniform(0.1, 100)
+            active = [i for i, start, end in stays if start <= t1 and (end is None or t1 < end)]
+            overlapping = [i for i, start, end in stays if start < t2 and (end is None or end > t1)]
+            assert sorted(index.admitted_at(t1)) == sorted(active)
+            assert index.census(t1) == len(active)
+            assert index.occupancy(t1, t2) == len(overlapping)
+
+
+class TestHospitalIndex:
+    """Tests for Hospital.admission_index in ex22.py"""
+
+    def test_history_survives_discharge(self):
+        """Test that discharged patients stay in the history when kept"""
+        hospital = Hospital("City General Hospital", keep_discharged=True)
+        p1 = Patient("Anna Nowak", "2005-10-11", "P1", "Asthma")
+        p2 = Patient("Jan Kowalski", "1985-09-30", "P2", "Type 1 Diabetes")
+        hospital.add_patient(p1)
+        hospital.add_patient(p2)
+        p1.admit(at=0)
+        p2.admit(at=5)
+        p1.discharge(at=8)
+        assert hospital.discharge_patient("P1") == "Patient P1 is discharged."
+        index = hospital.admission_index()
+        assert index.admitted_at(6) == [p1, p2]
+        assert index.admitted_at(9) == [p2]
+        assert index.occupancy(0, 100) == 2
+        hospital.add_patient(p1)
+        p1.admit(at=50)
+        assert hospital.admission_index().census(60) == 2
+
+    def test_discharge_keeps_status(self):
+        """Test that discharge_patient only removes the patient, and keeps none by default"""
+        hospital = Hospital("City General Hospital")
+        patient = Patient("Anna Nowak", "2005-10-11", "P1", "Asthma")
+        hospital.add_patient(patient)
+        patient.admit(at=0)
+        hospital.discharge_patient("P1")
+        assert patient.admitted is True
+        assert patient.admission_history() == [(0, None)]
+        assert hospital.discharged == {}
+        assert hospital.admission_index().census(1) == 0
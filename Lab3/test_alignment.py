@@ -0,0 +1,146 @@
+import random
+import pytest
+import alignment
+from alignment import BLOSUM62, DNA_MATRIX, PAM250, align, align_score
+from ex31 import DNASequence
+from ex32 import RNASequence
+from ex33 import ProteinSequence
+
+"""
+Outsource:
+- tests
+"""
+
+
+def rescore(result, matrix, gap_open, gap_extend):
+    score = 0
+    previous = None
+    for x, y in zip(result.aligned_a, result.aligned_b):
+        kind = "a" if x == "-" else "b" if y == "-" else None
+        if kind is None:
+            score += matrix[x][y]
+        else:
+            score -= gap_extend if kind == previous else gap_open
+        previous = kind
+    return score
+
+
+class TestAlign:
+    """Tests for align and align_score from alignment.py"""
+
+    def test_blosum62_is_symmetric(self):
+        """Test the substitution matrix"""
+        assert BLOSUM62["W"]["W"] == 11
+        assert all(BLOSUM62[a][b] == BLOSUM62[b][a] for a in BLOSUM62 for b in BLOSUM62)
+
+    def test_pam250(self):
+        """Test the PAM250 matrix and its use from ProteinSequence.align"""
+        assert PAM250["W"]["W"] == 17 and PAM250["C"]["C"] == 12
+        assert set(PAM250) == set(BLOSUM62)
+        assert all(PAM250[a][b] == PAM250[b][a] for a in PAM250 for b in PAM250)
+        first, second = ProteinSequence("p1", "HEAGAWGHEE"), ProteinSequence("p2", "PAWHEAE")
+        result = first.align(second, matrix="PAM250")
+        assert result.score == align_score(first.data, second.data, PAM250)
+        assert result.score != first.align(second).score
+        with pytest.raises(ValueError, match="matrix"):
+            first.align(second, matrix="PAM30")
+
+    def test_global_identical(self):
+        """Test aligning identical sequences"""
+        result = align("ATGC", "ATGC", DNA_MATRIX)
+        assert result.score == 20
+        assert result.aligned_a == result.aligned_b == "ATGC"
+        assert result.identity() == 1.0
+
+    def test_global_affine_gap(self):
+        """Test that one long gap is preferred over two short ones"""
+        result = align("ATGCATGC", "ATGC", DNA_MATRIX, gap_open=10, gap_extend=1)
+        assert result.score == 20 - 10 - 3
+        assert result.aligned_a == "ATGCATGC"
+        assert result.aligned_b.count("-") == 4
+        assert "-" * 4 in result.aligned_b
+
+    def test_local_finds_core(self):
+        """Test Smith-Waterman returns the best local region"""
+        result = align("TTTTGGCATCCTTT", "AAGGCATCCAA", DNA_MATRIX, mode="local")
+        assert result.aligned_a == result.aligned_b == "GGCATCC"
+        assert (result.start_a, result.end_a) == (4, 11)
+        assert (result.start_b, result.end_b) == (2, 9)
+
+    def test_invalid_mode(self):
+        """Test unknown alignment modes"""
+        with pytest.raises(ValueError, match="global"):
+            align("A", "A", DNA_MATRIX, mode="semi")
+
+    def test_missing_symbol(self):
+        """Test symbols absent from the matrix"""
+        with pytest.raises(ValueError, match="substitution matrix"):
+            align("AXA", "AAA", DNA_MATRIX)
+
+    def test_traceback_matches_score(self):
+        """Test random protein pairs: traceback rescoring and linear-memory score agree"""
+        rng = random.Random(3)
+        residues = "ACDEFGHIKLMNPQRSTVWY"
+        for _ in range(200):
+            a = "".join(rng.choice(residues) for _ in range(rng.randint(0, 15)))
+            b = "".join(rng.choice(residues) for _ in range(rng.randint(0, 15)))
+            for mode in ("global", "local"):
+                result = align(a, b, BLOSUM62, mode, 8, 2)
+                assert result.score == align_score(a, b, BLOSUM62, mode, 8, 2)
+                assert rescore(result, BLOSUM62, 8, 2) == result.score
+                assert result.aligned_a.replace("-", "") == a[result.start_a:result.end_a]
+                assert result.aligned_b.replace("-", "") == b[result.start_b:result.end_b]
+
+    def test_hirschberg_and_numpy_rows(self, monkeypatch):
+        """Test the divide-and-conquer traceback, with NumPy and pure-Python rows, against full-matrix scores"""
+        rng = random.Random(5)
+        pairs = []
+        for _ in range(60):
+            a = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 80)))
+            b = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 80)))
+            gap_open = rng.randint(0, 8)
+            pairs.append((a, b, gap_open, rng.randint(0, gap_open)))
+        expected = [[align(a, b, DNA_MATRIX, mode, o, e).score for mode in ("global", "local")] for a, b, o, e in pairs]
+        monkeypatch.setattr(alignment, "_TRACEBACK_CELLS", 8)
+        monkeypatch.setattr(alignment, "_NUMPY_MIN_COLUMNS", 0)
+        for numpy in (True, False):
+            if not numpy:
+                monkeypatch.setattr(alignment, "_numpy", lambda: None)
+            elif alignment._numpy() is None:
+                continue
+            for (a, b, gap_open, gap_extend), scores in zip(pairs, expected):
+                for mode, score in zip(("global", "local"), scores):
+                    result = align(a, b, DNA_MATRIX, mode, gap_open, gap_extend)
+                    assert result.score == score == align_score(a, b, DNA_MATRIX, mode, gap_open, gap_extend)
+                    assert rescore(result, DNA_MATRIX, gap_open, gap_extend) == score
+                    assert result.aligned_a.replace("-", "") == a[result.start_a:result.end_a]
+                    assert result.aligned_b.replace("-", "") == b[result.start_b:result.end_b]
+
+    def test_invalid_gaps(self):
+        """Test gap penalties that would make the score disagree with the alignment"""
+        for gap_open, gap_extend in ((1, 3), (5, -1), (-2, -3)):
+            with pytest.raises(ValueError, match="gap_extend"):
+                align("ACGT", "AGT", DNA_MATRIX, gap_open=gap_open, gap_extend=gap_extend)
+            with pytest.raises(ValueError, match="gap_extend"):
+                align_score("ACGT", "AGT", DNA_MATRIX, gap_open=gap_open, gap_extend=gap_extend)
+
+
+class TestSequenceAlign:
+    """Tests for align on the sequence classes"""
+
+    def test_dna_align(self):
+        """Test aligning two DNA sequences"""
+        result = DNASequence("a", "ATGGC").align(DNASequence("b", "ATGC"), gap_open=3)
+        assert result.aligned_a == "ATGGC"
+        assert result.aligned_b in ("ATG-C", "AT-GC")
+
+    def test_rna_align(self):
+        """Test aligning two RNA sequences"""
+        result = RNASequence("a", "AUGC").align(RNASequence("b", "AUGC"))
+        assert result.score == 20
+
+    def test_protein_local_align(self):
+        """Test local alignment of proteins with BLOSUM62"""
+        result = ProteinSequence("a", "PPPWWHHPPP").align(ProteinSequence("b", "GGWWHHGG"), mode="local")
+        assert result.aligned_a == "WWHH"
+        assert result.score == 11 + 11 + 8 + 8
@@ -0,0 +1,97 @@
+import random
+import pytest
+from approx_search import IUPAC_DNA, hamming_search, myers_search
+from ex31 import DNASequence
+from ex32 import RNASequence
+from ex33 import ProteinSequence
+
+"""
+Outsource:
+- tests
+"""
+
+
+def edit_distance_hits(text, pattern, max_distance):
+    column = list(range(len(pattern) + 1))
+    hits = []
+    for i, symbol in enumerate(text):
+        new_column = [0]
+        for j in range(1, len(pattern) + 1):
+            cost = 0 if symbol in IUPAC_DNA.get(pattern[j - 1], pattern[j - 1]) else 1
+            new_column.append(min(column[j] + 1, new_column[j - 1] + 1, column[j - 1] + cost))
+        column = new_column
+        if column[-1] <= max_distance:
+            hits.append((i + 1, column[-1]))
+    return hits
+
+
+class TestHammingSearch:
+    """Tests for hamming_search from approx_search.py"""
+
+    def test_exact_matches(self):
+        """Test that zero mismatches equals exact search"""
+        assert hamming_search("ATGCATGC", "ATG", 0) == [(0, 0), (4, 0)]
+
+    def test_one_mismatch(self):
+        """Test windows with a single substitution"""
+        assert hamming_search("ATGCTTGC", "ATG", 1) == [(0, 0), (4, 1)]
+
+    def test_degenerate_bases(self):
+        """Test IUPAC codes in the pattern"""
+        assert hamming_search("ATGCGTGA", "RTG", 0, IUPAC_DNA) == [(0, 0), (4, 0)]
+
+    def test_long_pattern(self):
+        """Test a 64-symbol pattern"""
+        pattern = "ACGT" * 16
+        text = "TT" + pattern[:10] + "A" + pattern[11:] + "TT"
+        assert hamming_search(text, pattern, 1) == [(2, 1)]
+
+    def test_invalid_errors(self):
+        """Test that the error budget must be below the motif length"""
+        with pytest.raises(ValueError):
+            hamming_search("ATGC", "AT", 2)
+        with pytest.raises(ValueError):
+            hamming_search("ATGC", "", 0)
+
+
+class TestMyersSearch:
+    """Tests for myers_search from approx_search.py"""
+
+    def test_deletion_in_text(self):
+        """Test a match missing one pattern base"""
+        assert (5, 1) in myers_search("GGATCGG", "ATGC", 1)
+
+    def test_matches_dynamic_programming(self):
+        """Test against the textbook edit-distance recurrence"""
+        rng = random.Random(7)
+        for _ in range(300):
+            text = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 30)))
+            pattern = "".join(rng.choice("ACGTN") for _ in range(rng.randint(1, 70)))
+            max_distance = rng.randint(0, len(pattern) - 1)
+            expected = edit_distance_hits(text, pattern, max_distance)
+            assert myers_search(text, pattern, max_distance, IUPAC_DNA) == expected
+
+
+class TestSequenceApproxMotif:
+    """Tests for find_motif_approx on the sequence classes"""
+
+    def test_dna_mismatches(self):
+        """Test mismatch search on DNA with an IUPAC motif"""
+        dna = DNASequence("dna1", "ATGCATTC")
+        assert dna.find_motif_approx("atn", 0) == [(0, 0), (4, 0)]
+        assert dna.find_motif_approx("ATGC", 1) == [(0, 0), (4, 1)]
+
+    def test_dna_indels(self):
+        """Test edit-distance search on DNA"""
+        dna = DNASequence("dna1", "GGATCGG")
+        assert (5, 1) in dna.find_motif_approx("ATGC", 1, indels=True)
+
+    def test_rna_degenerate(self):
+        """Test IUPAC codes resolve to U on RNA"""
+        rna = RNASequence("rna1", "AUGCAUG")
+        assert rna.find_motif_approx("AYG", 0) == [(0, 0), (4, 0)]
+
+    def test_protein_wildcard(self):
+        """Test X wildcard on protein sequences"""
+        protein = ProteinSequence("prot1", "MKLLVVMRLL")
+        assert protein.find_motif_approx("MXL", 0) == [(0, 0), (6, 0)]
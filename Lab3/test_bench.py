@@ -0,0 +1,105 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from bench import (SCALES, STARTUP_STATEMENTS, compare, main, random_dna, random_orf, random_patients,
+                   run_benchmarks, run_startup)
+from ex32 import RNASequence
+
+"""
+Outsource:
+- tests
+"""
+
+
+class TestGenerators:
+    """Tests for the synthetic data generators."""
+
+    def test_random_dna_reproducible(self):
+        """Test that the same seed gives the same sequence."""
+        assert random_dna(500, seed=3) == random_dna(500, seed=3)
+        assert len(random_dna(500)) == 500
+        assert set(random_dna(500)) <= set("ACGT")
+
+    def test_random_orf_translates(self):
+        """Test that a generated ORF translates without stop or unknown codons."""
+        protein = RNASequence("orf", random_orf(300)).translate()
+        assert len(protein.data) == 100
+        assert protein.data.startswith("M")
+
+    def test_random_patients(self):
+        """Test that generated patients have unique ids."""
+        patients = random_patients(50)
+        assert len({patient.id for patient in patients}) == 50
+
+
+class TestRunBenchmarks:
+    """Tests for running and comparing benchmarks."""
+
+    def test_scales_cover_requested_range(self):
+        """Test that the scales range from 1k to 100M bases and 1k to 10M patients."""
+        assert min(SCALES.values()) == (1_000, 1_000)
+        assert max(SCALES.values()) == (100_000_000, 10_000_000)
+
+    def test_run_subset(self):
+        """Test running a subset of benchmarks at the smallest scale."""
+        results = run_benchmarks("tiny", repeat=2, names=["find_motif", "discharge_patient"])
+        assert set(results) == {"find_motif@tiny", "discharge_patient@tiny"}
+        assert results["find_motif@tiny"]["runs"] == 2
+        # autorange loops a sub-millisecond call many times per timed run.
+        assert results["find_motif@tiny"]["number"] > 1
+        assert results["find_motif@tiny"]["min"] <= results["find_motif@tiny"]["median"]
+
+    def test_invalid_arguments(self):
+        """Test that unknown scales, names and bad repeat counts raise ValueError."""
+        with pytest.raises(ValueError):
+            run_benchmarks("enormous")
+        with pytest.raises(ValueError):
+            run_benchmarks("tiny", names=["sort"])
+        with pytest.raises(ValueError):
+            run_benchmarks("tiny", repeat=0)
+
+    def test_compare_flags_slowdown(self):
+        """Test that only slowdowns beyond the threshold are flagged."""
+        baseline = {"a@tiny": {"min": 1.0}, "b@tiny": {"min": 1.0}}
+        results = {"a@tiny": {"min": 1.1}, "b@tiny": {"min": 1.5}, "c@tiny": {"min": 9.0}}
+        rows = {row[0]: row for row in compare(results, baseline, threshold=0.2)}
+        assert set(rows) == {"a@tiny", "b@tiny"}
+        assert not rows["a@tiny"][4]
+        assert rows["b@tiny"][4]
+
+    def test_main_save_and_compare(self, tmp_path, capsys):
+        """Test saving a baseline and comparing against it from the command line."""
+        path = tmp_path / "baseline.json"
+        assert main(["--repeat", "1", "--only", "mutate", "--save", str(path)]) == 0
+        baseline = json.loads(path.read_text())
+        assert list(baseline) == ["mutate@tiny"]
+        baseline["mutate@tiny"]["min"] = 1e-12
+        path.write_text(json.dumps(baseline))
+        assert main(["--repeat", "1", "--only", "mutate", "--compare", str(path)]) == 1
+        assert "SLOWER" in capsys.readouterr().out
+
+
+class TestStartup:
+    """Tests for the import-time benchmark."""
+
+    def test_core_classes_import_no_engines(self):
+        """Test that importing the package and the core classes loads no engine modules.
+
+        The import-time budget itself is only checked by `bench.py --startup`.
+        """
+        engines = ["alignment", "approx_search", "kmers", "composition", "fasta", "binseq", "collection",
+                   "motif_search", "protein_properties", "product_cache", "dedupe", "parallel", "numpy",
+                   "cProfile", "tracemalloc"]
+        for statement in ("import sequences", STARTUP_STATEMENTS["core_classes"]):
+            code = f"import sys\n{statement}\nprint(' '.join(m for m in {engines!r} if m in sys.modules))"
+            output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+            assert output.stdout.split() == []
+
+    def test_startup_results_format(self):
+        """Test that startup results can be saved and compared like other benchmarks."""
+        results = run_startup(repeat=1)
+        assert set(results) == {f"import:{name}" for name in STARTUP_STATEMENTS}
+        assert all(timing["min"] >= 0 for timing in results.values())
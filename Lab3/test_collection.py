@@ -0,0 +1,155 @@
+import os
+import random
+
+import pytest
+
+from binseq import write_binary
+from collection import INDEX_SUFFIX, SequenceCollection, build_index
+from ex31 import DNASequence
+from ex32 import RNASequence
+from ex33 import ProteinSequence
+
+"""
+Outsource:
+- tests
+"""
+
+
+def sample_sequences():
+    rng = random.Random(8)
+    return [
+        DNASequence("chr2", "".join(rng.choice("ACGT") for _ in range(503))),
+        DNASequence("chr1", "".join(rng.choice("ACGT") for _ in range(1001))),
+        RNASequence("tx1", "AUGGCCUAA"),
+        ProteinSequence("prot1", "MKLLVV*"),
+        DNASequence("chr10", "ACGT"),
+        DNASequence("empty", ""),
+        ProteinSequence("żółw", "MW"),
+    ]
+
+
+@pytest.fixture(params=["memory", "disk"])
+def collection(request, tmp_path):
+    memory = SequenceCollection(sample_sequences())
+    if request.param == "memory":
+        yield memory
+        return
+    path = str(tmp_path / "seqs.seqb")
+    memory.save(path)
+    with SequenceCollection.open(path) as opened:
+        yield opened
+
+
+class TestSequenceCollection:
+    """Tests for SequenceCollection from collection.py, in memory and on disk"""
+
+    def test_lookup(self, collection):
+        """Test identifier lookup, membership and order"""
+        sequences = sample_sequences()
+        assert len(collection) == len(sequences)
+        assert list(collection) == [sequence.identifier for sequence in sequences]
+        for sequence in sequences:
+            assert sequence.identifier in collection
+            loaded = collection[sequence.identifier]
+            assert type(loaded) is type(sequence)
+            assert loaded.data == sequence.data
+            assert collection.length(sequence.identifier) == len(sequence.data)
+        assert "chr3" not in collection
+        with pytest.raises(KeyError):
+            collection["chr3"]
+        with pytest.raises(KeyError):
+            collection.fetch("chr3", 0, 1)
+
+    def test_prefix_search(self, collection):
+        """Test sorted prefix search on identifiers"""
+        assert collection.with_prefix("chr") == ["chr1", "chr10", "chr2"]
+        assert collection.with_prefix("chr1") == ["chr1", "chr10"]
+        assert collection.with_prefix("ż") == ["żółw"]
+        assert collection.with_prefix("x") == []
+        assert collection.with_prefix("") == sorted(collection)
+
+    def test_fetch_regions(self, collection):
+        """Test single and bulk region extraction against slicing"""
+        rng = random.Random(2)
+        regions = []
+        for sequence in sample_sequences():
+            assert collection.fetch(sequence.identifier) == sequence.data
+            for _ in range(20):
+                start = rng.randrange(len(sequence.data) + 1)
+                end = rng.randrange(start, len(sequence.data) + 1)
+                assert collection.fetch(sequence.identifier, start, end) == sequence.data[start:end]
+                regions.append((sequence.identifier, start, end, sequence.data[start:end]))
+        fetched = collection.fetch_many((identifier, start, end) for identifier, start, end, _ in regions)
+        assert list(fetched) == [expected for *_, expected in regions]
+        with pytest.raises(IndexError):
+            collection.fetch("tx1", 5, 10)
+        with pytest.raises(IndexError):
+            collection.fetch("tx1", -1, 2)
+
+
+class TestCollectionPersistence:
+    """Tests for saving, reopening and indexing collections"""
+
+    def test_add_and_duplicates(self, tmp_path):
+        """Test that duplicates are rejected and opened collections are read-only"""
+        collection = SequenceCollection()
+        collection.add(DNASequence("a", "ACGT"))
+        assert collection.with_prefix("") == ["a"]
+        collection.add(DNASequence("0", "A"))
+        assert collection.with_prefix("") == ["0", "a"]
+        with pytest.raises(ValueError):
+            collection.add(DNASequence("a", "GG"))
+        path = str(tmp_path / "dup.seqb")
+        with pytest.raises(ValueError):
+            write_binary(path, [DNASequence("a", "A"), DNASequence("a", "C")])
+        collection.save(path)
+        with SequenceCollection.open(path) as opened:
+            with pytest.raises(TypeError):
+                opened.add(DNASequence("b", "A"))
+
+    def test_index_built_and_refreshed(self, tmp_path):
+        """Test that a missing or stale index is rebuilt on open"""
+        path = str(tmp_path / "seqs.seqb")
+        write_binary(path, sample_sequences())
+        assert not os.path.exists(path + INDEX_SUFFIX)
+        with SequenceCollection.open(path) as opened:
+            assert opened.fetch("tx1") == "AUGGCCUAA"
+        assert os.path.exists(path + INDEX_SUFFIX)
+        write_binary(path, [DNASequence("other", "GATTACA")])
+        with SequenceCollection.open(path) as opened:
+            assert list(opened) == ["other"]
+            assert opened.fetch("other", 1, 4) == "ATT"
+
+    def test_same_size_rewrite_detected(self, tmp_path):
+        """Test that an index is rebuilt when the data file changes but keeps its size and layout"""
+        path = str(tmp_path / "seqs.seqb")
+        write_binary(path, [DNASequence("chr1", "ACGTACGT")])
+        with SequenceCollection.open(path) as opened:
+            assert list(opened) == ["chr1"]
+        stat = os.stat(path)
+        write_binary(path, [DNASequence("chr9", "TTTTACGT")])
+        assert os.path.getsize(path) == stat.st_size
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        with SequenceCollection.open(path) as opened:
+            assert list(opened) == ["chr9"]
+            assert "chr1" not in opened
+            assert opened.fetch("chr9", 0, 4) == "TTTT"
+
+    def test_many_records(self, tmp_path):
+        """Test lookups in a collection larger than the initial hash table"""
+        sequences = [DNASequence(f"read{i}", "ACGT"[i % 4] * (i % 7)) for i in range(2000)]
+        path = str(tmp_path / "reads.seqb")
+        write_binary(path, sequences)
+        assert build_index(path) == path + INDEX_SUFFIX
+        with SequenceCollection.open(path) as opened:
+            assert len(opened) == 2000
+            for sequence in sequences[::37]:
+                assert opened[sequence.identifier].data == sequence.data
+            assert opened.with_prefix("read199") == ["read199"] + [f"read199{i}" for i in range(10)]
+
+    def test_invalid_file(self, tmp_path):
+        """Test that a non-binary file is rejected"""
+        path = tmp_path / "bad.seqb"
+        path.write_bytes(b"not a sequence file")
+        with pytest.raises(ValueError):
+            SequenceCollection.open(str(path))
@@ -0,0 +1,80 @@
+import pytest
+
+from columnar import FORMATS, ColumnarHospital, available_formats, export_hospital, read_hospital
+from ex2 import Patient
+from ex22 import Hospital
+
+"""
+Outsource:
+- tests
+"""
+
+REQUIRES = {"arrow": "pyarrow", "parquet": "pyarrow", "npz": "numpy", "native": None}
+
+
+@pytest.fixture(params=FORMATS)
+def file_format(request):
+    """Every columnar format; formats whose library is missing are skipped."""
+    if REQUIRES[request.param]:
+        pytest.importorskip(REQUIRES[request.param])
+    return request.param
+
+
+def make_hospital(ids):
+    """Return a hospital with one patient per id; every other patient is admitted."""
+    hospital = Hospital("Szpital Bródnowski")
+    for i, patient_id in enumerate(ids):
+        hospital.add_patient(Patient(f"Pacjent {i} Żółć", "1990-05-15", patient_id, "Asthma", admitted=i % 2 == 0))
+    return hospital
+
+
+class TestColumnarExport:
+    """Tests for the columnar export and lazy reader in columnar.py"""
+
+    @pytest.mark.parametrize("ids", [[3, 1, 2**40], ["P1", "P2", "P3"], []])
+    def test_round_trip(self, tmp_path, file_format, ids):
+        """Test that every field survives a round trip, for int, string and no ids"""
+        hospital = make_hospital(ids)
+        path = str(tmp_path / "hospital.col")
+        assert hospital.export_columns(path, file_format) == file_format
+        with read_hospital(path) as loaded:
+            assert isinstance(loaded, ColumnarHospital)
+            assert loaded.name == "Szpital Bródnowski"
+            assert len(loaded) == len(ids)
+            assert [str(p) for p in loaded.patients] == [str(p) for p in hospital.patients]
+            assert [p.id for p in loaded.patients] == ids
+
+    def test_lazy_patients(self, tmp_path):
+        """Test that get_patient_list builds only admitted patients, reused by `patients`"""
+        path = str(tmp_path / "hospital.col")
+        export_hospital(make_hospital(list(range(10))), path, "native")
+        with read_hospital(path) as loaded:
+            admitted = loaded.get_patient_list()
+            assert [p.id for p in admitted] == [0, 2, 4, 6, 8]
+            assert sum(patient is not None for patient in loaded._row_patients) == 5
+            assert loaded.patients[2] is admitted[1]
+            loaded.discharge_patient(0)
+            assert len(loaded) == 9
+
+    def test_native_columns_zero_copy(self, tmp_path):
+        """Test that native numeric columns are memoryviews over the mapped file"""
+        path = str(tmp_path / "hospital.col")
+        export_hospital(make_hospital([5, 6, 7]), path, "native")
+        with read_hospital(path) as loaded:
+            ids = loaded.columns["id"]
+            assert isinstance(ids, memoryview) and ids.format == "q"
+            assert ids.tolist() == [5, 6, 7]
+            assert sum(loaded.columns["admitted"]) == 2
+            assert list(loaded.columns["diagnosis"]) == ["Asthma"] * 3
+            assert loaded.columns["name"][-1] == "Pacjent 2 Żółć"
+
+    def test_default_and_errors(self, tmp_path):
+        """Test the default format, unknown formats and foreign files"""
+        path = str(tmp_path / "hospital.col")
+        assert export_hospital(make_hospital([1]), path) == available_formats()[0]
+        with pytest.raises(ValueError):
+            export_hospital(make_hospital([1]), path, "csv")
+        other = tmp_path / "other.txt"
+        other.write_text("hello")
+        with pytest.raises(ValueError):
+            read_hospital(str(other))
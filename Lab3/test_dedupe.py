@@ -0,0 +1,121 @@
+import gc
+import random
+import weakref
+
+import pytest
+
+from dedupe import (MinHashClusterer, cluster_exact, cluster_minhash, dedupe_exact, estimate_similarity,
+                    minhash_sketch)
+from ex31 import DNASequence
+from ex33 import ProteinSequence
+from kmers import alphabet_codes
+
+"""
+Outsource:
+- tests
+"""
+
+
+def random_data(rng, alphabet: str, length: int):
+    """Return random sequence data."""
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def substitute(rng, data: str, alphabet: str, count: int):
+    """Return data with `count` random substitutions."""
+    data = list(data)
+    for position in rng.sample(range(len(data)), count):
+        data[position] = rng.choice([char for char in alphabet if char != data[position]])
+    return "".join(data)
+
+
+class TestExactDedupe:
+    """Tests for exact deduplication in dedupe.py"""
+
+    def test_dedupe_exact(self):
+        """Test that the first of each distinct content is kept, in order"""
+        sequences = [DNASequence("a", "ATGC"), DNASequence("b", "atgc"), DNASequence("c", "GGGG"),
+                     ProteinSequence("p", "ATGC"), DNASequence("d", "GGGG")]
+        assert [s.identifier for s in dedupe_exact(sequences)] == ["a", "c", "p"]
+
+    def test_cluster_exact(self):
+        """Test exact clusters with and without member identifiers"""
+        sequences = [DNASequence("a", "ATGC"), DNASequence("b", "GG"), DNASequence("c", "ATGC")]
+        clusters = cluster_exact(sequences)
+        assert [(c.identifier, c.members) for c in clusters] == [("a", ["a", "c"]), ("b", ["b"])]
+        assert [len(c) for c in cluster_exact(sequences, keep_members=False)] == [2, 1]
+
+
+class TestMinHash:
+    """Tests for MinHash sketches and near-duplicate clustering"""
+
+    def test_sketch_similarity(self):
+        """Test that sketch similarity tracks k-mer set similarity"""
+        rng = random.Random(5)
+        table, bits, _ = alphabet_codes("ACGT")
+        data = random_data(rng, "ACGT", 2000)
+        same = minhash_sketch(data, 16, table, bits, 128)
+        assert estimate_similarity(same, minhash_sketch(data, 16, table, bits, 128)) == 1.0
+        near = minhash_sketch(substitute(rng, data, "ACGT", 5), 16, table, bits, 128)
+        far = minhash_sketch(random_data(rng, "ACGT", 2000), 16, table, bits, 128)
+        assert estimate_similarity(same, near) > 0.8
+        assert estimate_similarity(same, far) < 0.1
+        assert minhash_sketch("ACGT", 16, table, bits, 128) is None
+
+    def test_near_duplicate_families(self):
+        """Test that variants of the same read cluster together and unrelated reads do not"""
+        rng = random.Random(9)
+        sequences, family = [], {}
+        for parent in range(20):
+            data = random_data(rng, "ACGT", 300)
+            for copy in range(5):
+                identifier = f"r{parent}_{copy}"
+                family[identifier] = parent
+                sequences.append(DNASequence(identifier, substitute(rng, data, "ACGT", copy % 2)))
+        rng.shuffle(sequences)
+        clusters = cluster_minhash(sequences, threshold=0.6)
+        assert len(clusters) == 20
+        for cluster in clusters:
+            assert len({family[identifier] for identifier in cluster.members}) == 1
+            assert len(cluster) == 5
+
+    def test_shared_band_bucket(self):
+        """Test that a representative later in a band bucket is still a candidate"""
+        clusterer = MinHashClusterer(threshold=0.5, sketch_size=8, bands=4, k=3)
+        first = clusterer.add(DNASequence("a", "CTGAATT"))
+        second = clusterer.add(DNASequence("b", "CATTTCG"))
+        assert first is not second
+        # "c" shares only the band "a" and "b" both have, and is only similar to "b".
+        assert clusterer.add(DNASequence("c", "TAATTTC")) is second
+
+    def test_proteins_and_types(self):
+        """Test protein clustering and that different sequence types never share a cluster"""
+        rng = random.Random(4)
+        protein = random_data(rng, "ACDEFGHIKLMNPQRSTVWY", 200)
+        clusterer = MinHashClusterer(threshold=0.7)
+        first = clusterer.add(ProteinSequence("p1", protein))
+        assert clusterer.add(ProteinSequence("p2", substitute(rng, protein, "ACDEFGHIKLMNPQRSTVWY", 1))) is first
+        assert clusterer.add(DNASequence("d1", "ACGT" * 50)) is not first
+        assert clusterer.add(DNASequence("short", "ACG")).members == ["short"]
+        assert clusterer.representatives() == ["p1", "d1", "short"]
+
+    def test_sequences_not_kept(self):
+        """Test that clusters hold identifiers and sketches, not the sequence objects"""
+        clusterer = MinHashClusterer(keep_members=False)
+        sequence = DNASequence("a", "ACGTTGCA" * 40)
+        alive = weakref.ref(sequence)
+        cluster = clusterer.add(sequence)
+        assert clusterer.add(DNASequence("b", "ACGTTGCA" * 40)) is cluster
+        del sequence
+        gc.collect()
+        assert alive() is None
+        assert (cluster.identifier, cluster.members, len(cluster)) == ("a", None, 2)
+
+    def test_invalid_arguments(self):
+        """Test that invalid parameters raise ValueError"""
+        with pytest.raises(ValueError):
+            MinHashClusterer(threshold=1.5)
+        with pytest.raises(ValueError):
+            MinHashClusterer(sketch_size=64, bands=10)
+        with pytest.raises(ValueError):
+            MinHashClusterer(k=20).add(ProteinSequence("p", "MKV" * 20))
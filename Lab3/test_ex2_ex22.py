@@ -173,3 +173,22 @@ class TestHospital:
         hospital.discharge_patient("P1")
         assert len(hospital.patients) == 1
         assert p1 not in hospital.patients
+
+
+class TestReports:
+    """Tests for the streamed patient reports in ex2.py and ex22.py"""
+
+    def test_reports_match_str(self):
+        """Test that written reports equal str(patient) separated by blank lines"""
+        import io
+        hospital = Hospital("City General Hospital")
+        p1 = Patient("Anna Nowak", "2005-10-11", "P1", "Asthma", admitted=True)
+        p2 = Patient("Jan Kowalski", "1985-09-30", 2, "Type 1 Diabetes")
+        hospital.add_patient(p1)
+        hospital.add_patient(p2)
+        output = io.StringIO()
+        hospital.write_report(output)
+        assert output.getvalue() == f"{p1}\n\n{p2}\n\n"
+        output = io.StringIO()
+        hospital.write_report(output, admitted_only=True)
+        assert output.getvalue() == f"{p1}\n\n"
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from ex31 import DNASequence
 from ex32 import RNASequence
@@ -101,6 +103,37 @@ class TestDNASequence:
         dna = DNASequence("dna1", "TTTTAAAA")
         rna = dna.transcribe()
         assert rna.data == "UUUUAAAA"
+    
+    def test_dna_reverse_complement(self):
+        """Test reverse complement generation"""
+        dna = DNASequence("dna1", "AATGC")
+        revcomp = dna.reverse_complement()
+        assert isinstance(revcomp, DNASequence)
+        assert revcomp.identifier == "dna1_revcomp"
+        assert revcomp.data == "GCATT"
+    
+    def test_dna_find_motif_both_strands(self):
+        """Test strand-tagged motif search on both strands"""
+        dna = DNASequence("dna1", "ATGCCCAT")
+        assert dna.find_motif("ATG", both_strands=True) == [(0, "+"), (5, "-")]
+        assert dna.find_motif("CAT", both_strands=True) == [(0, "-"), (5, "+")]
+    
+    def test_dna_find_motif_both_strands_palindrome(self):
+        """Test that a palindromic motif is reported on both strands"""
+        dna = DNASequence("dna1", "AAGAATTCAA")
+        assert dna.find_motif("gaattc", both_strands=True) == [(2, "+"), (2, "-")]
+    
+    def test_derived_sequences_are_usable(self):
+        """Test that complements built without re-validation behave normally"""
+        comp = DNASequence("dna1", "AAAA").complement()
+        comp.mutate(0, "G")
+        assert comp.data == "GTTT"
+        assert comp.gc_content() == 0.25
+    
+    def test_dna_kmer_counts(self):
+        """Test k-mer counting on a DNA sequence"""
+        dna = DNASequence("dna1", "ATGATG")
+        assert dna.kmer_counts(3) == {"ATG": 2, "TGA": 1, "GAT": 1}
 
 
 class TestRNASequence:
@@ -204,6 +237,17 @@ class TestRNASequence:
         assert "M" in protein.data
         assert "A" in protein.data
         assert "E" in protein.data
+    
+    def test_rna_translate_unknown_codon(self):
+        """Test that unknown codons still make the protein invalid"""
+        rna = RNASequence("rna1", "AUGAAA")
+        with pytest.raises(ValueError, match="Invalid protein sequence"):
+            rna.translate()
+    
+    def test_rna_kmer_counts(self):
+        """Test k-mer counting on an RNA sequence"""
+        rna = RNASequence("rna1", "AUGAUG")
+        assert rna.kmer_counts(2) == {"AU": 2, "UG": 2, "GA": 1}
 
 
 class TestProteinSequence:
@@ -283,6 +327,11 @@ class TestProteinSequence:
         protein = ProteinSequence("prot1", "MKLLVV")
         positions = protein.find_motif("LLV")
         assert positions == [2]
+    
+    def test_protein_kmer_counts(self):
+        """Test k-mer counting on a protein sequence"""
+        protein = ProteinSequence("prot1", "MKLMKL")
+        assert protein.kmer_counts(3) == {"MKL": 2, "KLM": 1, "LMK": 1}
 
 
 class TestIntegration:
@@ -323,3 +372,109 @@ class TestIntegration:
         
         assert len(positions_dna) == 3
         assert len(positions_rna) == 3
+
+
+class TestComposition:
+    """Tests for base composition and GC profiles on DNA and RNA sequences"""
+    
+    def test_dna_base_counts(self):
+        """Test counting bases over the whole sequence and a region"""
+        dna = DNASequence("dna1", "ATGCGGCA")
+        assert dna.base_counts() == {"A": 2, "C": 2, "G": 3, "T": 1}
+        assert dna.base_counts(2, 5) == {"A": 0, "C": 1, "G": 2, "T": 0}
+    
+    def test_dna_gc_content(self):
+        """Test GC fraction of the whole sequence and a region"""
+        dna = DNASequence("dna1", "ATGCGGCA")
+        assert dna.gc_content() == pytest.approx(5 / 8)
+        assert dna.gc_content(0, 2) == 0.0
+        assert DNASequence("empty", "").gc_content() == 0.0
+    
+    def test_gc_content_region_out_of_range(self):
+        """Test querying a region outside the sequence"""
+        dna = DNASequence("dna1", "ATGC")
+        with pytest.raises(IndexError):
+            dna.gc_content(2, 10)
+    
+    def test_dna_window_profile(self):
+        """Test sliding-window GC profile"""
+        dna = DNASequence("dna1", "AAGGCCTT")
+        assert dna.window_profile(4, 2) == [0.5, 1.0, 0.5]
+        assert dna.window_profile(9) == []
+    
+    def test_window_profile_invalid_size(self):
+        """Test that window size must be positive"""
+        dna = DNASequence("dna1", "ATGC")
+        with pytest.raises(ValueError):
+            dna.window_profile(0)
+    
+    def test_composition_updated_after_mutate(self):
+        """Test that cached counts are invalidated by mutate"""
+        dna = DNASequence("dna1", "AAAA")
+        assert dna.gc_content() == 0.0
+        dna.mutate(1, "G")
+        assert dna.gc_content() == 0.25
+        assert dna.base_counts()["G"] == 1
+    
+    def test_rna_composition(self):
+        """Test composition methods on an RNA sequence"""
+        rna = RNASequence("rna1", "AUGCUU")
+        assert rna.base_counts() == {"A": 1, "C": 1, "G": 1, "U": 3}
+        assert rna.gc_content() == pytest.approx(2 / 6)
+        assert rna.window_profile(3, 3) == [pytest.approx(1 / 3), pytest.approx(1 / 3)]
+        rna.mutate(0, "G")
+        assert rna.gc_content() == 0.5
+
+    def test_composition_across_blocks(self):
+        """Test region counts and windows spanning the index block boundaries against str.count"""
+        rng = random.Random(6)
+        data = "".join(rng.choice("ACGT") for _ in range(300))
+        dna = DNASequence("dna1", data)
+        for start, end in [(0, 300), (63, 64), (64, 128), (1, 299), (127, 129), (300, 300)]:
+            assert dna.base_counts(start, end) == {base: data.count(base, start, end) for base in "ACGT"}
+        expected = [(data.count("G", i, i + 70) + data.count("C", i, i + 70)) / 70 for i in range(0, 231, 7)]
+        assert dna.window_profile(70, 7) == pytest.approx(expected)
+
+
+class TestProteinProperties:
+    """Tests for physicochemical properties of ProteinSequence"""
+    
+    def test_molecular_weight(self):
+        """Test molecular weight of a dipeptide"""
+        protein = ProteinSequence("prot1", "GA")
+        assert protein.molecular_weight() == pytest.approx(57.0519 + 71.0788 + 18.01524)
+        assert ProteinSequence("empty", "").molecular_weight() == 0.0
+    
+    def test_stop_is_ignored(self):
+        """Test that a trailing stop does not change the properties"""
+        assert ProteinSequence("a", "MKL*").molecular_weight() == ProteinSequence("b", "MKL").molecular_weight()
+    
+    def test_isoelectric_point(self):
+        """Test pI of acidic and basic peptides"""
+        assert ProteinSequence("acid", "DDDD").isoelectric_point() < 4
+        assert ProteinSequence("base", "KKKK").isoelectric_point() > 10
+        assert 0 < ProteinSequence("prot1", "MKWVTFISLL").isoelectric_point() < 14
+    
+    def test_aa_composition(self):
+        """Test amino acid fractions"""
+        composition = ProteinSequence("prot1", "MKLL").aa_composition()
+        assert composition["L"] == 0.5
+        assert composition["M"] == 0.25
+        assert composition["W"] == 0.0
+        assert sum(composition.values()) == pytest.approx(1.0)
+    
+    def test_hydrophobicity_profile(self):
+        """Test sliding-window Kyte-Doolittle hydropathy"""
+        protein = ProteinSequence("prot1", "IIRR")
+        assert protein.hydrophobicity_profile(2) == pytest.approx([4.5, 0.0, -4.5])
+        assert protein.hydrophobicity_profile(5) == []
+        with pytest.raises(ValueError):
+            protein.hydrophobicity_profile(0)
+    
+    def test_properties_updated_after_mutate(self):
+        """Test that cached properties are invalidated by mutate"""
+        protein = ProteinSequence("prot1", "GG")
+        weight = protein.molecular_weight()
+        protein.mutate(0, "W")
+        assert protein.molecular_weight() > weight
+        assert protein.aa_composition()["W"] == 0.5
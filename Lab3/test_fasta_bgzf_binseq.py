@@ -0,0 +1,220 @@
+import gzip
+import random
+import pytest
+from bgzf import BgzfReader, BgzfWriter, MAX_BLOCK_DATA
+from binseq import MAX_IDENTIFIER_BYTES, BinarySequenceFile, pack_nucleotides, unpack_nucleotides, write_binary
+from ex31 import DNASequence
+from ex32 import RNASequence
+from ex33 import ProteinSequence
+from fasta import fasta_chunks, fetch_bgzf_record, index_bgzf_fasta, open_fasta, read_fasta, write_fasta
+
+"""
+Outsource:
+- tests
+"""
+
+
+def sample_sequences():
+    rng = random.Random(5)
+    return [
+        DNASequence("chr1", "".join(rng.choice("ACGT") for _ in range(1001))),
+        RNASequence("tx1", "AUGGCCUAA"),
+        ProteinSequence("prot1", "MKLLVV*"),
+        DNASequence("empty", ""),
+    ]
+
+
+class TestCompressedFasta:
+    """Tests for open_fasta and write_fasta from fasta.py"""
+
+    @pytest.mark.parametrize("name", ["seqs.fa", "seqs.fa.gz", "seqs.fa.bgz"])
+    def test_round_trip(self, tmp_path, name):
+        """Test writing and reading back plain, gzip and BGZF FASTA"""
+        path = str(tmp_path / name)
+        sequences = sample_sequences()
+        with open_fasta(path, "w") as handle:
+            write_fasta(sequences, handle)
+        with open_fasta(path) as handle:
+            records = list(read_fasta(handle))
+        assert records == [(s.identifier, s.data) for s in sequences]
+
+    def test_gzip_detected_by_content(self, tmp_path):
+        """Test that gzip input is recognised without a .gz extension"""
+        path = tmp_path / "seqs.fa"
+        with gzip.open(path, "wt") as handle:
+            handle.write(">a\nATG\n")
+        with open_fasta(str(path)) as handle:
+            assert list(read_fasta(handle)) == [("a", "ATG")]
+
+    @pytest.mark.parametrize("name", ["seqs.fa", "seqs.fa.bgz"])
+    def test_wrapped_round_trip(self, tmp_path, name):
+        """Test line-wrapped output and reading it back"""
+        path = str(tmp_path / name)
+        sequences = sample_sequences() + [DNASequence("long", "ACGT" * 50000)]
+        with open_fasta(path, "w") as handle:
+            write_fasta(sequences, handle, width=60)
+        with open_fasta(path) as handle:
+            assert list(read_fasta(handle)) == [(s.identifier, s.data) for s in sequences]
+        with open_fasta(path) as handle:
+            assert max(len(line) for line in handle if not line.startswith(">")) == 61
+
+    def test_fasta_chunks(self):
+        """Test the pieces of one record, wrapped and unwrapped"""
+        assert "".join(fasta_chunks("a", "ACGTACG", 3)) == ">a\nACG\nTAC\nG\n"
+        assert "".join(fasta_chunks("a", "ACG", 3)) == ">a\nACG\n"
+        assert "".join(fasta_chunks("e", "")) == ">e\n\n"
+        with pytest.raises(ValueError):
+            write_fasta(sample_sequences(), None, width=0)
+
+    def test_invalid_arguments(self, tmp_path):
+        """Test unknown modes and compressions"""
+        with pytest.raises(ValueError):
+            open_fasta(str(tmp_path / "x.fa"), "a")
+        with pytest.raises(ValueError):
+            open_fasta(str(tmp_path / "x.fa"), "w", compression="zip")
+
+
+class TestBgzf:
+    """Tests for BgzfWriter and BgzfReader from bgzf.py"""
+
+    def test_random_block_access(self, tmp_path):
+        """Test that every block decompresses on its own"""
+        path = str(tmp_path / "data.bgz")
+        text = "".join(random.Random(1).choice("ACGT\n") for _ in range(3 * MAX_BLOCK_DATA + 10))
+        with BgzfWriter(path) as writer:
+            writer.write(text)
+        with BgzfReader(path) as reader:
+            assert len(reader) == 4
+            assert reader.read_block(2).decode("ascii") == text[2 * MAX_BLOCK_DATA:3 * MAX_BLOCK_DATA]
+            assert reader.read_block(3).decode("ascii") == text[3 * MAX_BLOCK_DATA:]
+        with gzip.open(path, "rt") as handle:
+            assert handle.read() == text
+
+    def test_mixed_write_sizes(self, tmp_path):
+        """Test that block boundaries do not depend on how the text was split into writes"""
+        text = "".join(random.Random(2).choice("ACGT") for _ in range(2 * MAX_BLOCK_DATA + 5))
+        pieces = [text[:10], text[10:MAX_BLOCK_DATA + 3], text[MAX_BLOCK_DATA + 3:]]
+        for name, parts in (("one.bgz", [text]), ("many.bgz", pieces)):
+            with BgzfWriter(str(tmp_path / name)) as writer:
+                writer.writelines(parts)
+        assert (tmp_path / "one.bgz").read_bytes() == (tmp_path / "many.bgz").read_bytes()
+
+    def test_virtual_offsets(self, tmp_path):
+        """Test reading from the virtual offsets returned by tell(), across block boundaries"""
+        path = str(tmp_path / "data.bgz")
+        rng = random.Random(3)
+        pieces = ["".join(rng.choice("ACGT") for _ in range(rng.randrange(1, 30000))) for _ in range(8)]
+        offsets = []
+        with BgzfWriter(path) as writer:
+            for piece in pieces:
+                offsets.append(writer.tell())
+                writer.write(piece)
+        with BgzfReader(path) as reader:
+            for offset, piece in zip(offsets, pieces):
+                assert reader.read(offset, len(piece)).decode("ascii") == piece
+            assert reader.read(offsets[-1], 10 ** 6).decode("ascii") == pieces[-1]
+            with pytest.raises(ValueError):
+                reader.read(offsets[1] + (1 << 16), 5)
+
+    def test_fasta_record_index(self, tmp_path):
+        """Test locating and fetching records of a BGZF FASTA file"""
+        path = str(tmp_path / "seqs.fa.bgz")
+        rng = random.Random(4)
+        sequences = [DNASequence(f"s{i} note", "".join(rng.choice("ACGT") for _ in range(rng.randrange(0, 40000))))
+                     for i in range(12)]
+        with open_fasta(path, "w") as handle:
+            write_fasta(sequences, handle, width=60)
+        index = index_bgzf_fasta(path)
+        assert list(index) == [sequence.identifier for sequence in sequences]
+        with BgzfReader(path) as reader:
+            for sequence in reversed(sequences):
+                assert fetch_bgzf_record(reader, index[sequence.identifier]) == (sequence.identifier, sequence.data)
+        duplicate = str(tmp_path / "dup.fa.bgz")
+        with open_fasta(duplicate, "w") as handle:
+            write_fasta([DNASequence("a", "AC"), DNASequence("a", "GT")], handle)
+        with pytest.raises(ValueError):
+            index_bgzf_fasta(duplicate)
+
+    def test_not_bgzf(self, tmp_path):
+        """Test that plain gzip is rejected by the block reader"""
+        path = tmp_path / "plain.gz"
+        with gzip.open(path, "wt") as handle:
+            handle.write("ATGC")
+        with pytest.raises(ValueError, match="Not a BGZF file"):
+            BgzfReader(str(path))
+
+
+class TestBinarySequenceFile:
+    """Tests for the native binary format from binseq.py"""
+
+    def test_pack_round_trip(self):
+        """Test 2-bit packing of DNA and RNA"""
+        for data in ("", "A", "ACGTT", "TTTTGGGGCCCCAAAA"):
+            packed = pack_nucleotides(data)
+            assert len(packed) == (len(data) + 3) // 4
+            assert unpack_nucleotides(packed, len(data)) == data
+        assert unpack_nucleotides(pack_nucleotides("ACGU", 1), 4, 1) == "ACGU"
+
+    def test_round_trip(self, tmp_path):
+        """Test writing and loading all sequence types"""
+        path = str(tmp_path / "seqs.seqb")
+        sequences = sample_sequences()
+        write_binary(path, sequences)
+        with BinarySequenceFile(path) as store:
+            assert len(store) == 4
+            assert store.identifiers() == ["chr1", "tx1", "prot1", "empty"]
+            loaded = list(store)
+        for original, copy in zip(sequences, loaded):
+            assert type(copy) is type(original)
+            assert (copy.identifier, copy.data) == (original.identifier, original.data)
+
+    def test_fetch_region(self, tmp_path):
+        """Test decoding regions without loading whole records"""
+        path = str(tmp_path / "seqs.seqb")
+        sequences = sample_sequences()
+        write_binary(path, sequences)
+        data = sequences[0].data
+        with BinarySequenceFile(path) as store:
+            for start, end in ((0, 0), (0, 5), (3, 9), (997, 1001), (250, 750)):
+                assert store.fetch("chr1", start, end) == data[start:end]
+            assert store.fetch("prot1", 1, 3) == "KL"
+            assert "tx1" in store
+            with pytest.raises(IndexError):
+                store.fetch("chr1", 5, 2000)
+            with pytest.raises(KeyError):
+                store["missing"]
+
+    def test_smaller_than_text(self, tmp_path):
+        """Test that packed DNA is about a quarter of the text size"""
+        path = tmp_path / "seqs.seqb"
+        write_binary(str(path), [DNASequence("big", "ACGT" * 10000)])
+        assert path.stat().st_size < 10000 + 100
+
+    def test_invalid_file(self, tmp_path):
+        """Test rejecting files in other formats and unsupported objects"""
+        path = tmp_path / "bad.seqb"
+        path.write_bytes(b"NOTASEQUENCEFILE" * 4)
+        with pytest.raises(ValueError):
+            BinarySequenceFile(str(path))
+        with pytest.raises(TypeError):
+            write_binary(str(tmp_path / "x.seqb"), ["ATGC"])
+
+    def test_duplicate_identifiers(self, tmp_path):
+        """Test that duplicate identifiers are rejected when writing and when opening"""
+        path = tmp_path / "dup.seqb"
+        with pytest.raises(ValueError, match="Duplicate"):
+            write_binary(str(path), [DNASequence("a", "A"), ProteinSequence("a", "M")])
+        write_binary(str(path), [DNASequence("a", "A"), DNASequence("b", "C")])
+        raw = path.read_bytes()
+        path.write_bytes(raw[:raw.rindex(b"b")] + b"a")
+        with pytest.raises(ValueError, match="Duplicate"):
+            BinarySequenceFile(str(path))
+
+    def test_identifier_length(self, tmp_path):
+        """Test that identifiers too long for the index are rejected with ValueError"""
+        path = tmp_path / "long.seqb"
+        longest = "é" * (MAX_IDENTIFIER_BYTES // 2)
+        write_binary(str(path), [DNASequence(longest, "ACGT")])
+        assert BinarySequenceFile(str(path))[longest].data == "ACGT"
+        with pytest.raises(ValueError, match="Identifier longer"):
+            write_binary(str(path), [DNASequence("a", "A"), DNASequence(longest + "é", "ACGT")])
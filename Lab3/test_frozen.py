@@ -0,0 +1,109 @@
+import pytest
+from ex31 import DNASequence
+from frozen import (FrozenDNASequence, FrozenProteinSequence, FrozenRNASequence,
+                    derived_identifier)
+
+"""
+Outsource:
+- tests
+"""
+
+
+class TestFrozenDNASequence:
+    """Tests for FrozenDNASequence from frozen.py"""
+
+    def test_creation_validates(self):
+        """Test that frozen sequences validate like mutable ones"""
+        dna = FrozenDNASequence("dna1", "atgc")
+        assert dna.data == "ATGC"
+        with pytest.raises(ValueError, match="DNA sequence can only contain"):
+            FrozenDNASequence("dna1", "AUGC")
+
+    def test_immutable(self):
+        """Test that public attributes cannot be changed"""
+        dna = FrozenDNASequence("dna1", "ATGC")
+        with pytest.raises(AttributeError):
+            dna.data = "AAAA"
+        with pytest.raises(AttributeError):
+            dna.identifier = "other"
+        with pytest.raises(AttributeError):
+            dna.extra = 1
+
+    def test_mutate_returns_copy(self):
+        """Test that mutate leaves the original untouched"""
+        dna = FrozenDNASequence("dna1", "ATGC")
+        mutated = dna.mutate(0, "C")
+        assert mutated.data == "CTGC"
+        assert dna.data == "ATGC"
+        with pytest.raises(ValueError):
+            dna.mutate(0, "U")
+
+    def test_hash_and_equality(self):
+        """Test hashing and equality of frozen sequences"""
+        a = FrozenDNASequence("dna1", "ATGC")
+        b = FrozenDNASequence("dna1", "ATGC")
+        assert a == b
+        assert hash(a) == hash(b)
+        assert len({a, b}) == 1
+        assert a != FrozenDNASequence("dna2", "ATGC")
+
+    def test_complement_view(self):
+        """Test the lazily derived complement view"""
+        dna = FrozenDNASequence("dna1", "ATGCA")
+        comp = dna.complement()
+        assert comp._data is None
+        assert len(comp) == 5
+        assert comp[1:3] == "AC"
+        assert comp._data is None
+        assert comp.data == "TACGT"
+        assert comp.identifier == "dna1_comp"
+
+    def test_reverse_complement_and_transcribe(self):
+        """Test lazily derived reverse complement and transcription"""
+        dna = FrozenDNASequence("dna1", "ATGC")
+        assert dna.reverse_complement().data == "GCAT"
+        rna = dna.transcribe()
+        assert isinstance(rna, FrozenRNASequence)
+        assert rna[0:2] == "AU"
+        assert rna.data == "AUGC"
+        assert rna.identifier == "dna1_RNA"
+
+    def test_pipeline_matches_mutable_classes(self):
+        """Test frozen derivations against the mutable reference"""
+        mutable = DNASequence("gene1", "ATGTTTTGGTAA")
+        frozen = FrozenDNASequence.from_sequence(mutable)
+        protein = frozen.complement().complement().transcribe().translate()
+        reference = mutable.transcribe().translate()
+        assert isinstance(protein, FrozenProteinSequence)
+        assert protein.data == reference.data == "MFW"
+
+    def test_shared_methods(self):
+        """Test analysis methods reused from the mutable class"""
+        dna = FrozenDNASequence("dna1", "ATGCATGC")
+        assert dna.find_motif("ATG") == [0, 4]
+        assert dna.find_motif("CAT", both_strands=True) == [(0, "-"), (3, "+"), (4, "-")]
+        assert dna.gc_content() == 0.5
+        assert dna.kmer_counts(4)["ATGC"] == 2
+        assert dna.thaw().data == "ATGCATGC"
+
+    def test_interned_identifiers(self):
+        """Test that derived identifiers are shared strings"""
+        dna = FrozenDNASequence("dna1", "ATGC")
+        assert dna.complement().identifier is dna.complement().identifier
+        assert derived_identifier("x", "_RNA") is derived_identifier("x", "_RNA")
+
+
+class TestFrozenProteinSequence:
+    """Tests for FrozenRNASequence.translate and FrozenProteinSequence"""
+
+    def test_translate_unknown_codon(self):
+        """Test that unknown codons are rejected when the protein is read"""
+        protein = FrozenRNASequence("rna1", "AUGAAA").translate()
+        with pytest.raises(ValueError, match="Invalid protein sequence"):
+            protein.data
+
+    def test_protein_properties(self):
+        """Test property methods reused from ProteinSequence"""
+        protein = FrozenProteinSequence("prot1", "MKLL")
+        assert protein.aa_composition()["L"] == 0.5
+        assert protein.find_motif("KL") == [1]
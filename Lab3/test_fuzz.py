@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+import fuzz
+from fuzz import BACKENDS, OPERATIONS, check_case, generate_case, register_backend, run_differential
+
+"""
+Outsource:
+- tests
+"""
+
+
+class TestDifferentialHarness:
+    """Tests for the differential fuzz harness in fuzz.py"""
+
+    def test_all_backends_match_reference(self):
+        """Test that every registered backend agrees with the reference at small and larger sizes"""
+        report = run_differential(sizes=(0, 7, 300, 5000), cases=15, seed=1)
+        assert report.mismatches == []
+        assert report.cases == len(OPERATIONS) * 4 * 15
+
+    def test_speedups_reported(self):
+        """Test that a speedup ratio is reported for every backend and size"""
+        report = run_differential(operations=["complement"], sizes=(10, 100), cases=3)
+        speedups = report.speedups()
+        assert set(speedups) == {("complement", name, size) for name in BACKENDS["complement"] for size in (10, 100)}
+        assert all(ratio > 0 for ratio in speedups.values())
+        assert "0 mismatches" in str(report)
+
+    def test_broken_backend_detected(self, monkeypatch):
+        """Test that a backend returning a different result or error is reported"""
+        monkeypatch.setitem(BACKENDS, "transcribe", dict(BACKENDS["transcribe"]))
+        register_backend("transcribe", "broken", lambda data: data.upper().replace("T", "U")[1:])
+        report = run_differential(operations=["transcribe"], sizes=(50,), cases=10, seed=3)
+        assert {mismatch["backend"] for mismatch in report.mismatches} == {"broken"}
+        assert "MISMATCH transcribe/broken" in str(report)
+
+    def test_errors_compared(self):
+        """Test that raising the same exception type as the reference counts as a match"""
+        assert check_case("mutate", ("ACGT", 4, "A")) == []
+        assert check_case("mutate", ("ACGT", 0, "X")) == []
+        assert check_case("translate", ("AUGGGG",)) == []
+
+    def test_generated_cases_reproducible(self):
+        """Test that the same seed generates the same cases"""
+        for operation in OPERATIONS:
+            assert generate_case(operation, random.Random(5), 40) == generate_case(operation, random.Random(5), 40)
+
+    def test_register_unknown_operation(self):
+        """Test that registering a backend for an unknown operation raises ValueError"""
+        with pytest.raises(ValueError):
+            register_backend("reverse", "fast", lambda data: data)
+
+    def test_main_exit_status(self, capsys):
+        """Test the command-line entry point"""
+        assert fuzz.main(["--operations", "find_motif", "--sizes", "20", "--cases", "5"]) == 0
+        assert "0 mismatches" in capsys.readouterr().out
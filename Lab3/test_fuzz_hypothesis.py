@@ -0,0 +1,44 @@
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, settings, strategies as st
+
+from fuzz import check_case
+
+"""
+Outsource:
+- tests
+"""
+
+dna = st.text(alphabet="ACGTacgt", max_size=2000)
+rna = st.lists(st.sampled_from(["AUG", "UUU", "UUC", "UUA", "UUG", "UAA", "UGG", "GCC", "GAA", "UAC", "UGC", "GGG"]),
+               max_size=300).map("".join)
+
+
+class TestHypothesisEquivalence:
+    """Property-based equivalence of the accelerated paths and the reference implementations"""
+
+    @settings(max_examples=200, deadline=None)
+    @given(dna, st.text(alphabet="ACGT", min_size=1, max_size=10))
+    def test_find_motif(self, data, motif):
+        """Test find_motif on arbitrary DNA and motifs"""
+        assert check_case("find_motif", (data, motif)) == []
+
+    @settings(max_examples=200, deadline=None)
+    @given(dna)
+    def test_complement_and_transcribe(self, data):
+        """Test complement and transcribe on arbitrary DNA"""
+        assert check_case("complement", (data,)) == []
+        assert check_case("transcribe", (data,)) == []
+
+    @settings(max_examples=200, deadline=None)
+    @given(rna, st.text(alphabet="ACGU", max_size=2))
+    def test_translate(self, codons, tail):
+        """Test translate on codon strings with stops, unknown codons and a partial last codon"""
+        assert check_case("translate", (codons + tail,)) == []
+
+    @settings(max_examples=200, deadline=None)
+    @given(dna.filter(bool), st.integers(-2, 2100), st.sampled_from("ACGTacgtXN"))
+    def test_mutate(self, data, position, value):
+        """Test mutate including out-of-range positions and invalid bases"""
+        assert check_case("mutate", (data, position, value)) == []
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+import instrument
+from ex2 import Patient
+from ex22 import Hospital
+from ex31 import DNASequence
+from ex32 import RNASequence
+
+"""
+Outsource:
+- tests
+"""
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    """Start and end every test with recording disabled and no statistics."""
+    instrument.disable()
+    instrument.reset()
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+class TestInstrumentation:
+    """Tests for the instrumentation layer in instrument.py"""
+
+    def test_disabled_records_nothing(self):
+        """Test that nothing is recorded unless recording is enabled"""
+        DNASequence("s", "ATGC").find_motif("G")
+        assert instrument.snapshot() == {}
+
+    def test_domain_operations_recorded(self):
+        """Test that construction, find_motif, translate and hospital operations are counted"""
+        with instrument.recording():
+            dna = DNASequence("s", "ATGCATGC")
+            dna.find_motif("ATG")
+            dna.find_motif("GC")
+            RNASequence("r", "AUGUUU").translate()
+            hospital = Hospital("H")
+            hospital.add_patient(Patient("A", "2000-01-01", 1, "Cold"))
+            hospital.discharge_patient(1)
+        stats = instrument.snapshot()
+        assert stats["DNASequence.construct"]["calls"] == 1
+        assert stats["DNASequence.find_motif"]["calls"] == 2
+        assert stats["RNASequence.translate"]["calls"] == 1
+        assert stats["Hospital.add_patient"]["calls"] == 1
+        assert stats["Hospital.discharge_patient"]["calls"] == 1
+        assert stats["DNASequence.find_motif"]["seconds"] >= 0
+
+    def test_results_unchanged(self):
+        """Test that instrumented methods return the same results and raise the same errors;
+        calls that raise are still counted"""
+        with instrument.recording():
+            assert DNASequence("s", "ATGATG").find_motif("ATG") == [0, 3]
+            with pytest.raises(ValueError):
+                DNASequence("s", "ATGX")
+        assert instrument.snapshot()["DNASequence.construct"]["calls"] == 2
+
+    def test_memory_mode(self):
+        """Test that bytes allocated are recorded in memory mode"""
+        with instrument.recording(memory=True):
+            with instrument.measure("allocate"):
+                block = [0] * 100000
+        assert instrument.snapshot()["allocate"]["bytes"] >= 700000
+        del block
+
+    def test_exports(self):
+        """Test the text, JSON and Prometheus exports"""
+        with instrument.recording():
+            with instrument.measure('odd "name"'):
+                pass
+            DNASequence("s", "ATGC")
+        assert "DNASequence.construct" in instrument.report()
+        assert json.loads(instrument.to_json())["DNASequence.construct"]["calls"] == 1
+        text = instrument.to_prometheus()
+        assert "# TYPE lab3_operation_calls_total counter" in text
+        assert 'lab3_operation_calls_total{operation="DNASequence.construct"} 1' in text
+        assert 'operation="odd \\"name\\""' in text
+
+    def test_profile_capture(self):
+        """Test that profile() captures cProfile statistics and allocation sites"""
+        def profiled_workload():
+            return DNASequence("s", "ATGC" * 1000).find_motif("GCA")
+
+        with instrument.profile() as capture:
+            profiled_workload()
+        text = capture.text(limit=10)
+        assert "profiled_workload" in text
+        assert "find_motif" in text
+        assert capture.allocations
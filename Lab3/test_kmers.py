@@ -0,0 +1,114 @@
+import io
+import random
+import sys
+import pytest
+from kmers import CountMinSketch, KmerCounter, count_fasta_kmers, kmer_counts
+from fasta import read_fasta
+
+"""
+Outsource:
+- tests
+"""
+
+
+def naive_counts(data, k):
+    counts = {}
+    for i in range(len(data) - k + 1):
+        kmer = data[i:i + k]
+        counts[kmer] = counts.get(kmer, 0) + 1
+    return counts
+
+
+class TestKmerCounts:
+    """Tests for kmer_counts and KmerCounter from kmers.py"""
+
+    def test_dna_small_k_matches_naive(self):
+        """Test dense counting against slice-based counting"""
+        data = "ATGCGATACGCTTGAGGCTAAATGC"
+        for k in range(1, 6):
+            assert kmer_counts(data, k) == naive_counts(data, k)
+
+    def test_dna_large_k_matches_naive(self):
+        """Test dict-based counting for k beyond the dense table"""
+        data = "ATGCGATACGCTTGAGGCTAAATGC" * 3
+        assert kmer_counts(data, 12) == naive_counts(data, 12)
+
+    def test_rna_alphabet(self):
+        """Test that RNA k-mers are reported with U"""
+        assert kmer_counts("AUGAUG", 3, "ACGU") == {"AUG": 2, "UGA": 1, "GAU": 1}
+
+    def test_protein_alphabet(self):
+        """Test counting over the protein alphabet"""
+        data = "MKLLVVMKLL*"
+        alphabet = "ACDEFGHIKLMNPQRSTVWY*"
+        for k in (1, 2, 5):
+            assert kmer_counts(data, k, alphabet) == naive_counts(data, k)
+
+    def test_k_longer_than_sequence(self):
+        """Test that too-long k gives no k-mers"""
+        assert kmer_counts("ATG", 4) == {}
+
+    def test_invalid_k(self):
+        """Test that k must be positive"""
+        with pytest.raises(ValueError, match="k must be greater than 0"):
+            kmer_counts("ATG", 0)
+
+    def test_unknown_symbols_break_windows(self):
+        """Test that k-mers spanning unknown symbols are skipped"""
+        assert kmer_counts("ATNGC", 2) == {"AT": 1, "GC": 1}
+
+    def test_numpy_and_list_tables(self, monkeypatch):
+        """Test bincount counting of long sequences, and the list table without NumPy, against naive counting"""
+        rng = random.Random(7)
+        data = "".join(rng.choice("ACGTACGTN") for _ in range(3000))
+        expected = {k: {kmer: n for kmer, n in naive_counts(data, k).items() if "N" not in kmer} for k in (1, 3, 8)}
+        for k in expected:
+            assert kmer_counts(data, k) == expected[k]
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        for k in expected:
+            counter = KmerCounter(k)
+            assert isinstance(counter._dense, list)
+            counter.update(data)
+            assert counter.counts() == expected[k]
+
+    def test_counter_accumulates(self):
+        """Test accumulating counts over several sequences"""
+        counter = KmerCounter(2)
+        counter.update("ATAT")
+        counter.update("AT")
+        assert counter.sequences == 2
+        assert counter.count("AT") == 3
+        assert counter.counts() == {"AT": 3, "TA": 1}
+
+
+class TestStreaming:
+    """Tests for FASTA streaming from fasta.py and kmers.py"""
+
+    def test_read_fasta(self):
+        """Test parsing multi-line FASTA records"""
+        handle = io.StringIO(">s1 first\nATG\ncat\n\n>s2\nGG\n")
+        assert list(read_fasta(handle)) == [("s1 first", "ATGCAT"), ("s2", "GG")]
+
+    def test_count_fasta_kmers(self):
+        """Test counts accumulated across FASTA records"""
+        handle = io.StringIO(">a\nATGC\n>b\nATGA\n")
+        counter = count_fasta_kmers(handle, 3)
+        assert counter.counts() == {"ATG": 2, "TGC": 1, "TGA": 1}
+
+    def test_count_fasta_kmers_approximate(self):
+        """Test approximate counting never undercounts"""
+        data = "ATGCGATACGCTTGAGGCTAAATGC" * 4
+        counter = count_fasta_kmers(io.StringIO(">a\n" + data + "\n"), 20, approximate=True)
+        for kmer, count in naive_counts(data, 20).items():
+            assert counter.count(kmer) >= count
+        with pytest.raises(ValueError):
+            counter.counts()
+
+    def test_count_min_sketch(self):
+        """Test sketch estimates for distinct keys"""
+        sketch = CountMinSketch(width=1024, depth=3)
+        sketch.add(7, 5)
+        sketch.add(11)
+        assert sketch.estimate(7) >= 5
+        assert sketch.estimate(11) >= 1
+        assert sketch.total == 6
@@ -0,0 +1,128 @@
+import random
+
+import pytest
+
+import instrument
+import motif_search
+from ex31 import DNASequence
+from ex33 import ProteinSequence
+from frozen import FrozenDNASequence
+from motif_search import (STRATEGIES, MotifAutomaton, MotifIndex, MotifSearcher, choose_strategy,
+                          naive_positions, search_positions)
+
+"""
+Outsource:
+- tests
+"""
+
+
+@pytest.fixture
+def small_thresholds(monkeypatch):
+    """Let the index and automaton kick in on test-sized inputs."""
+    monkeypatch.setattr(motif_search, "INDEX_MIN_QUERIES", 3)
+    monkeypatch.setattr(motif_search, "INDEX_MIN_LENGTH", 16)
+    monkeypatch.setattr(motif_search, "AUTOMATON_MIN_MOTIFS", 4)
+    monkeypatch.setattr(motif_search, "AUTOMATON_MIN_LENGTH", 16)
+
+
+class TestStrategies:
+    """Tests for the individual strategies in motif_search.py"""
+
+    @pytest.mark.parametrize("strategy", STRATEGIES)
+    def test_match_naive(self, strategy):
+        """Test every strategy against the original loop, overlaps and edge cases included"""
+        rng = random.Random(4)
+        for size in (0, 1, 5, 50, 2000):
+            data = "".join(rng.choices("AC", k=size))
+            for motif in ("", "A", "AA", "ACA", "AAAAAAAA", data[3:11], data + "A"):
+                assert search_positions(data, motif, strategy) == naive_positions(data, motif)
+        with pytest.raises(ValueError):
+            search_positions("ACGT", "A", "horspool")
+
+    def test_index(self):
+        """Test k-mer index lookups, including motifs longer than k"""
+        data = "AAAACACAGT" * 20
+        index = MotifIndex(data, 3)
+        for motif in ("AAA", "ACA", "CACAG", "GTAAAACA", "TTT", "GTAAAACACAGTA"):
+            assert index.positions(motif) == naive_positions(data, motif)
+        with pytest.raises(ValueError):
+            index.positions("AC")
+        with pytest.raises(ValueError):
+            MotifIndex(data, 0)
+
+    def test_automaton(self):
+        """Test that the automaton reports overlapping and nested motifs"""
+        motifs = ["A", "AA", "AAA", "ACA", "CAC", "AA", "G"]
+        data = "AAAACACAT"
+        found = MotifAutomaton(motifs).search(data)
+        assert list(found) == ["A", "AA", "AAA", "ACA", "CAC", "G"]
+        for motif, positions in found.items():
+            assert positions == naive_positions(data, motif)
+        with pytest.raises(ValueError):
+            MotifAutomaton(["A", ""])
+
+    def test_choose_strategy(self):
+        """Test the dispatch rules"""
+        assert choose_strategy(10, 3) == "find"
+        assert choose_strategy(10 ** 6, 3) == "find"
+        assert choose_strategy(10 ** 6, 8, indexed=True) == "index"
+        assert choose_strategy(5, 8, indexed=True) == "find"
+        assert choose_strategy(10 ** 6, 8, motif_count=500) == "automaton"
+        assert choose_strategy(100, 8, motif_count=500) == "find"
+
+
+class TestDispatch:
+    """Tests for MotifSearcher and the sequence methods using it"""
+
+    def test_index_built_after_queries(self, small_thresholds):
+        """Test that repeated queries build the index once and keep results exact"""
+        rng = random.Random(9)
+        data = "".join(rng.choices("ACGT", k=3000))
+        searcher = MotifSearcher(4)
+        assert searcher.k == 8
+        motifs = [data[i:i + 10] for i in range(0, 100, 10)]
+        for motif in motifs[:2]:
+            assert searcher.positions(data, motif) == naive_positions(data, motif)
+        assert searcher.positions(data, "ACG") == naive_positions(data, "ACG")
+        assert searcher.index is None
+        for motif in motifs:
+            assert searcher.positions(data, motif) == naive_positions(data, motif)
+        assert searcher.index is not None
+        assert searcher.positions(data, "ACG") == naive_positions(data, "ACG")
+
+    def test_mutation_resets_searcher(self, small_thresholds):
+        """Test that a mutated sequence is not searched with a stale index"""
+        dna = DNASequence("s", "ACGTACGTAA" * 10)
+        for _ in range(5):
+            assert dna.find_motif("ACGTACGTAA") == list(range(0, 100, 10))
+        assert dna._motif_search.index is not None
+        dna.mutate(10, "T")
+        assert dna.find_motif("ACGTACGTAA") == [0] + list(range(20, 100, 10))
+        assert dna._motif_search.index is None
+
+    def test_find_motifs(self, small_thresholds):
+        """Test find_motifs on mutable and frozen sequences, through every path"""
+        rng = random.Random(2)
+        data = "".join(rng.choices("ACGT", k=500))
+        motifs = ["acg", "T", "", data[:30], data[7:16].lower(), "ACGTACGTACGTA", "G" * 600]
+        expected = {motif: naive_positions(data, motif.upper()) for motif in motifs}
+        for sequence in (DNASequence("s", data), FrozenDNASequence("s", data)):
+            assert sequence.find_motifs(motifs) == expected
+            assert sequence.find_motifs(motifs[:2]) == {motif: expected[motif] for motif in motifs[:2]}
+        protein = ProteinSequence("p", "MKLMKLLMKV")
+        assert protein.find_motifs(["MK", "kl"]) == {"MK": [0, 3, 7], "kl": [1, 4]}
+
+    def test_strategy_instrumented(self, small_thresholds):
+        """Test that the chosen strategy is recorded"""
+        dna = DNASequence("s", "ACGTACGTAA" * 10)
+        instrument.reset()
+        with instrument.recording():
+            for _ in range(4):
+                dna.find_motif("ACGTACGTAA")
+            dna.find_motifs(["A", "C", "G", "T"])
+        stats = instrument.snapshot()
+        instrument.reset()
+        assert stats["DNASequence.find_motif[find]"]["calls"] == 2
+        assert stats["DNASequence.find_motif[index]"]["calls"] == 2
+        assert stats["DNASequence.find_motifs[automaton]"]["calls"] == 1
+        assert stats["DNASequence.find_motif"]["calls"] == 4
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from ex31 import DNASequence
+from ex32 import RNASequence
+from orf import find_orfs
+
+"""
+Outsource:
+- tests
+"""
+
+
+def naive_orfs(data: str, min_length: int):
+    """Scan every frame of both strands codon by codon (reference for the tests)."""
+    length = len(data)
+    revcomp = data.translate(str.maketrans("ACGT", "TGCA"))[::-1]
+    orfs = set()
+    for strand, sequence in ((1, data), (-1, revcomp)):
+        for offset in range(3):
+            start = None
+            for i in range(offset, length - 2, 3):
+                codon = sequence[i:i + 3]
+                if codon == "ATG" and start is None:
+                    start = i
+                elif codon in ("TAA", "TAG", "TGA") and start is not None:
+                    if i + 3 - start >= min_length:
+                        if strand == 1:
+                            orfs.add((start, i + 3, offset + 1))
+                        else:
+                            orfs.add((length - i - 3, length - start, -(offset + 1)))
+                    start = None
+    return orfs
+
+
+class TestFindOrfs:
+    """Tests for the six-frame ORF scanner in orf.py"""
+
+    def test_forward_orf(self):
+        """Test a single forward ORF and the minimum length filter"""
+        data = "CCATGAAATTTTAGCC"
+        assert list(find_orfs(data, min_length=0)) == [(2, 14, 3)]
+        assert list(find_orfs(data, min_length=13)) == []
+
+    def test_reverse_orf(self):
+        """Test that an ORF on the reverse strand is reported in forward coordinates"""
+        forward = "ATGAAATTTTAG"
+        data = "GG" + forward.translate(str.maketrans("ACGT", "TGCA"))[::-1] + "C"
+        assert list(find_orfs(data, min_length=0)) == [(2, 14, -2)]
+
+    def test_longest_per_stop(self):
+        """Test that nested in-frame starts do not produce extra ORFs"""
+        assert list(find_orfs("ATGATGATGTAA", min_length=0)) == [(0, 12, 1)]
+
+    def test_no_stop(self):
+        """Test that ORFs without a stop codon are skipped"""
+        assert list(find_orfs("ATGAAAAAA", min_length=0)) == []
+
+    def test_matches_naive_scan(self):
+        """Test random sequences against a frame-by-frame reference scan"""
+        rng = random.Random(7)
+        for _ in range(200):
+            data = "".join(rng.choice("ACGT") for _ in range(rng.randrange(0, 300)))
+            min_length = rng.choice([0, 9, 30])
+            result = list(find_orfs(data, min_length))
+            assert len(result) == len(set(result))
+            assert set(result) == naive_orfs(data, min_length)
+
+    def test_lazy(self):
+        """Test that ORFs are yielded before the scan reaches the end"""
+        orfs = find_orfs("ATGTAA" + "C" * 1000, min_length=0)
+        assert next(orfs) == (0, 6, 1)
+
+
+class TestSequenceMethods:
+    """Tests for find_orfs on the sequence classes"""
+
+    def test_dna_and_rna_agree(self):
+        """Test that DNA and its transcript give the same ORFs"""
+        dna = DNASequence("s", "ccATGAAATTTTAGccCTAAAACATgg")
+        assert sorted(dna.find_orfs(min_length=6)) == sorted(dna.transcribe().find_orfs(min_length=6))
+        assert sorted(dna.find_orfs(min_length=6)) == [(2, 14, 3), (16, 25, -3)]
+
+    def test_default_min_length(self):
+        """Test that short ORFs are filtered by default"""
+        assert list(RNASequence("r", "AUGUAA").find_orfs()) == []
+        assert list(RNASequence("r", "AUG" + "GCC" * 24 + "UAA").find_orfs()) == [(0, 78, 1)]
+
+    def test_negative_min_length(self):
+        """Test that a negative minimum length raises ValueError immediately"""
+        with pytest.raises(ValueError):
+            DNASequence("s", "ATG").find_orfs(-1)
@@ -0,0 +1,164 @@
+import random
+
+import pytest
+
+from ex31 import DNASequence
+from ex32 import RNASequence
+from frozen import FrozenDNASequence
+from overlay import VariantOverlay
+from storage import PackedStorage
+
+"""
+Outsource:
+- tests
+"""
+
+
+def apply_variants(data: str, variants):
+    """Build the variant sequence by copying (reference for the tests)."""
+    for position, ref_length, alt in sorted(variants, key=lambda v: (v[0], v[1] > 0), reverse=True):
+        data = data[:position] + alt + data[position + ref_length:]
+    return data
+
+
+def random_variants(rng, length: int, count: int):
+    """Return non-overlapping random variants over a reference of the given length."""
+    variants = []
+    position = 0
+    for _ in range(count):
+        position += rng.randrange(0, 6)
+        if position > length:
+            break
+        ref_length = min(rng.randrange(0, 3), length - position)
+        alt = "".join(rng.choice("ACGT") for _ in range(rng.randrange(0 if ref_length else 1, 3)))
+        variants.append((position, ref_length, alt))
+        position += max(ref_length, 1)
+    return variants
+
+
+@pytest.fixture
+def reference():
+    """A short DNA reference."""
+    return DNASequence("ref", "ATGCATGCATGC")
+
+
+class TestVariantOverlay:
+    """Tests for the reference-plus-diff sequence in overlay.py"""
+
+    def test_substitution_insertion_deletion(self, reference):
+        """Test length, data and slicing with every kind of variant"""
+        overlay = VariantOverlay(reference, identifier="p1")
+        overlay.substitute(0, "c")
+        overlay.insert(4, "TT")
+        overlay.delete(8, 2)
+        assert overlay.data == "CTGCTTATGCGC"
+        assert len(overlay) == 12
+        assert overlay[4:7] == "TTA"
+        assert overlay[-1] == "C"
+        assert overlay[::4] == "CTG"
+        assert overlay.variants == [(0, 1, "C"), (4, 0, "TT"), (8, 2, "")]
+        assert str(overlay) == ">p1\nCTGCTTATGCGC"
+        assert reference.data == "ATGCATGCATGC"
+
+    def test_insertion_before_substitution(self, reference):
+        """Test that an insertion and a substitution at one position apply in order"""
+        overlay = VariantOverlay(reference, [(2, 1, "A"), (2, 0, "CC")])
+        assert overlay.data == "ATCCACATGCATGC"
+
+    def test_invalid_variants(self, reference):
+        """Test that invalid, empty, out-of-range and overlapping variants are rejected"""
+        overlay = VariantOverlay(reference, [(4, 2, "A"), (8, 0, "G")])
+        with pytest.raises(ValueError):
+            overlay.substitute(0, "X")
+        with pytest.raises(ValueError):
+            overlay.add_variant(0, 0, "")
+        with pytest.raises(IndexError):
+            overlay.delete(11, 2)
+        with pytest.raises(ValueError):
+            overlay.insert(5, "A")
+        with pytest.raises(ValueError):
+            overlay.substitute(3, "AA")
+        with pytest.raises(ValueError):
+            overlay.insert(8, "T")
+        with pytest.raises(IndexError):
+            overlay[12]
+
+    def test_find_motif(self, reference):
+        """Test motif hits kept, destroyed and created by variants"""
+        overlay = VariantOverlay(reference, [(5, 1, "A"), (9, 0, "CAT")])
+        assert overlay.data == "ATGCAAGCACATTGC"
+        assert overlay.find_motif("cat") == [9]
+        assert overlay.find_motif("ATG") == [0]
+        assert VariantOverlay(reference).find_motif("ATG") == reference.find_motif("ATG")
+
+    def test_matches_copying(self):
+        """Test random overlays against copying and mutating the reference"""
+        rng = random.Random(3)
+        for _ in range(300):
+            reference = DNASequence("r", "".join(rng.choice("ACGT") for _ in range(rng.randrange(0, 60))))
+            variants = random_variants(rng, len(reference), rng.randrange(0, 8))
+            overlay = VariantOverlay(reference, variants)
+            expected = apply_variants(reference.data, variants)
+            assert overlay.data == expected
+            assert len(overlay) == len(expected)
+            start, stop = sorted(rng.randrange(-5, len(expected) + 5) for _ in range(2))
+            assert overlay[start:stop] == expected[start:stop]
+            motif = "".join(rng.choice("ACGT") for _ in range(rng.randrange(1, 4)))
+            assert overlay.find_motif(motif) == DNASequence("e", expected).find_motif(motif)
+
+    def test_complement_and_transcribe(self, reference):
+        """Test that derived overlays share one derived reference"""
+        first = VariantOverlay(reference, [(0, 1, "C")], identifier="p1")
+        second = VariantOverlay(reference, [(3, 0, "AAG")], identifier="p2")
+        assert first.complement().data == "GACGTACGTACG"
+        assert first.complement().identifier == "p1_comp"
+        assert first.complement().reference is second.complement().reference
+        transcript = second.transcribe()
+        assert transcript.data == "AUGAAGCAUGCAUGC"
+        assert transcript.complement().data == "UACUUCGUACGUACG"
+        assert transcript.to_sequence().data == second.to_sequence().transcribe().data
+
+    def test_frozen_reference(self):
+        """Test overlays of a frozen reference, whose derived values are shared too"""
+        reference = FrozenDNASequence("ref", "ATGCATGCATGC")
+        first = VariantOverlay(reference, [(5, 1, "A"), (9, 0, "CAT")])
+        second = VariantOverlay(reference, [(0, 1, "C")])
+        assert first.find_motif("cat") == [9]
+        assert second.find_motif("ATG") == [4, 8]
+        assert first.complement().data == "TACGTTCGTGTAACG"
+        assert first.complement().reference is second.complement().reference
+        assert second.transcribe().data == "CUGCAUGCAUGC"
+
+    def test_packed_reference(self):
+        """Test that hits are shared even though a packed reference decodes a new str on every read"""
+        reference = DNASequence("ref", "ATGCATGCATGC", backend="packed")
+        first = VariantOverlay(reference, [(0, 1, "C")])
+        second = VariantOverlay(reference, [(11, 1, "A")])
+        assert first.complement().reference is second.complement().reference
+        assert first.find_motif("ATG") == [4, 8]
+        assert second.find_motif("ATG") == [0, 4, 8]
+
+    def test_slices_decode_regions(self, monkeypatch):
+        """Test that indexing and slicing decode only the needed reference region"""
+        reference = DNASequence("ref", "ATGCATGCATGC" * 100, backend="packed")
+        overlay = VariantOverlay(reference, [(5, 1, "A"), (600, 0, "CAT")])
+        expected = apply_variants(reference.data, overlay.variants)
+        regions = []
+        text = PackedStorage.text
+
+        def spy(storage, start=0, stop=None):
+            regions.append((start, stop))
+            return text(storage, start, stop)
+
+        monkeypatch.setattr(PackedStorage, "text", spy)
+        assert overlay[598:610] == expected[598:610]
+        assert overlay[1000] == expected[1000]
+        assert regions and all(stop is not None and stop - start <= 12 for start, stop in regions)
+
+    def test_rna_reference(self):
+        """Test overlays of RNA references"""
+        overlay = VariantOverlay(RNASequence("r", "AUGUUU"), [(3, 3, "GCC")])
+        assert isinstance(overlay.to_sequence(), RNASequence)
+        assert overlay.to_sequence().translate().data == "MA"
+        with pytest.raises(ValueError):
+            overlay.insert(0, "T")
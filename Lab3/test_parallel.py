@@ -0,0 +1,50 @@
+import pytest
+from ex32 import RNASequence
+from parallel import _partition, translate_many
+
+"""
+Outsource:
+- tests
+"""
+
+
+class TestTranslateMany:
+    """Tests for translate_many from parallel.py"""
+
+    def test_matches_serial_translate_in_order(self):
+        """Test parallel results against RNASequence.translate, in input order"""
+        sequences = [RNASequence(f"r{i}", "AUGUUUUGG" * (i % 7 + 1) + "UAA") for i in range(40)]
+        proteins = translate_many(sequences, workers=3)
+        expected = [sequence.translate() for sequence in sequences]
+        assert [p.identifier for p in proteins] == [p.identifier for p in expected]
+        assert [p.data for p in proteins] == [p.data for p in expected]
+
+    def test_report(self):
+        """Test per-worker throughput report"""
+        sequences = [RNASequence(f"r{i}", "AUGGCC" * 10) for i in range(6)]
+        proteins, report = translate_many(sequences, workers=2, return_report=True)
+        assert len(proteins) == 6
+        assert sum(entry["records"] for entry in report) == 6
+        assert sum(entry["bases"] for entry in report) == 360
+        assert all(entry["bases_per_second"] >= 0 for entry in report)
+
+    def test_single_worker_and_empty(self):
+        """Test the in-process path and empty input"""
+        sequences = [RNASequence("r", "AUGUUU")]
+        assert translate_many(sequences, workers=1)[0].data == "MF"
+        assert translate_many([], workers=4) == []
+        with pytest.raises(ValueError):
+            translate_many(sequences, workers=0)
+
+    def test_unknown_codon(self):
+        """Test that unknown codons are rejected like RNASequence.translate"""
+        sequences = [RNASequence("a", "AUGUUU"), RNASequence("b", "AUGAAA")]
+        with pytest.raises(ValueError, match="Invalid protein sequence"):
+            translate_many(sequences, workers=2)
+
+    def test_partition_is_contiguous(self):
+        """Test that chunks cover all spans in order"""
+        spans = [(0, 10), (10, 11), (11, 30), (30, 31), (31, 40)]
+        chunks = _partition(spans, 3)
+        assert len(chunks) <= 3
+        assert [span for chunk in chunks for span in chunk] == spans
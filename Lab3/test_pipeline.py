@@ -0,0 +1,78 @@
+import io
+import pytest
+from ex31 import DNASequence, translate_dna
+from ex32 import RNASequence, translate_rna
+from ex33 import ProteinSequence
+from pipeline import SequenceStream
+
+"""
+Outsource:
+- tests
+"""
+
+
+class TestSequenceStream:
+    """Tests for SequenceStream from pipeline.py"""
+
+    def test_translate_dna_matches_rna(self):
+        """Test fused DNA translation against transcribe-then-translate"""
+        for data in ("ATGTTTTGGTAA", "ATGGCCGAATAC", "ATG", "TTTTT", ""):
+            assert translate_dna(data) == translate_rna(data.replace("T", "U"))
+
+    def test_transcribe_translate_matches_classes(self):
+        """Test the fused pipeline against the mutable classes"""
+        records = [DNASequence("g1", "ATGTTTTGGTAA"), DNASequence("g2", "ATGGCCGAA")]
+        proteins = SequenceStream(records).transcribe().translate().collect()
+        expected = [record.transcribe().translate() for record in records]
+        assert [p.identifier for p in proteins] == [p.identifier for p in expected]
+        assert [p.data for p in proteins] == [p.data for p in expected]
+        assert all(isinstance(p, ProteinSequence) for p in proteins)
+
+    def test_from_fasta_with_filter(self):
+        """Test streaming FASTA records through several stages"""
+        handle = io.StringIO(">a\nATGTTTTGG\n>b\nATGTAA\n>c\nTACAAAACC\n")
+        stream = SequenceStream.from_fasta(handle).filter(lambda dna: dna.data.startswith("ATG"))
+        proteins = stream.transcribe().translate().filter(lambda protein: len(protein) > 1)
+        assert [(p.identifier, p.data) for p in proteins] == [("a_RNA_PROT", "MFW")]
+
+    def test_complement_stages(self):
+        """Test complement and reverse complement stages"""
+        out = SequenceStream([("d", "AATG")]).complement().reverse_complement().collect()
+        assert (out[0].identifier, out[0].data) == ("d_comp_revcomp", "GTAA")
+        rna = SequenceStream([RNASequence("r", "AUG")], "rna").complement().collect()
+        assert rna[0].data == "UAC"
+
+    def test_unfused_transcribe(self):
+        """Test transcription without a following translation"""
+        out = SequenceStream([("d", "ATGC")]).transcribe().complement().collect()
+        assert isinstance(out[0], RNASequence)
+        assert (out[0].identifier, out[0].data) == ("d_RNA_comp", "UACG")
+
+    def test_lazy_evaluation(self):
+        """Test that records are pulled only as results are consumed"""
+        pulled = []
+
+        def records():
+            for i in range(1000):
+                pulled.append(i)
+                yield f"s{i}", "ATGTTT"
+
+        iterator = iter(SequenceStream(records()).transcribe().translate())
+        next(iterator)
+        assert len(pulled) == 1
+
+    def test_invalid_stage_order(self):
+        """Test that stages are checked against the record kind"""
+        with pytest.raises(ValueError, match="needs a RNA stream"):
+            SequenceStream([]).translate()
+        with pytest.raises(ValueError):
+            SequenceStream([], "protein").complement()
+        with pytest.raises(ValueError):
+            SequenceStream([], "xna")
+
+    def test_invalid_input_records(self):
+        """Test validation of raw input tuples and unknown codons"""
+        with pytest.raises(ValueError, match="DNA sequence can only contain"):
+            SequenceStream([("bad", "AUG")]).collect()
+        with pytest.raises(ValueError, match="Invalid protein sequence"):
+            SequenceStream([("d", "ATGAAA")]).transcribe().translate().collect()
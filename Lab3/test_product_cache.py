@@ -0,0 +1,91 @@
+import pytest
+from ex31 import DNASequence
+from ex32 import RNASequence
+from product_cache import ProductCache, default_cache
+
+"""
+Outsource:
+- tests
+"""
+
+
+class TestProductCache:
+    """Tests for ProductCache from product_cache.py"""
+
+    def test_hit_and_miss_counters(self):
+        """Test that repeated lookups are served from the cache"""
+        cache = ProductCache(max_bytes=1000, min_length=0)
+        calls = []
+
+        def compute(data):
+            calls.append(data)
+            return data.lower()
+
+        assert cache.get_or_compute("lower", "ATGC", compute) == "atgc"
+        assert cache.get_or_compute("lower", "ATGC", compute) == "atgc"
+        assert calls == ["ATGC"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["bytes"] == 8
+
+    def test_operations_are_separate_keys(self):
+        """Test that different operations on the same data do not collide"""
+        cache = ProductCache(max_bytes=1000, min_length=0)
+        assert cache.get_or_compute("a", "AT", str.lower) == "at"
+        assert cache.get_or_compute("b", "AT", lambda data: data[::-1]) == "TA"
+        assert len(cache) == 2
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = ProductCache(max_bytes=12, min_length=0)
+        cache.get_or_compute("op", "AAA", str.lower)
+        cache.get_or_compute("op", "CCC", str.lower)
+        cache.get_or_compute("op", "AAA", str.lower)
+        cache.get_or_compute("op", "GGG", str.lower)
+        assert cache.evictions == 1
+        assert cache.current_bytes == 12
+        cache.get_or_compute("op", "AAA", str.lower)
+        assert cache.hits == 2
+
+    def test_short_and_oversized_entries_skipped(self):
+        """Test entries below min_length or above the budget are not stored"""
+        cache = ProductCache(max_bytes=10, min_length=3)
+        cache.get_or_compute("op", "AT", str.lower)
+        cache.get_or_compute("op", "ATGCATGC", str.lower)
+        assert len(cache) == 0
+
+    def test_resize_and_clear(self):
+        """Test shrinking the budget and clearing the cache"""
+        cache = ProductCache(max_bytes=100, min_length=0)
+        cache.get_or_compute("op", "AAAA", str.lower)
+        cache.resize(4)
+        assert len(cache) == 0
+        with pytest.raises(ValueError):
+            cache.resize(-1)
+        cache.clear()
+        assert cache.stats()["misses"] == 0
+
+
+class TestSequenceProductCache:
+    """Tests for the shared cache behind complement, transcribe and translate"""
+
+    def test_shared_across_objects(self):
+        """Test that equal sequences in different objects share cached products"""
+        default_cache.clear()
+        data = "ATGTTTTGG" * 10
+        first = DNASequence("a", data).transcribe()
+        second = DNASequence("b", data).transcribe()
+        assert first.data == second.data
+        assert first.identifier == "a_RNA"
+        assert second.identifier == "b_RNA"
+        assert default_cache.hits == 1
+        assert second.translate().data == first.translate().data
+        assert default_cache.hits == 2
+
+    def test_cached_results_match(self):
+        """Test cached complements against direct computation"""
+        default_cache.clear()
+        rna = RNASequence("r", "AUGC" * 20)
+        assert rna.complement().data == "UACG" * 20
+        assert rna.complement().data == "UACG" * 20
+        assert DNASequence("d", "ATGC" * 20).complement().data == "TACG" * 20
@@ -0,0 +1,90 @@
+import gzip
+import io
+
+import pytest
+
+from seqtool import main
+
+"""
+Outsource:
+- tests
+"""
+
+FASTA = ">a\nATGTTTGCC\n>b desc\nttggaatgg\n>c\nATG\n"
+
+
+@pytest.fixture
+def fasta_file(tmp_path):
+    """A small DNA FASTA file."""
+    path = tmp_path / "in.fa"
+    path.write_text(FASTA)
+    return str(path)
+
+
+def run(argv, capsys):
+    """Run seqtool and return (exit status, stdout, stderr)."""
+    status = main(argv)
+    captured = capsys.readouterr()
+    return status, captured.out, captured.err
+
+
+class TestSeqtool:
+    """Tests for the seqtool command-line tool"""
+
+    def test_complement(self, fasta_file, capsys):
+        """Test complement and reverse complement output"""
+        assert run(["complement", fasta_file], capsys)[1] == ">a_comp\nTACAAACGG\n>b desc_comp\nAACCTTACC\n>c_comp\nTAC\n"
+        assert run(["complement", "--reverse", fasta_file], capsys)[1].startswith(">a_revcomp\nGGCAAACAT\n")
+
+    def test_transcribe_and_translate(self, fasta_file, capsys):
+        """Test transcription, and translation straight from DNA"""
+        assert run(["transcribe", fasta_file], capsys)[1].startswith(">a_RNA\nAUGUUUGCC\n")
+        assert run(["translate", fasta_file], capsys)[1] == ">a_RNA_PROT\nMFA\n>b desc_RNA_PROT\nLEW\n>c_RNA_PROT\nM\n"
+
+    def test_motif(self, fasta_file, capsys):
+        """Test motif positions on one and both strands"""
+        assert run(["motif", "TG", fasta_file], capsys)[1] == "a\t1\na\t5\nb desc\t1\nb desc\t6\nc\t1\n"
+        assert run(["motif", "CA", "--both-strands", fasta_file], capsys)[1].startswith("a\t1\t-\na\t5\t-\n")
+
+    def test_stats(self, fasta_file, capsys):
+        """Test the statistics table"""
+        lines = run(["stats", fasta_file], capsys)[1].splitlines()
+        assert lines[0] == "#id\tlength\tA\tC\tG\tT\tgc"
+        assert lines[1] == "a\t9\t1\t2\t2\t4\t0.4444"
+
+    def test_width(self, fasta_file, capsys):
+        """Test line-wrapped FASTA output"""
+        assert run(["complement", "--width", "4", fasta_file], capsys)[1].startswith(">a_comp\nTACA\nAACG\nG\n>b desc_comp\n")
+
+    def test_stdin_and_output_file(self, tmp_path, monkeypatch, capsys):
+        """Test reading stdin and writing a gzip output file"""
+        monkeypatch.setattr("sys.stdin", io.StringIO(FASTA))
+        output = tmp_path / "out.fa.gz"
+        assert run(["transcribe", "-o", str(output)], capsys)[0] == 0
+        with gzip.open(output, "rt") as handle:
+            assert handle.read().startswith(">a_RNA\nAUGUUUGCC\n")
+
+    def test_workers_match_serial(self, tmp_path, capsys):
+        """Test that parallel output is identical and in input order"""
+        path = tmp_path / "many.fa"
+        path.write_text("".join(f">r{i}\n{'ATGC' * (i % 7 + 1)}\n" for i in range(50)))
+        serial = run(["complement", str(path)], capsys)[1]
+        parallel = run(["complement", "--workers", "2", "--chunk-size", "7", str(path)], capsys)[1]
+        assert parallel == serial
+
+    def test_invalid_record(self, tmp_path, capsys):
+        """Test that an invalid record gives exit status 1 and a message"""
+        path = tmp_path / "bad.fa"
+        path.write_text(">x\nATGXX\n")
+        status, _, error = run(["transcribe", str(path)], capsys)
+        assert status == 1
+        assert "DNA sequence can only contain" in error
+
+    def test_invalid_options(self, fasta_file):
+        """Test that option combinations that make no sense are rejected"""
+        with pytest.raises(SystemExit):
+            main(["transcribe", "--kind", "rna", fasta_file])
+        with pytest.raises(SystemExit):
+            main(["complement", "--workers", "0", fasta_file])
+        with pytest.raises(SystemExit):
+            main(["complement", "--width", "0", fasta_file])
@@ -0,0 +1,62 @@
+import subprocess
+import sys
+
+import pytest
+
+import sequences
+
+"""
+Outsource:
+- tests
+"""
+
+HEAVY_MODULES = ["ex32", "ex33", "alignment", "approx_search", "kmers", "composition", "fasta", "gzip",
+                 "product_cache", "protein_properties", "motif_search", "cProfile", "tracemalloc", "json",
+                 "functools"]
+
+
+def _loaded_after(statement: str):
+    """Return the HEAVY_MODULES loaded after running `statement` in a fresh interpreter."""
+    code = f"import sys\n{statement}\nprint(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return output.stdout.split()
+
+
+class TestLazyPackage:
+    """Tests for the lazily importing sequences package"""
+
+    def test_exports(self):
+        """Test that exported names resolve to the flat modules' objects"""
+        from ex31 import DNASequence
+        from ex32 import RNASequence
+        assert sequences.DNASequence is DNASequence
+        assert sequences.RNASequence is RNASequence
+        assert sequences.alignment.BLOSUM62["W"]["W"] == 11
+        assert "ProteinSequence" in dir(sequences)
+
+    def test_unknown_name(self):
+        """Test that unknown names raise AttributeError"""
+        with pytest.raises(AttributeError):
+            sequences.SuffixTree
+
+    def test_dna_import_is_lean(self):
+        """Test that importing DNASequence loads no engine, RNA/protein module or profiler"""
+        assert _loaded_after("from sequences import DNASequence") == []
+        assert _loaded_after("import ex31") == []
+
+    def test_engines_loaded_on_use(self):
+        """Test that engines are imported when first used and results are unchanged"""
+        statement = ("from sequences import DNASequence\n"
+                     "dna = DNASequence('s', 'ATGTTTGCC')\n"
+                     "assert dna.transcribe().translate().data == 'MFA'\n"
+                     "assert dna.gc_content() == 4 / 9")
+        loaded = _loaded_after(statement)
+        assert "ex32" in loaded and "ex33" in loaded and "composition" in loaded
+        assert "alignment" not in loaded
+
+    def test_lazy_codon_table(self):
+        """Test that ex31.DNA_CODON_TABLE is still available"""
+        import ex31
+        assert ex31.DNA_CODON_TABLE["ATG"] == "M"
+        with pytest.raises(AttributeError):
+            ex31.RNA_CODON_TABLE
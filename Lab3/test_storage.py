@@ -0,0 +1,158 @@
+import importlib.util
+
+import pytest
+
+from ex31 import DNASequence
+from ex32 import RNASequence
+from ex33 import ProteinSequence
+from storage import BACKENDS, StrStorage, get_default_backend, resolve_backend, set_default_backend
+
+"""
+Outsource:
+- tests
+"""
+
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request):
+    """Every storage backend; numpy is skipped when NumPy is not installed."""
+    if request.param == "numpy" and importlib.util.find_spec("numpy") is None:
+        pytest.skip("NumPy not installed")
+    return request.param
+
+
+@pytest.fixture
+def restore_default():
+    """Restore the global default backend after a test."""
+    previous = get_default_backend()
+    yield
+    set_default_backend(previous)
+
+
+class TestStorageBackends:
+    """Tests for the storage backends behind the sequence classes"""
+
+    def test_dna_operations(self, backend):
+        """Test that DNA behaves the same with every backend"""
+        dna = DNASequence("s", "atgcatgcAT", backend=backend)
+        assert dna.backend == backend
+        assert dna.data == "ATGCATGCAT"
+        assert len(dna) == 10
+        assert str(dna) == ">s\nATGCATGCAT"
+        assert dna.find_motif("ATG") == [0, 4]
+        assert dna.complement().data == "TACGTACGTA"
+        assert dna.transcribe().data == "AUGCAUGCAU"
+
+    def test_mutate_in_place(self, backend):
+        """Test mutation at every position, including the last partial packed byte"""
+        dna = DNASequence("s", "AAAAAAAAA", backend=backend)
+        for position in range(len(dna)):
+            dna.mutate(position, "gct"[position % 3])
+        assert dna.data == "GCTGCTGCT"
+        assert dna.backend == backend
+        assert dna.gc_content() == pytest.approx(6 / 9)
+
+    def test_rna_translate(self, backend):
+        """Test RNA storage and translation"""
+        rna = RNASequence("r", "AUGUUUUGG", backend=backend)
+        rna.mutate(3, "G")
+        assert rna.data == "AUGGUUUGG"
+        with pytest.raises(ValueError):
+            rna.translate()
+        rna.mutate(3, "U")
+        assert rna.translate().data == "MFW"
+
+    def test_protein(self, backend):
+        """Test proteins with every backend except packed"""
+        if backend == "packed":
+            with pytest.raises(ValueError):
+                ProteinSequence("p", "MKV", backend=backend)
+            return
+        protein = ProteinSequence("p", "MKVL", backend=backend)
+        protein.mutate(0, "a")
+        assert protein.data == "AKVL"
+        assert protein.molecular_weight() > 0
+
+    def test_empty(self, backend):
+        """Test empty sequences"""
+        dna = DNASequence("e", "", backend=backend)
+        assert len(dna) == 0
+        assert dna.data == ""
+        assert dna.find_motif("A") == []
+
+    def test_region_decode(self, backend):
+        """Test decoding a region of the storage and indexing or slicing a sequence"""
+        text = "ACGTTGCAAGCTAG"
+        dna = DNASequence("s", text, backend=backend)
+        for start in range(len(text) + 1):
+            for stop in range(start, len(text) + 3):
+                assert dna._storage.text(start, stop) == text[start:stop]
+        assert dna._storage.text() == text
+        assert dna[3] == dna[-11] == "T"
+        assert dna[5:9] == text[5:9]
+        assert dna[-4:] == text[-4:]
+        assert dna[9:2] == ""
+        assert dna[::3] == text[::3]
+        with pytest.raises(IndexError):
+            dna[len(text)]
+
+    def test_data_setter_keeps_backend(self, backend):
+        """Test that assigning data keeps the storage backend"""
+        dna = DNASequence("s", "ATGC", backend=backend)
+        dna.data = "GGGG"
+        assert dna.data == "GGGG"
+        assert dna.backend == backend
+
+    def test_caches_follow_mutations(self, backend):
+        """Test that compact backends keep no str and that caches are rebuilt after a change"""
+        dna = DNASequence("s", "ACGTACGTAA" * 3, backend=backend)
+        if backend != "str":
+            assert "_text" not in type(dna._storage).__slots__
+            assert dna.data is not dna.data
+        assert dna.find_motif("ACGTAA") == [4, 14, 24]
+        dna.mutate(14, "T")
+        assert dna.find_motif("ACGTAA") == [4, 24]
+        dna.data = "ACGTAA"
+        assert dna.find_motif("ACGTAA") == [0]
+        if backend != "packed":
+            protein = ProteinSequence("p", "IIRR", backend=backend)
+            assert protein.hydrophobicity_profile(2) == pytest.approx([4.5, 0.0, -4.5])
+            protein.mutate(0, "R")
+            assert protein.hydrophobicity_profile(2) == pytest.approx([0.0, 0.0, -4.5])
+
+
+class TestBackendSelection:
+    """Tests for choosing backends per instance and globally"""
+
+    def test_global_default(self, restore_default):
+        """Test that the global default applies to new and derived sequences"""
+        set_default_backend("bytearray")
+        dna = DNASequence("s", "ATGC")
+        assert dna.backend == "bytearray"
+        assert dna.complement().backend == "bytearray"
+        assert DNASequence("t", "ATGC", backend="str").backend == "str"
+
+    def test_unknown_backend(self, restore_default):
+        """Test that unknown backend names raise ValueError"""
+        with pytest.raises(ValueError):
+            set_default_backend("rope")
+        with pytest.raises(ValueError):
+            DNASequence("s", "ATGC", backend="rope")
+
+    def test_backend_class(self):
+        """Test that a storage class can be passed directly"""
+        assert resolve_backend(StrStorage) is StrStorage
+        assert DNASequence("s", "AT", backend=StrStorage).backend == "str"
+
+    def test_error_messages_kept(self):
+        """Test that class-specific validation messages are unchanged"""
+        with pytest.raises(ValueError, match="DNA sequence can only contain A, T, G, C characters."):
+            DNASequence("s", "ATGX")
+        with pytest.raises(ValueError, match="Invalid RNA sequence"):
+            RNASequence("s", "AUGT")
+        with pytest.raises(ValueError, match="Invalid protein sequence"):
+            ProteinSequence("s", "MK1")
+        with pytest.raises(ValueError, match="Invalid base for mutation"):
+            DNASequence("s", "ATGC", backend="packed").mutate(0, "U")
+        with pytest.raises(IndexError, match="my gene"):
+            DNASequence("s", "ATGC", backend="packed").mutate(4, "A")